@@ -2,7 +2,9 @@ import pandas as pd
 import re
 import sys, os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from utils.data_io import read_data
 from utils.errors_utils import should_correct, load_error_config
+from correction.diacritic_restoration import restore_diacritics
 
 error_config = load_error_config()
 
@@ -32,7 +34,8 @@ def split_into_set(detected_errors_column):
     else:
         return set()
 
-def correct_address(street, street_number, zipcode, city, detected_street_errors, detected_street_number_errors, detected_zipcode_errors, detected_city_errors):
+def correct_address(street, street_number, zipcode, city, detected_street_errors, detected_street_number_errors, detected_zipcode_errors, detected_city_errors,
+                    diacritic_indexes=None):
     """
     Corrects address components based on detected errors.
 
@@ -49,6 +52,8 @@ def correct_address(street, street_number, zipcode, city, detected_street_errors
         detected_street_number_errors (set): A set of detected error codes for the house number.
         detected_zipcode_errors (set): A set of detected error codes for the postal code.
         detected_city_errors (set): A set of detected error codes for the city.
+        diacritic_indexes (dict, optional): Diacritic restoration indexes with "street" and "city" keys
+            (see build_diacritic_indexes), used to correct diacritic loss (4114, 4408).
 
     Returns:
         dict: A dictionary containing the following keys:
@@ -321,6 +326,24 @@ def correct_address(street, street_number, zipcode, city, detected_street_errors
                     corrected_city_errors.add('4407')
                     uncorrected_city_errors.remove('4407')
 
+    # Diacritic loss - restore š, č, ž from the GURS street and city names
+    if diacritic_indexes:
+        if should_correct('4114', error_config):
+            if '4114' in detected_street_errors and "street" in diacritic_indexes and corrected_street:
+                restored_street = restore_diacritics(corrected_street, diacritic_indexes["street"])
+                if restored_street is not None:
+                    corrected_street = restored_street
+                    corrected_street_errors.add('4114')
+                    uncorrected_street_errors.remove('4114')
+
+        if should_correct('4408', error_config):
+            if '4408' in detected_city_errors and "city" in diacritic_indexes and corrected_city:
+                restored_city = restore_diacritics(corrected_city, diacritic_indexes["city"])
+                if restored_city is not None:
+                    corrected_city = restored_city
+                    corrected_city_errors.add('4408')
+                    uncorrected_city_errors.remove('4408')
+
     return (
     corrected_street if corrected_street != original_street else None,
     sorted(corrected_street_errors),
@@ -343,7 +366,7 @@ if __name__ == "__main__":
 
     customer_data = "src/processed_data/02_detected_address_errors.xlsx"
 
-    df = pd.read_excel(customer_data)
+    df = read_data(customer_data)
     
     # split the string into a set
     df['street_detected_errors'] = df['street_detected_errors'].apply(split_into_set)
@@ -0,0 +1,177 @@
+import numpy as np
+import pandas as pd
+import re
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from utils.data_io import read_data, write_data
+from validation.address_validation import normalize_text, normalize_text_series, load_gurs_dataframe
+from utils.string_utils import fold_text, encode_strings, levenshtein_distances
+
+def house_number_value(house_number) -> int:
+    """
+    Extract the numeric part of a house number (e.g. "12A" -> 12), -1 if there is none.
+
+    Args:
+        house_number (str): House number.
+
+    Returns:
+        int: The leading number of the house number, or -1.
+    """
+    match = re.match(r"\d+", normalize_text(house_number))
+    return int(match.group()) if match else -1
+
+def build_address_suggestion_index(gurs_df: pd.DataFrame, prefix_length: int = 3) -> dict:
+    """
+    Build a blocked search index over the GURS register for address suggestions.
+
+    Addresses are grouped by postal code and, inside every postal code, by the folded
+    street name and by its first prefix_length characters. Every entry keeps the folded
+    "STREET HOUSE_NUMBER" label used for ranking, the numeric house number used to bound
+    the search on long streets and the canonical GURS full address that is returned as
+    the suggestion.
+
+    Args:
+        gurs_df (pd.DataFrame): DataFrame returned by load_gurs_dataframe.
+        prefix_length (int): Number of street name characters used for the second level of blocking.
+
+    Returns:
+        dict: A dictionary with the following keys:
+            - prefix_length (int): The prefix length used to build the index.
+            - blocks (dict): Postal code -> dict with "labels", "codes", "lengths", "numbers" and
+              "addresses" arrays, "streets" (street name -> range of positions in the block) and
+              "prefixes" (street prefix -> range of positions in the block).
+    """
+    streets = gurs_df["ULICA_NAZIV"].fillna("").astype(str).str.strip().map(fold_text)
+    house_numbers = gurs_df["HS_STEVILKA"].fillna("").astype(str).str.strip()
+    labels = streets + " " + house_numbers + gurs_df["HS_DODATEK"].fillna("").astype(str).str.strip().str.upper().map(fold_text)
+
+    suggestion_df = pd.DataFrame({
+        "POSTAL_CODE": gurs_df["POSTNI_OKOLIS_SIFRA"].fillna("").astype(str).str.strip().to_numpy(),
+        "STREET": streets.to_numpy(),
+        "LABEL": labels.to_numpy(),
+        "NUMBER": pd.to_numeric(house_numbers.str.extract(r"^(\d+)", expand=False), errors="coerce").fillna(-1).to_numpy(dtype=np.int64),
+        "ADDRESS": gurs_df["GURS_FULL_ADDRESS"].to_numpy(),
+    })
+    # Sorting by street keeps every street and every street prefix in a contiguous range
+    suggestion_df = suggestion_df.sort_values(["POSTAL_CODE", "STREET"], kind="stable").reset_index(drop=True)
+
+    blocks = {}
+    postal_codes, block_starts = np.unique(suggestion_df["POSTAL_CODE"].to_numpy(dtype=str), return_index=True)
+    block_ends = np.append(block_starts[1:], len(suggestion_df))
+    for postal_code, block_start, block_end in zip(postal_codes, block_starts, block_ends):
+        block_df = suggestion_df.iloc[block_start:block_end]
+        block_labels = block_df["LABEL"].to_numpy(dtype=object)
+        codes, lengths = encode_strings(block_labels)
+
+        block_streets, street_starts = np.unique(block_df["STREET"].to_numpy(dtype=str), return_index=True)
+        street_ends = np.append(street_starts[1:], len(block_df))
+        prefixes, prefix_starts = np.unique(np.array([street[:prefix_length] for street in block_streets]), return_index=True)
+        prefix_ends = np.append(street_starts[prefix_starts[1:]], len(block_df))
+
+        blocks[str(postal_code)] = {
+            "labels": block_labels,
+            "codes": codes.astype(np.uint8),    # labels are folded to ASCII
+            "lengths": lengths,
+            "numbers": block_df["NUMBER"].to_numpy(),
+            "addresses": block_df["ADDRESS"].to_numpy(dtype=object),
+            "streets": {str(street): (start, end) for street, start, end in zip(block_streets, street_starts, street_ends)},
+            "prefixes": {str(prefix): (street_starts[start], end) for prefix, start, end in zip(prefixes, prefix_starts, prefix_ends)},
+        }
+
+    return {"prefix_length": prefix_length, "blocks": blocks}
+
+def suggest_address(street, house_number, postal_code, index: dict, max_candidates: int = 300) -> tuple:
+    """
+    Suggest the closest GURS address for an address that failed validation.
+
+    Candidates are blocked by postal code and then by street name: the addresses on the
+    same street if the street is known, otherwise the streets sharing its prefix (falling
+    back to the whole postal code when no street shares the prefix). At most max_candidates
+    addresses are ranked by edit distance over "STREET HOUSE_NUMBER"; on a known street these
+    are the nearest house numbers, otherwise the labels closest in length to the query.
+
+    Args:
+        street (str): Street name.
+        house_number (str): House number.
+        postal_code (str): Postal code.
+        index (dict): Index built by build_address_suggestion_index.
+        max_candidates (int): Upper bound on the number of addresses compared per query.
+
+    Returns:
+        tuple:
+            - suggested_address (str or None): Canonical GURS full address, or None if the postal code is unknown.
+            - score (float): Similarity between 0 and 1, where 1 means an exact match of street and house number.
+    """
+    block = index["blocks"].get(normalize_text(postal_code))
+    if block is None:
+        return None, 0.0
+
+    query_street = fold_text(normalize_text(street))
+    query = query_street + " " + fold_text(normalize_text(house_number).upper())
+
+    # Second level of blocking: same street, otherwise street name prefix
+    if query_street in block["streets"]:
+        candidates = np.arange(*block["streets"][query_street])
+        gap = np.abs(block["numbers"][candidates] - house_number_value(house_number))
+    else:
+        candidates = np.arange(*block["prefixes"].get(query_street[:index["prefix_length"]], (0, len(block["labels"]))))
+        gap = np.abs(block["lengths"][candidates] - len(query))
+
+    # Bound the search: keep the nearest house numbers or the labels closest in length
+    if len(candidates) > max_candidates:
+        candidates = candidates[np.argpartition(gap, max_candidates - 1)[:max_candidates]]
+
+    lengths = block["lengths"][candidates]
+    codes = block["codes"][candidates, :max(int(lengths.max()), 1)]
+    distances = levenshtein_distances(query, codes, lengths)
+    best = int(np.argmin(distances))
+
+    longest = max(len(query), int(lengths[best]), 1)
+    score = round(1 - int(distances[best]) / longest, 4)
+
+    return block["addresses"][candidates[best]], score
+
+def suggest_addresses(streets: pd.Series, house_numbers: pd.Series, postal_codes: pd.Series, index: dict, max_candidates: int = 300) -> pd.DataFrame:
+    """
+    Suggest GURS addresses for a batch of addresses.
+
+    Every distinct (street, house number, postal code) combination is searched only once.
+
+    Args:
+        streets (pd.Series): Series of street names.
+        house_numbers (pd.Series): Series of house numbers, aligned with streets.
+        postal_codes (pd.Series): Series of postal codes, aligned with streets.
+        index (dict): Index built by build_address_suggestion_index.
+        max_candidates (int): Upper bound on the number of addresses compared per query.
+
+    Returns:
+        pd.DataFrame: A DataFrame with the same index as streets and the following columns:
+            - suggested_address (str or None): Canonical GURS full address.
+            - suggestion_score (float): Similarity between 0 and 1.
+    """
+    keys = list(zip(normalize_text_series(streets), normalize_text_series(house_numbers), normalize_text_series(postal_codes)))
+    suggestions = {key: suggest_address(*key, index, max_candidates=max_candidates) for key in set(keys)}
+
+    return pd.DataFrame(
+        [suggestions[key] for key in keys],
+        index=streets.index,
+        columns=["suggested_address", "suggestion_score"],
+    )
+
+if __name__ == "__main__":
+
+    import time
+
+    gurs_df = load_gurs_dataframe("src/raw_data/RN_SLO_NASLOVI_register_naslovov_20240929.csv")
+    index = build_address_suggestion_index(gurs_df)
+
+    df = read_data("src/processed_data/customer_data_with_errors.xlsx", dtype=str)
+
+    start = time.perf_counter()
+    suggestions = suggest_addresses(df["STREET"], df["HOUSE_NUMBER"], df["POSTAL_CODE"], index)
+    elapsed = time.perf_counter() - start
+
+    df[["FULL_ADDRESS_SUGGESTION", "FULL_ADDRESS_SUGGESTION_SCORE"]] = suggestions
+    print(f"Suggested {len(df)} addresses in {elapsed:.2f}s ({len(df) / elapsed:.0f} rows/s).")
+
+    write_data(df, "src/processed_data/04_address_suggestions.xlsx")
@@ -0,0 +1,150 @@
+import pandas as pd
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from utils.data_io import read_data
+from utils.string_utils import fold_text
+
+def build_diacritic_index(values: pd.Series, counts: pd.Series = None) -> dict:
+    """
+    Build a diacritic restoration index from canonical values.
+
+    Every canonical value is folded to an ASCII, upper case key (e.g. "Šmartno" -> "SMARTNO"),
+    and each key maps to its canonical forms ranked by frequency.
+
+    Args:
+        values (pd.Series): Canonical values, e.g. GURS street names or SURS surnames.
+        counts (pd.Series, optional): Frequency of every value, aligned with values. Defaults to the number of occurrences.
+
+    Returns:
+        dict: A dictionary with the following keys:
+            - forms (dict): Folded key -> list of (canonical form, frequency), most frequent first.
+            - cache (dict): Value -> restored value, filled by restore_diacritics.
+    """
+    if counts is None:
+        counts = pd.Series(1, index=values.index)
+    frequencies = (
+        pd.DataFrame({"value": values.astype(str).str.strip(), "count": counts.fillna(0).to_numpy()})
+        .loc[lambda df: values.notna().to_numpy() & (df["value"] != "")]
+        .groupby("value")["count"].sum()
+        .sort_values(ascending=False, kind="stable")
+    )
+
+    forms = {}
+    for value, count in frequencies.items():
+        forms.setdefault(fold_text(value), []).append((value, count))
+
+    return {"forms": forms, "cache": {}}
+
+def build_diacritic_indexes(gurs_df: pd.DataFrame = None, all_names: pd.DataFrame = None, all_surnames: pd.DataFrame = None) -> dict:
+    """
+    Build diacritic restoration indexes for streets and cities from GURS and for names from SURS.
+
+    Args:
+        gurs_df (pd.DataFrame, optional): DataFrame returned by load_gurs_dataframe.
+        all_names (pd.DataFrame, optional): First names with "value" and "count" columns, as returned by fetch_SURS_data.
+        all_surnames (pd.DataFrame, optional): Surnames with "value" and "count" columns, as returned by fetch_SURS_data.
+
+    Returns:
+        dict: Indexes keyed by "street", "city", "first_name" and "last_name", for the sources that were given.
+    """
+    indexes = {}
+    if gurs_df is not None:
+        indexes["street"] = build_diacritic_index(gurs_df["ULICA_NAZIV"])
+        indexes["city"] = build_diacritic_index(gurs_df["POSTNI_OKOLIS_NAZIV"])
+    if all_names is not None:
+        indexes["first_name"] = build_diacritic_index(all_names["value"], all_names["count"])
+    if all_surnames is not None:
+        indexes["last_name"] = build_diacritic_index(all_surnames["value"], all_surnames["count"])
+    return indexes
+
+def match_case(value: str, template: str) -> str:
+    """
+    Apply the letter case of template to value (upper, lower or as is).
+
+    Args:
+        value (str): Value to adjust.
+        template (str): Value whose case is copied.
+
+    Returns:
+        str: value in the case of template.
+    """
+    if template.isupper():
+        return value.upper()
+    if template.islower():
+        return value.lower()
+    return value
+
+def restore_diacritics(value, index: dict):
+    """
+    Restore the š, č, ž (and other) diacritics of a value that lost them.
+
+    Only values written entirely in ASCII are restored, using the most frequent canonical
+    form with the same folded key. A value that is itself one of the canonical forms (in any
+    letter case, e.g. "SARC" next to "Šarc") is valid and is kept. Results are cached in the
+    index, so every distinct value costs one dictionary lookup.
+
+    Args:
+        value (str): Value to restore, e.g. "Smartno".
+        index (dict): Index built by build_diacritic_index.
+
+    Returns:
+        str or None: The restored value (e.g. "Šmartno"), or None if there is nothing to restore.
+    """
+    if pd.isna(value):
+        return None
+    value = str(value)
+    if value not in index["cache"]:
+        restored = None
+        if value.isascii():
+            forms = index["forms"].get(fold_text(value.strip()))
+            if forms and value.strip().upper() not in {form.upper() for form, _ in forms}:
+                restored = match_case(forms[0][0], value.strip())
+        index["cache"][value] = restored
+    return index["cache"][value]
+
+def restore_diacritics_series(values: pd.Series, index: dict) -> pd.Series:
+    """
+    Restore diacritics for a whole Series, with one lookup per distinct value.
+
+    Args:
+        values (pd.Series): Series of values.
+        index (dict): Index built by build_diacritic_index.
+
+    Returns:
+        pd.Series: Series of restored values, None where there is nothing to restore.
+    """
+    restored = {value: restore_diacritics(value, index) for value in values.dropna().unique()}
+    return values.map(restored).astype(object).where(values.notna(), None)
+
+def add_diacritic_loss_errors(detected_errors: pd.Series, values: pd.Series, index: dict, code: str) -> pd.Series:
+    """
+    Add the diacritic loss code to the detected errors of every value the index can restore.
+
+    Args:
+        detected_errors (pd.Series): Series of detected error code lists, aligned with values.
+        values (pd.Series): Series of values, e.g. surnames or postal cities.
+        index (dict): Index built by build_diacritic_index.
+        code (str): Diacritic loss error code, e.g. "1206" or "4408".
+
+    Returns:
+        pd.Series: A copy of detected_errors with code added where diacritics were lost.
+    """
+    lost = restore_diacritics_series(values, index).notna()
+    detected_errors = detected_errors.copy()
+    detected_errors[lost] = pd.Series([sorted(set(errors) | {code}) for errors in detected_errors[lost]],
+                                      index=detected_errors.index[lost], dtype=object)
+    return detected_errors
+
+if __name__ == "__main__":
+
+    from validation.address_validation import load_gurs_dataframe
+
+    gurs_df = load_gurs_dataframe("src/raw_data/RN_SLO_NASLOVI_register_naslovov_20240929.csv")
+    indexes = build_diacritic_indexes(gurs_df)
+
+    df = read_data("src/processed_data/customer_data_with_errors.xlsx")
+    df["POSTAL_CITY_RESTORED"] = restore_diacritics_series(df["POSTAL_CITY"], indexes["city"])
+    df["STREET_RESTORED"] = restore_diacritics_series(df["STREET"], indexes["street"])
+
+    print(df.loc[df["POSTAL_CITY_RESTORED"].notna() | df["STREET_RESTORED"].notna(),
+                 ["STREET", "STREET_RESTORED", "POSTAL_CITY", "POSTAL_CITY_RESTORED"]].head(20))
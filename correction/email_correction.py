@@ -2,6 +2,7 @@ import pandas as pd
 import re
 import sys, os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from utils.data_io import read_data, write_data
 from utils.errors_utils import should_correct, load_error_config
 
 error_config = load_error_config()
@@ -32,7 +33,7 @@ def split_into_set(detected_errors_column):
     else:
         return set()
 
-def correct_email(email, detected_email_errors):
+def correct_email(email, detected_email_errors, domain_corrections=None):
     """
     Corrects email based on detected errors.
 
@@ -43,6 +44,8 @@ def correct_email(email, detected_email_errors):
     Args:
         email (str): The email address to be corrected.
         detected_email_errors (set): A set of detected error codes for the email address.
+        domain_corrections (dict, optional): Mapping of possibly invalid domains to known domains
+            (see build_domain_corrections), used to correct 2107.
 
     Returns:
         dict: A dictionary containing the following keys:
@@ -84,6 +87,18 @@ def correct_email(email, detected_email_errors):
                 if corrected_email_before != corrected_email:
                     corrected_email_errors.add('2102')
                     uncorrected_email_errors.remove('2102')
+
+        # 2107 possibly invalid domain - replace a mistyped domain with the nearest known domain
+        if should_correct('2107', error_config):
+            if '2107' in detected_email_errors and domain_corrections and corrected_email:
+                corrected_email_before = corrected_email
+                local_part, _, domain = corrected_email.rpartition('@')
+                suggested_domain = domain_corrections.get(domain.strip().lower())
+                if local_part and suggested_domain:
+                    corrected_email = f"{local_part}@{suggested_domain}"
+                if corrected_email_before != corrected_email:
+                    corrected_email_errors.add('2107')
+                    uncorrected_email_errors.remove('2107')
                     
     return (
     corrected_email if corrected_email != original_email else None,
@@ -94,7 +109,7 @@ def correct_email(email, detected_email_errors):
 if __name__ == "__main__":
     
     customer_data = "src/processed_data/02_detected_email_errors.xlsx"
-    df = pd.read_excel(customer_data)
+    df = read_data(customer_data)
     
     # split the string into a set
     df['email_detected_errors'] = df['email_detected_errors'].apply(split_into_set)
@@ -125,6 +140,6 @@ if __name__ == "__main__":
     ]
     
     # Save to Excel
-    df[columns_to_export].to_excel("src/processed_data/03_corrected_email_errors.xlsx", index=False)
+    write_data(df[columns_to_export], "src/processed_data/03_corrected_email_errors.xlsx")
     
     print("✅ Correction of email errors completed and saved.")
\ No newline at end of file
@@ -0,0 +1,137 @@
+import re
+import pandas as pd
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from utils.data_io import read_data
+from detection.email_detection import VALID_DOMAINS
+from utils.string_utils import build_bk_tree, search_bk_tree
+
+DOMAIN_REGEX = re.compile(r'^[a-zA-Z0-9-]+(\.[a-zA-Z0-9-]+)*\.[a-zA-Z]{2,}$')
+
+def extract_domains(emails: pd.Series) -> pd.Series:
+    """
+    Extract the lower case domain part of every email address.
+
+    Args:
+        emails (pd.Series): Series of email addresses.
+
+    Returns:
+        pd.Series: Series of domains, empty string where there is no '@'.
+    """
+    emails = emails.where(emails.notna(), "").astype(str).str.strip()
+    return emails.str.rpartition("@")[2].where(emails.str.contains("@", regex=False), "").str.lower()
+
+def domain_max_distance(domain: str, max_distance: int = 2) -> int:
+    """
+    Return the edit distance allowed for a domain, scaled with its length.
+
+    Short domains only allow one edit, since two edits already turn many legitimate
+    short domains (e.g. "yahoo.de") into a common provider.
+
+    Args:
+        domain (str): Domain to look up.
+        max_distance (int): Upper bound of the allowed distance.
+
+    Returns:
+        int: 1 for domains of 9 characters or fewer, 2 for longer ones, at most max_distance.
+    """
+    return min(max_distance, 1 if len(domain) <= 9 else 2)
+
+def collect_domains(emails: pd.Series, top_n: int = 20, min_share: float = 0.01, max_distance: int = 2) -> list:
+    """
+    Collect the most frequent well-formed domains observed in the data.
+
+    Domains within the allowed distance of a VALID_DOMAINS entry (see domain_max_distance) are left
+    out, so a frequent typo (e.g. "hotmial.com") never becomes a known domain that is exempt from correction.
+
+    Args:
+        emails (pd.Series): Series of email addresses.
+        top_n (int): Maximum number of domains to return.
+        min_share (float): Minimum share of the emails a domain must appear in.
+        max_distance (int): Maximum Levenshtein distance used for domain suggestions.
+
+    Returns:
+        list: Observed domains, most frequent first.
+    """
+    domains = extract_domains(emails)
+    domains = domains[domains.map(lambda domain: bool(DOMAIN_REGEX.match(domain)))]
+    if domains.empty:
+        return []
+    counts = domains.value_counts()
+    counts = counts[counts >= min_share * len(emails)]
+    valid_tree = build_bk_tree(domain.lower() for domain in VALID_DOMAINS)
+    observed = [domain for domain in counts.index
+                if not search_bk_tree(valid_tree, domain, domain_max_distance(domain, max_distance))]
+    return observed[:top_n]
+
+def build_domain_index(domains=None) -> dict:
+    """
+    Build a BK-tree index over the known email domains.
+
+    Args:
+        domains (list, optional): Domains to index, by priority. Defaults to VALID_DOMAINS.
+
+    Returns:
+        dict: A dictionary with the following keys:
+            - tree (dict): BK-tree over the domains.
+            - ranks (dict): Domain -> priority, used to break ties between equally distant domains.
+            - cache (dict): Domain -> suggestion, filled by suggest_domain.
+    """
+    if domains is None:
+        domains = VALID_DOMAINS
+    ranks = {}
+    for domain in domains:
+        ranks.setdefault(domain.lower(), len(ranks))
+    return {"tree": build_bk_tree(ranks), "ranks": ranks, "cache": {}}
+
+def suggest_domain(domain: str, index: dict, max_distance: int = 2):
+    """
+    Suggest the nearest known domain for a domain that is not known (e.g. "hotmial.com" -> "hotmail.com").
+    The allowed distance is scaled with the domain length (see domain_max_distance).
+    Results are memoized in the index, so every distinct domain is looked up only once.
+
+    Args:
+        domain (str): Domain to look up.
+        index (dict): Index built by build_domain_index.
+        max_distance (int): Upper bound of the Levenshtein distance of the suggestion.
+
+    Returns:
+        str or None: The nearest known domain, or None if the domain is known or nothing is close enough.
+    """
+    domain = str(domain).strip().lower()
+    if domain in index["ranks"] or not domain:
+        return None
+    if domain not in index["cache"]:
+        matches = search_bk_tree(index["tree"], domain, domain_max_distance(domain, max_distance))
+        matches.sort(key=lambda match: (match[1], index["ranks"][match[0]]))
+        index["cache"][domain] = matches[0][0] if matches else None
+    return index["cache"][domain]
+
+def build_domain_corrections(emails: pd.Series, index: dict, max_distance: int = 2) -> dict:
+    """
+    Build the domain correction mapping for a batch of emails, one lookup per distinct domain.
+
+    Args:
+        emails (pd.Series): Series of email addresses.
+        index (dict): Index built by build_domain_index.
+        max_distance (int): Maximum Levenshtein distance of the suggestions.
+
+    Returns:
+        dict: Domain -> suggested domain, only for domains that have a suggestion.
+    """
+    corrections = {}
+    for domain in extract_domains(emails).unique():
+        suggestion = suggest_domain(domain, index, max_distance)
+        if suggestion is not None:
+            corrections[domain] = suggestion
+    return corrections
+
+if __name__ == "__main__":
+
+    df = read_data("src/processed_data/customer_data_with_errors.xlsx")
+
+    index = build_domain_index(VALID_DOMAINS + collect_domains(df["EMAIL"]))
+    domain_corrections = build_domain_corrections(df["EMAIL"], index)
+
+    for domain, suggestion in sorted(domain_corrections.items()):
+        print(f"{domain} -> {suggestion}")
@@ -0,0 +1,213 @@
+import hashlib
+import os
+import pickle
+import pandas as pd
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from utils.string_utils import fold_text, levenshtein_distance
+
+NAME_SUGGESTION_INDEX_PATH = "src/cache/name_suggestion_index.pkl"
+
+def generate_deletes(word: str, max_distance: int = 2) -> set:
+    """
+    Generate all strings obtained by deleting up to max_distance characters from word.
+
+    Args:
+        word (str): Word to generate deletes for.
+        max_distance (int): Maximum number of deleted characters.
+
+    Returns:
+        set: The deletion neighbourhood of word, including word itself.
+    """
+    deletes = {word}
+    edge = {word}
+    for _ in range(max_distance):
+        edge = {candidate[:i] + candidate[i + 1:] for candidate in edge for i in range(len(candidate))}
+        deletes |= edge
+    return deletes
+
+def build_name_suggestion_index(lexicon: pd.DataFrame, max_distance: int = 2) -> dict:
+    """
+    Build a SymSpell-style deletion index over a SURS name or surname lexicon.
+
+    Every lexicon entry is folded (upper case, diacritics removed) and all its deletes
+    up to max_distance are mapped back to it, so candidates for a query are found by
+    looking up the query's own deletes instead of scanning the lexicon.
+
+    Args:
+        lexicon (pd.DataFrame): DataFrame with "value" and "frequency" columns, as returned by fetch_SURS_data.
+        max_distance (int): Maximum edit distance of the suggestions.
+
+    Returns:
+        dict: A dictionary with the following keys:
+            - max_distance (int): The maximum edit distance used to build the index.
+            - words (dict): Lexicon spelling -> frequency.
+            - folded (dict): Folded spelling -> list of lexicon spellings.
+            - deletes (dict): Delete -> set of folded spellings it was generated from.
+            - cache (dict): Query -> suggestions, filled by suggest_names.
+    """
+    lexicon = lexicon.dropna(subset=["value"])
+    words = dict(zip(lexicon["value"].astype(str), lexicon["frequency"].fillna(0).astype(float)))
+
+    folded = {}
+    for word in words:
+        folded.setdefault(fold_text(word), []).append(word)
+
+    deletes = {}
+    for folded_word in folded:
+        for delete in generate_deletes(folded_word, max_distance):
+            deletes.setdefault(delete, set()).add(folded_word)
+
+    return {"max_distance": max_distance, "words": words, "folded": folded, "deletes": deletes, "cache": {}}
+
+def suggest_names(name: str, index: dict) -> list:
+    """
+    Suggest lexicon names within the index's maximum edit distance of name.
+
+    The distance is computed on folded strings, so a name that only lost its
+    diacritics (e.g. "Ziga" for "Žiga") is found at distance 0. Results are cached
+    in the index.
+
+    Args:
+        name (str): Name to look up.
+        index (dict): Index built by build_name_suggestion_index.
+
+    Returns:
+        list: (suggestion, distance, frequency) tuples, sorted by distance and then by descending frequency.
+    """
+    if pd.isna(name) or not str(name).strip():
+        return []
+    name = str(name).strip()
+    if name in index["cache"]:
+        return index["cache"][name]
+
+    query = fold_text(name)
+    max_distance = index["max_distance"]
+
+    candidates = set()
+    for delete in generate_deletes(query, max_distance):
+        candidates |= index["deletes"].get(delete, set())
+
+    suggestions = []
+    for candidate in candidates:
+        distance = levenshtein_distance(query, candidate)
+        if distance <= max_distance:
+            suggestions.extend((word, distance, index["words"][word]) for word in index["folded"][candidate])
+
+    suggestions.sort(key=lambda suggestion: (suggestion[1], -suggestion[2], suggestion[0]))
+    index["cache"][name] = suggestions
+    return suggestions
+
+def suggest_name(name: str, index: dict):
+    """
+    Return the best lexicon suggestion for a name that is not in the lexicon.
+
+    Args:
+        name (str): Name to look up.
+        index (dict): Index built by build_name_suggestion_index.
+
+    Returns:
+        str or None: The closest, most frequent lexicon name, or None if name is already in the lexicon or nothing is close enough.
+    """
+    if pd.isna(name) or str(name).strip() in index["words"]:
+        return None
+    suggestions = suggest_names(name, index)
+    return suggestions[0][0] if suggestions else None
+
+def suggest_name_series(names: pd.Series, index: dict) -> pd.Series:
+    """
+    Suggest the closest lexicon name for a whole Series, with one lookup per distinct name.
+
+    Args:
+        names (pd.Series): Series of names.
+        index (dict): Index built by build_name_suggestion_index.
+
+    Returns:
+        pd.Series: Series of suggestions, None where the name is in the lexicon or nothing is close enough.
+    """
+    suggestions = {name: suggest_name(name, index) for name in names.dropna().unique()}
+    return names.map(suggestions).astype(object).where(names.notna(), None)
+
+def name_suggestion_source_key(all_names: pd.DataFrame, all_surnames: pd.DataFrame, max_distance: int) -> str:
+    """
+    Return the cache key of the suggestion indexes, a hash of the SURS lexicons and max_distance.
+
+    Args:
+        all_names (pd.DataFrame): First names with "value" and "frequency" columns.
+        all_surnames (pd.DataFrame): Surnames with "value" and "frequency" columns.
+        max_distance (int): Maximum edit distance of the indexes.
+
+    Returns:
+        str: Hex digest that changes whenever the lexicons or max_distance change.
+    """
+    digest = hashlib.sha1(str(max_distance).encode("utf-8"))
+    for lexicon in (all_names, all_surnames):
+        digest.update(pd.util.hash_pandas_object(lexicon[["value", "frequency"]], index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+def save_name_suggestion_indexes(indexes: dict, source_key: str, path: str = NAME_SUGGESTION_INDEX_PATH):
+    """
+    Persist the first name and surname suggestion indexes to disk.
+
+    Args:
+        indexes (dict): Dictionary with "first_name" and "last_name" indexes.
+        source_key (str): Key returned by name_suggestion_source_key for the lexicons the indexes were built from.
+        path (str): Path of the pickle file.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "wb") as f:
+        pickle.dump({"source_key": source_key, "indexes": indexes}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+def load_name_suggestion_indexes(path: str = NAME_SUGGESTION_INDEX_PATH, max_distance: int = 2,
+                                 all_names: pd.DataFrame = None, all_surnames: pd.DataFrame = None) -> dict:
+    """
+    Load the first name and surname suggestion indexes, building them from SURS data if they are not cached on disk.
+
+    The cached indexes are only reused if they were built from the same lexicons with the same max_distance.
+
+    Args:
+        path (str): Path of the pickle file.
+        max_distance (int): Maximum edit distance of the indexes.
+        all_names (pd.DataFrame, optional): First names with "value" and "frequency" columns. Fetched from SURS if None.
+        all_surnames (pd.DataFrame, optional): Surnames with "value" and "frequency" columns. Fetched from SURS if None.
+
+    Returns:
+        dict: Dictionary with "first_name" and "last_name" indexes.
+
+    Raises:
+        ValueError: If the SURS data is not available.
+    """
+    if all_names is None or all_surnames is None:
+        from validation.names_validation import fetch_SURS_data
+        all_names, all_surnames = fetch_SURS_data()
+    if all_names is None or all_surnames is None or all_names.empty or all_surnames.empty:
+        raise ValueError("Failed to fetch SURS data.")
+
+    source_key = name_suggestion_source_key(all_names, all_surnames, max_distance)
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            cached = pickle.load(f)
+        if isinstance(cached, dict) and cached.get("source_key") == source_key:
+            print("Name suggestion indexes loaded from cache.")
+            return cached["indexes"]
+
+    indexes = {
+        "first_name": build_name_suggestion_index(all_names, max_distance),
+        "last_name": build_name_suggestion_index(all_surnames, max_distance),
+    }
+    save_name_suggestion_indexes(indexes, source_key, path)
+    print("Name suggestion indexes built and cached.")
+    return indexes
+
+if __name__ == "__main__":
+
+    import time
+
+    indexes = load_name_suggestion_indexes()
+
+    for name in ["Ziga", "Jnaez", "Matja", "Novk", "Krajnc"]:
+        start = time.perf_counter()
+        first_name_suggestions = suggest_names(name, indexes["first_name"])[:3]
+        last_name_suggestions = suggest_names(name, indexes["last_name"])[:3]
+        elapsed = (time.perf_counter() - start) * 1e6
+        print(f"{name}: {first_name_suggestions} | {last_name_suggestions} ({elapsed:.0f} µs)")
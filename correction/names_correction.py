@@ -2,7 +2,9 @@ import pandas as pd
 import re
 import sys, os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from utils.data_io import read_data, write_data
 from utils.errors_utils import should_correct, load_error_config
+from correction.diacritic_restoration import restore_diacritics
 
 error_config = load_error_config()
 
@@ -32,7 +34,8 @@ def split_into_set(detected_errors_column):
     else:
         return set()
 
-def correct_names(first_name, last_name, detected_first_name_errors, detected_last_name_errors):
+def correct_names(first_name, last_name, detected_first_name_errors, detected_last_name_errors,
+                  diacritic_indexes=None):
     """
     Corrects first and last names based on detected errors.
 
@@ -45,6 +48,8 @@ def correct_names(first_name, last_name, detected_first_name_errors, detected_la
         last_name (str): The last name to be corrected.
         detected_first_name_errors (set): A set of detected error codes for the first name.
         detected_last_name_errors (set): A set of detected error codes for the last name.
+        diacritic_indexes (dict, optional): Diacritic restoration indexes with "first_name" and "last_name" keys
+            (see build_diacritic_indexes), used to correct diacritic loss (1108, 1206).
         
     Returns:
         dict: A dictionary containing the following keys:
@@ -204,6 +209,24 @@ def correct_names(first_name, last_name, detected_first_name_errors, detected_la
                     corrected_last_name_errors.add('1205')
                     uncorrected_last_name_errors.remove('1205')
                     
+    # Diacritic loss - restore š, č, ž from the SURS names and surnames
+    if diacritic_indexes:
+        if should_correct('1108', error_config):
+            if '1108' in detected_first_name_errors and "first_name" in diacritic_indexes and corrected_first_name:
+                restored_first_name = restore_diacritics(corrected_first_name, diacritic_indexes["first_name"])
+                if restored_first_name is not None:
+                    corrected_first_name = restored_first_name
+                    corrected_first_name_errors.add('1108')
+                    uncorrected_first_name_errors.remove('1108')
+
+        if should_correct('1206', error_config):
+            if '1206' in detected_last_name_errors and "last_name" in diacritic_indexes and corrected_last_name:
+                restored_last_name = restore_diacritics(corrected_last_name, diacritic_indexes["last_name"])
+                if restored_last_name is not None:
+                    corrected_last_name = restored_last_name
+                    corrected_last_name_errors.add('1206')
+                    uncorrected_last_name_errors.remove('1206')
+                    
     return (
         corrected_first_name if corrected_first_name != original_first_name else None,
         sorted(corrected_first_name_errors),
@@ -218,7 +241,7 @@ if __name__ == "__main__":
 
     customer_data = "src/processed_data/02_detected_name_errors.xlsx"
 
-    df = pd.read_excel(customer_data)
+    df = read_data(customer_data)
     
     # split the string into a set for processing
     df['name_detected_errors'] = df['name_detected_errors'].apply(split_into_set)
@@ -258,6 +281,6 @@ if __name__ == "__main__":
     ]
     
     # Save to Excel
-    df[columns_to_export].to_excel("src/processed_data/03_corrected_name_errors.xlsx", index=False)
+    write_data(df[columns_to_export], "src/processed_data/03_corrected_name_errors.xlsx")
     
     print("✅ Correction of name errors completed and saved.")
\ No newline at end of file
@@ -2,10 +2,20 @@ import pandas as pd
 import re
 import sys, os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from utils.data_io import read_data, write_data
 from utils.errors_utils import should_correct, load_error_config
 
 error_config = load_error_config()
 
+# National prefixes that are rewritten to the 00386 country code (3104)
+MOBILE_PREFIXES = ("041", "031", "051", "040", "030", "01", "068", "069", "065", "070", "071")
+
+# Prefix lookup table used by the vectorized correction, grouped by prefix length
+MOBILE_PREFIX_TABLE = {
+    length: {prefix for prefix in MOBILE_PREFIXES if len(prefix) == length}
+    for length in sorted({len(prefix) for prefix in MOBILE_PREFIXES})
+}
+
 def split_into_set(detected_errors_column):
     """
     Converts the input into a set of strings, handling various input types.
@@ -101,8 +111,7 @@ def correct_phone(phone: str, detected_phone_errors: set) -> dict:
         # 3104	Formatting Issue
         if should_correct('3104', error_config):
             if '3104' in detected_phone_errors:
-                mobile_prefixes = ("041", "031", "051", "040", "030", "01", "068", "069", "065", "070", "071")
-                if corrected_phone.startswith(mobile_prefixes):
+                if corrected_phone.startswith(MOBILE_PREFIXES):
                     corrected_phone_before = corrected_phone
                     corrected_phone = re.sub(r"^0", "00386", corrected_phone)
                     if corrected_phone_before != corrected_phone:
@@ -113,7 +122,136 @@ def correct_phone(phone: str, detected_phone_errors: set) -> dict:
     corrected_phone if corrected_phone != original_phone else None,
     sorted(corrected_phone_errors),
     sorted(uncorrected_phone_errors),
-    )    
+    )
+
+def remove_unnecessary_spaces_series(phones: pd.Series) -> pd.Series:
+    """
+    Vectorized version of the 3102 correction (unnecessary spaces).
+
+    Args:
+        phones (pd.Series): Series of phone numbers as strings.
+
+    Returns:
+        pd.Series: Series of phone numbers with leading, trailing and double whitespace removed.
+    """
+    return (phones.str.strip()
+            .str.replace(r'\s{2,}', ' ', regex=True)   # removes double whitespace
+            .str.replace(r'\s,', ',', regex=True))     # removes whitespaces before comma
+
+def remove_invalid_characters_series(phones: pd.Series) -> pd.Series:
+    """
+    Vectorized version of the 3103 correction (invalid characters).
+
+    Args:
+        phones (pd.Series): Series of phone numbers as strings.
+
+    Returns:
+        pd.Series: Series of phone numbers with +386/+00386 rewritten to 00386 and separators removed.
+    """
+    return (phones.str.replace(r'^\+386', '00386', regex=True)
+            .str.replace(r'^\+00386', '00386', regex=True)
+            .str.replace(r'[ /-]', '', regex=True))
+
+def add_country_code_series(phones: pd.Series) -> pd.Series:
+    """
+    Vectorized version of the 3104 correction (formatting issue).
+
+    National numbers starting with one of the known prefixes are looked up in
+    MOBILE_PREFIX_TABLE and get their leading 0 replaced with 00386.
+
+    Args:
+        phones (pd.Series): Series of phone numbers as strings.
+
+    Returns:
+        pd.Series: Series of phone numbers with the 00386 country code added where applicable.
+    """
+    has_prefix = pd.Series(False, index=phones.index)
+    for length, prefixes in MOBILE_PREFIX_TABLE.items():
+        has_prefix |= phones.str[:length].isin(prefixes)
+    return phones.mask(has_prefix, "00386" + phones.str[1:])
+
+def normalize_phone_series(phones: pd.Series) -> pd.Series:
+    """
+    Normalizes a whole Series of phone numbers to the canonical 00386 form.
+
+    Applies the 3102, 3103 and 3104 corrections to every row with vectorized
+    string operations, regardless of detected errors. The output can be fed
+    straight into validate_phone_series.
+
+    Args:
+        phones (pd.Series): Series of phone numbers.
+
+    Returns:
+        pd.Series: Series of normalized phone numbers, missing values become empty strings.
+    """
+    phones = phones.where(phones.notna(), "").astype(str)
+    phones = remove_unnecessary_spaces_series(phones)
+    phones = remove_invalid_characters_series(phones)
+    phones = add_country_code_series(phones)
+    return phones
+
+def correct_phone_series(phones: pd.Series, detected_phone_errors: pd.Series) -> pd.DataFrame:
+    """
+    Corrects a whole Series of phone numbers based on detected errors.
+
+    Batch counterpart of correct_phone: every correction rule is applied with
+    vectorized string operations to the rows where its error code was detected,
+    so no row-wise apply is needed. Rows without detected errors get no correction.
+
+    Args:
+        phones (pd.Series): Series of phone numbers to be corrected.
+        detected_phone_errors (pd.Series): Series of sets (or lists) of detected error codes, aligned with phones.
+
+    Returns:
+        pd.DataFrame: A DataFrame with the same index as phones and the following columns:
+            - corrected_phone (str or None): The corrected phone number, or None if no correction was made.
+            - corrected_phone_errors (list): A sorted list of corrected error codes for the phone number.
+            - uncorrected_phone_errors (list): A sorted list of uncorrected error codes for the phone number.
+    """
+    corrected_phone = phones.where(phones.notna(), "").astype(str)
+    corrected_flags = {}
+
+    def has_error(code):
+        return detected_phone_errors.map(lambda errors: code in errors).astype(bool)
+
+    # missing data
+    missing = pd.Series(False, index=phones.index)
+    if should_correct('3101', error_config):
+        missing = has_error('3101')
+        corrected_flags['3101'] = missing
+
+    # unnecessary spaces, invalid characters and formatting issue
+    rules = [
+        ('3102', remove_unnecessary_spaces_series),
+        ('3103', remove_invalid_characters_series),
+        ('3104', add_country_code_series),
+    ]
+    for code, rule in rules:
+        if should_correct(code, error_config):
+            mask = has_error(code) & ~missing
+            corrected_phone_before = corrected_phone[mask]
+            corrected_phone.loc[mask] = rule(corrected_phone_before)
+            corrected_flags[code] = pd.Series(False, index=phones.index)
+            corrected_flags[code].loc[mask] = corrected_phone[mask] != corrected_phone_before
+
+    corrected_phone = corrected_phone.astype(object).mask(missing, None)
+    corrected_phone = corrected_phone.where(corrected_phone != phones, None)
+
+    codes = sorted(corrected_flags)
+    corrected_phone_errors = [
+        [code for code, flag in zip(codes, flags) if flag]
+        for flags in zip(*(corrected_flags[code].to_numpy() for code in codes))
+    ] if codes else [[] for _ in range(len(phones))]
+    uncorrected_phone_errors = [
+        sorted(set(errors) - set(corrected))
+        for errors, corrected in zip(detected_phone_errors, corrected_phone_errors)
+    ]
+
+    return pd.DataFrame({
+        "corrected_phone": corrected_phone,
+        "corrected_phone_errors": pd.Series(corrected_phone_errors, index=phones.index, dtype=object),
+        "uncorrected_phone_errors": pd.Series(uncorrected_phone_errors, index=phones.index, dtype=object),
+    })
 
 if __name__ == "__main__":
 
@@ -121,7 +259,7 @@ if __name__ == "__main__":
 
     customer_data = "src/processed_data/02_detected_phone_errors.xlsx"
 
-    df = pd.read_excel(customer_data)
+    df = read_data(customer_data)
     
     # split the string into a set
     df['phone_detected_errors'] = df['phone_detected_errors'].apply(split_into_set)
@@ -151,6 +289,6 @@ if __name__ == "__main__":
     ]
     
     # Save to Excel
-    df[columns_to_export].to_excel("src/processed_data/03_corrected_phone_errors.xlsx", index=False)
+    write_data(df[columns_to_export], "src/processed_data/03_corrected_phone_errors.xlsx")
     
     print("✅ Correction of phone errors completed and saved.")
\ No newline at end of file
@@ -2,7 +2,9 @@ import pandas as pd
 import re
 import sys, os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from utils.data_io import read_data, write_data
 from utils.errors_utils import should_detect, load_error_config
+from correction.diacritic_restoration import add_diacritic_loss_errors
 
 error_config = load_error_config()
 
@@ -395,9 +397,32 @@ def detect_address_errors(street, street_number, zipcode, city):
         sorted(city_errors)
     )
 
+def detect_address_diacritic_loss(streets: pd.Series, cities: pd.Series,
+                                  street_errors: pd.Series, city_errors: pd.Series, diacritic_indexes: dict) -> tuple:
+    """Detects streets and postal cities that lost their diacritics (4114, 4408) for a whole batch.
+
+    A value is flagged when it is written in ASCII, is not a GURS name itself and folds to a GURS
+    name with diacritics (e.g. "Sempeter" -> "Šempeter").
+
+    Args:
+        streets (pd.Series): Series of street names.
+        cities (pd.Series): Series of postal cities.
+        street_errors (pd.Series): Error codes detected by detect_address_errors for the streets.
+        city_errors (pd.Series): Error codes detected by detect_address_errors for the postal cities.
+        diacritic_indexes (dict): Diacritic restoration indexes with "street" and "city" keys (see build_diacritic_indexes).
+
+    Returns:
+        tuple: (street_errors, city_errors) with 4114 and 4408 added where diacritics were lost.
+    """
+    if should_detect('4114', error_config) and "street" in diacritic_indexes:
+        street_errors = add_diacritic_loss_errors(street_errors, streets, diacritic_indexes["street"], '4114')
+    if should_detect('4408', error_config) and "city" in diacritic_indexes:
+        city_errors = add_diacritic_loss_errors(city_errors, cities, diacritic_indexes["city"], '4408')
+    return street_errors, city_errors
+
 if __name__ == "__main__":
     customer_data = "src/processed_data/customer_data_with_errors.xlsx"
-    df = pd.read_excel(customer_data)
+    df = read_data(customer_data)
 
     df[["street_detected_errors", "street_number_detected_errors", "postal_code_detected_errors", "postal_area_detected_errors"]] = df.apply(
         lambda row: pd.Series(detect_address_errors(row["STREET"], row["HOUSE_NUMBER"], row["POSTAL_CODE"], row["POSTAL_CITY"])),
@@ -422,5 +447,5 @@ if __name__ == "__main__":
     
     # Save the result
     print(df.head(10))
-    df.to_excel("src/processed_data/02_detected_address_errors.xlsx", index=False)
+    write_data(df, "src/processed_data/02_detected_address_errors.xlsx")
     print("Detection of address errors completed and saved!")
@@ -3,10 +3,19 @@ import pandas as pd
 from email_validator import validate_email, EmailNotValidError
 import sys, os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from utils.data_io import read_data, write_data
 from utils.errors_utils import should_detect, load_error_config
 
 error_config = load_error_config()
 
+# Commonly used domains, everything else is flagged as possibly invalid (2107)
+VALID_DOMAINS = [
+    'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com', 
+    'siol.net', 't-2.net', 'amis.net', 'email.si', 'gov.si', 
+    'guest.arnes.si', 'guest.arnes.net', 'guest.arnes.org', 
+    'icloud.com'
+]
+
 def detect_email_errors(email):
     """Detects errors in email addresses based on various criteria.
 
@@ -83,14 +92,8 @@ def detect_email_errors(email):
                         email_errors.add('2106')
 
             # Check for possibly invalid domain (2107)
-            valid_domains = [
-                'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com', 
-                'siol.net', 't-2.net', 'amis.net', 'email.si', 'gov.si', 
-                'guest.arnes.si', 'guest.arnes.net', 'guest.arnes.org', 
-                'icloud.com', 'guest.arnes.net'
-            ]
             skip_if_condition = not (any (code in email_errors for code in ["2103", "2104", "2105", "2106"]))
-            rule_condition = (domain not in valid_domains)
+            rule_condition = (domain not in VALID_DOMAINS)
             if should_detect('2107', error_config):
                 if skip_if_condition:
                     if rule_condition:
@@ -109,7 +112,7 @@ def detect_email_errors(email):
 if __name__ == "__main__":
     customer_data = "src/processed_data/customer_data_with_errors.xlsx"
 
-    df = pd.read_excel(customer_data)
+    df = read_data(customer_data)
 
     df["email_detected_errors"] = df["EMAIL"].apply(detect_email_errors)
     
@@ -124,5 +127,5 @@ if __name__ == "__main__":
     df = df[columns_to_keep]
     
     # Save the result
-    df.to_excel("src/processed_data/02_detected_email_errors.xlsx", index=False)
+    write_data(df, "src/processed_data/02_detected_email_errors.xlsx")
     print("Detection of email errors completed and saved!")
\ No newline at end of file
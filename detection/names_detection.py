@@ -2,7 +2,9 @@ import re
 import pandas as pd
 import sys, os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from utils.data_io import read_data, write_data
 from utils.errors_utils import should_detect, load_error_config
+from correction.diacritic_restoration import add_diacritic_loss_errors
 
 error_config = load_error_config()
 
@@ -136,9 +138,32 @@ def detect_name_errors(name, surname):
     
     return sorted(name_errors), sorted(surname_errors)
 
+def detect_name_diacritic_loss(first_names: pd.Series, last_names: pd.Series,
+                               first_name_errors: pd.Series, last_name_errors: pd.Series, diacritic_indexes: dict) -> tuple:
+    """Detects names and surnames that lost their diacritics (1108, 1206) for a whole batch.
+
+    A name is flagged when it is written in ASCII, is not a SURS name itself and folds to a SURS
+    name with diacritics (e.g. "Spela" -> "Špela").
+
+    Args:
+        first_names (pd.Series): Series of first names.
+        last_names (pd.Series): Series of last names.
+        first_name_errors (pd.Series): Error codes detected by detect_name_errors for the first names.
+        last_name_errors (pd.Series): Error codes detected by detect_name_errors for the last names.
+        diacritic_indexes (dict): Diacritic restoration indexes with "first_name" and "last_name" keys (see build_diacritic_indexes).
+
+    Returns:
+        tuple: (first_name_errors, last_name_errors) with 1108 and 1206 added where diacritics were lost.
+    """
+    if should_detect('1108', error_config) and "first_name" in diacritic_indexes:
+        first_name_errors = add_diacritic_loss_errors(first_name_errors, first_names, diacritic_indexes["first_name"], '1108')
+    if should_detect('1206', error_config) and "last_name" in diacritic_indexes:
+        last_name_errors = add_diacritic_loss_errors(last_name_errors, last_names, diacritic_indexes["last_name"], '1206')
+    return first_name_errors, last_name_errors
+
 if __name__ == "__main__":
     customer_data = "src/processed_data/customer_data_with_errors.xlsx"
-    df = pd.read_excel(customer_data)
+    df = read_data(customer_data)
 
     # Apply the name error detection
     # errors_df = df.apply(
@@ -162,5 +187,5 @@ if __name__ == "__main__":
     df = df[columns_to_keep]
     
     # Save the result
-    df.to_excel("src/processed_data/02_detected_name_errors.xlsx", index=False)
+    write_data(df, "src/processed_data/02_detected_name_errors.xlsx")
     print("Detection of name/surname errors completed and saved!")
@@ -2,6 +2,7 @@ import re
 import pandas as pd
 import sys, os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from utils.data_io import read_data, write_data
 from utils.errors_utils import should_detect, load_error_config
 
 error_config = load_error_config()
@@ -103,7 +104,7 @@ def detect_phone_errors(phone: str) -> set:
 if __name__ == "__main__":
     customer_data = "src/processed_data/customer_data_with_errors.xlsx"
 
-    df = pd.read_excel(customer_data)
+    df = read_data(customer_data)
 
     df["phone_detected_errors"] = df["PHONE_NUMBER"].apply(detect_phone_errors)
     
@@ -118,6 +119,6 @@ if __name__ == "__main__":
     df = df[columns_to_keep]
     
     # Save the result
-    df.to_excel("src/processed_data/02_detected_phone_errors.xlsx", index=False)
+    write_data(df, "src/processed_data/02_detected_phone_errors.xlsx")
     print("Detection of phone errors completed and saved!")
 
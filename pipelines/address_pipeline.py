@@ -2,35 +2,91 @@ import pandas as pd
 import os, sys
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.append(project_root)
-from detection.address_detection import detect_address_errors
+from utils.data_io import read_data, write_data
+from utils.stage_timing import start_stage_timer, record_stage
+from detection.address_detection import detect_address_errors, detect_address_diacritic_loss
 from correction.address_correction import correct_address
-from validation.address_validation import validate_full_address, normalize_text, load_gurs_data
+from correction.address_suggestion import build_address_suggestion_index, suggest_addresses
+from correction.diacritic_restoration import build_diacritic_indexes
+from validation.address_validation import (validate_full_address_series, normalize_text_series, load_gurs_dataframe, build_gurs_address_set,
+                                           build_gurs_address_hashes,
+                                           build_gurs_component_index, validate_address_components_series,
+                                           build_postal_city_mapping, validate_postal_city_series)
 
-def run_address_pipeline(df: pd.DataFrame, street_column, street_number_column, postal_code_column, postal_city_column) -> pd.DataFrame:
+GURS_FILE_PATH = "src/raw_data/RN_SLO_NASLOVI_register_naslovov_20240929.csv"
+
+def build_address_indexes(gurs_df: pd.DataFrame, component_index: bool = True, postal_city_mapping: bool = True,
+                          diacritic_indexes: bool = True, suggestion_index: bool = True) -> dict:
+    """
+    Build the GURS indexes of the address pipeline once, so they can be reused across runs and chunks.
+    The full address hashes used for validation are always built, the other indexes are optional.
+
+    Args:
+        gurs_df (pd.DataFrame): DataFrame returned by load_gurs_dataframe.
+        component_index (bool): Build the per-component index (see build_gurs_component_index).
+        postal_city_mapping (bool): Build the postal code -> city mapping (see build_postal_city_mapping).
+        diacritic_indexes (bool): Build the street and city diacritic restoration indexes (see build_diacritic_indexes).
+        suggestion_index (bool): Build the address suggestion index (see build_address_suggestion_index).
+
+    Returns:
+        dict: Keyword arguments for run_address_pipeline, with gurs_address_hashes and the requested indexes.
+    """
+    indexes = {"gurs_address_hashes": build_gurs_address_hashes(build_gurs_address_set(gurs_df))}
+    if component_index:
+        indexes["component_index"] = build_gurs_component_index(gurs_df)
+    if postal_city_mapping:
+        indexes["postal_city_mapping"] = build_postal_city_mapping(gurs_df)
+    if diacritic_indexes:
+        indexes["diacritic_indexes"] = build_diacritic_indexes(gurs_df)
+    if suggestion_index:
+        indexes["suggestion_index"] = build_address_suggestion_index(gurs_df)
+    return indexes
+
+def run_address_pipeline(df: pd.DataFrame, street_column, street_number_column, postal_code_column, postal_city_column,
+                         gurs_df: pd.DataFrame = None, gurs_address_hashes: dict = None, component_index: dict = None, postal_city_mapping: pd.DataFrame = None,
+                         diacritic_indexes: dict = None, suggestion_index: dict = None, timings: list = None) -> pd.DataFrame:
     """
     Run the address validation pipeline on the provided DataFrame.
     This function performs the following steps:
-    1. Validate addresses using the validate_address function.
-    2. Detect address errors using the detect_address_errors function.
+    1. Validate addresses using the validate_full_address_series function (and diagnose invalid components).
+    2. Detect address errors using the detect_address_errors function (and diacritic loss of streets and cities).
     3. Correct detected errors using the correct_address_errors function.
     4. Re-validate addresses after correction.
-    5. Assign status to each address component based on validation results.
-    6. Return the updated DataFrame with additional columns for detected errors, corrections, and validation status.
+    5. Suggest the closest GURS address for invalid addresses that correction did not fix (only fills FULL_ADDRESS_SUGGESTION).
+    The checks in brackets and step 5 are optional and only run when their index is given (see build_address_indexes).
+    6. Assign status to each address component based on validation results.
+    7. Return the updated DataFrame with additional columns for detected errors, corrections, and validation status.
     Args:
         df (pd.DataFrame): DataFrame containing customer data with columns "street", "street_number", "postal_code", and "postal_area".
         street_column (str): Name of the column containing street address.
         street_number_column (str): Name of the column containing street numbers.
         postal_code_column (str): Name of the column containing postal codes.
         postal_area_column (str): Name of the column containing postal areas.
+        gurs_df (pd.DataFrame, optional): DataFrame returned by load_gurs_dataframe. Only used to build gurs_address_hashes
+            when they are not given, and loaded from GURS_FILE_PATH if neither is given.
+        gurs_address_hashes (dict, optional): Hashes built by build_gurs_address_hashes (see build_address_indexes).
+            Built from gurs_df on every call if not given.
+        component_index (dict, optional): Index built by build_gurs_component_index. If given, the invalid components
+            of every address are stored in FULL_ADDRESS_INVALID_COMPONENTS.
+        postal_city_mapping (pd.DataFrame, optional): Mapping built by build_postal_city_mapping. If given, postal codes
+            and cities are cross-checked against GURS and missing cities get a fill.
+        diacritic_indexes (dict, optional): Street and city indexes built by build_diacritic_indexes. If given, ASCII
+            streets and cities that fold to a GURS name with diacritics are detected as diacritic loss (4114, 4408)
+            and, where the error config allows it, restored by the correction step.
+        suggestion_index (dict, optional): Index built by build_address_suggestion_index. If given, invalid addresses
+            get the closest GURS address in FULL_ADDRESS_SUGGESTION.
+        timings (list, optional): List that collects the wall time, CPU time and rows of every stage (see utils/stage_timing.py).
     Returns:
         pd.DataFrame: Updated DataFrame with additional columns for detected errors, corrections, and validation status.
     """
     
+    timer = start_stage_timer(timings, "address", len(df))
+
     ################################################################################
     # Step 1: Validate address
     # Create FULL_ADDRESS
     for col in ["STREET", "HOUSE_NUMBER", "POSTAL_CODE", "POSTAL_CITY"]:
-        df[col] = df[col].apply(normalize_text)
+        df[col] = normalize_text_series(df[col])
         
     df["FULL_ADDRESS"] = (
         df[street_column].str.strip() + " " +
@@ -38,13 +94,22 @@ def run_address_pipeline(df: pd.DataFrame, street_column, street_number_column,
         df[postal_code_column].str.strip() + " " +
         df[postal_city_column].str.strip())
     
-    # Load GURS data ONCE
-    gurs_address_set = load_gurs_data("src/raw_data/RN_SLO_NASLOVI_register_naslovov_20240929.csv")
+    # Load GURS data and hash the full addresses only if the caller did not do it once already
+    if gurs_address_hashes is None:
+        if gurs_df is None:
+            gurs_df = load_gurs_dataframe(GURS_FILE_PATH)
+        gurs_address_hashes = build_gurs_address_hashes(build_gurs_address_set(gurs_df))
     
     # Apply validation
-    df["FULL_ADDRESS_VALID"] = df["FULL_ADDRESS"].apply(lambda addr: validate_full_address(addr, gurs_address_set))
+    df["FULL_ADDRESS_VALID"] = validate_full_address_series(df["FULL_ADDRESS"], gurs_address_hashes)
+    
+    # Diagnose which address components are not found in GURS
+    if component_index is not None:
+        df["FULL_ADDRESS_INVALID_COMPONENTS"] = validate_address_components_series(
+            df[street_column], df[street_number_column], df[postal_code_column], df[postal_city_column], component_index)
 
     print('AP: Address validation completed.')
+    record_stage(timer, "validate")
     
     ################################################################################
     # Step 2: Detect errors
@@ -57,7 +122,24 @@ def run_address_pipeline(df: pd.DataFrame, street_column, street_number_column,
         axis=1
     )
     
+    # Diacritic loss needs the GURS names, so it is detected for the whole batch at once
+    if diacritic_indexes:
+        df[f"{street_column}_DETECTED_ERRORS"], df[f"{postal_city_column}_DETECTED_ERRORS"] = detect_address_diacritic_loss(
+            df[street_column], df[postal_city_column],
+            df[f"{street_column}_DETECTED_ERRORS"], df[f"{postal_city_column}_DETECTED_ERRORS"], diacritic_indexes)
+    
     print('AP: Address detection completed.')
+    record_stage(timer, "detect")
+    
+    ################################################################################
+    # Cross-check postal code and city against GURS, offer the GURS city as a fill for missing cities
+    if postal_city_mapping is not None:
+        postal_city_check = validate_postal_city_series(df[postal_code_column], df[postal_city_column], postal_city_mapping)
+        df[f"{postal_code_column}_IN_GURS"] = postal_city_check["postal_code_exists"]
+        df[f"{postal_city_column}_MATCHES_POSTAL_CODE"] = postal_city_check["city_matches"]
+        df[f"{postal_city_column}_FILL"] = postal_city_check["gurs_city"].where(
+            df[f"{postal_city_column}_DETECTED_ERRORS"].map(lambda errors: '4401' in errors).astype(bool), None)
+        record_stage(timer, "postal_city_check")
     
     ################################################################################
     # Create columns to check if there are errors
@@ -65,6 +147,7 @@ def run_address_pipeline(df: pd.DataFrame, street_column, street_number_column,
     df[f'{street_number_column}_HAS_ERRORS'] = df[f"{street_number_column}_DETECTED_ERRORS"].apply(lambda x: len(x) > 0)
     df[f'{postal_code_column}_HAS_ERRORS'] = df[f"{postal_code_column}_DETECTED_ERRORS"].apply(lambda x: len(x) > 0)
     df[f'{postal_city_column}_HAS_ERRORS'] = df[f"{postal_city_column}_DETECTED_ERRORS"].apply(lambda x: len(x) > 0)
+    record_stage(timer, "has_errors")
     
     ################################################################################
     # Step 3: Correct if errors detected
@@ -80,7 +163,8 @@ def run_address_pipeline(df: pd.DataFrame, street_column, street_number_column,
             detected_street_errors=row[f"{street_column}_DETECTED_ERRORS"],
             detected_street_number_errors=row[f"{street_number_column}_DETECTED_ERRORS"],
             detected_zipcode_errors=row[f"{postal_code_column}_DETECTED_ERRORS"],
-            detected_city_errors=row[f"{postal_city_column}_DETECTED_ERRORS"]
+            detected_city_errors=row[f"{postal_city_column}_DETECTED_ERRORS"],
+            diacritic_indexes=diacritic_indexes
         )) if (len(row[f"{street_column}_DETECTED_ERRORS"]) > 0 or len(row[f"{street_number_column}_DETECTED_ERRORS"]) > 0
                 or len(row[f"{postal_code_column}_DETECTED_ERRORS"]) > 0 or len(row[f"{postal_city_column}_DETECTED_ERRORS"]) > 0)
         else pd.Series([None, [], [], None, [], [], None, [], [], None, [], []])
@@ -88,6 +172,7 @@ def run_address_pipeline(df: pd.DataFrame, street_column, street_number_column,
     )
     
     print('AP: Address correction completed.')
+    record_stage(timer, "correct")
     
     ################################################################################
     # Create columns to check which rows were corrected
@@ -95,6 +180,7 @@ def run_address_pipeline(df: pd.DataFrame, street_column, street_number_column,
     df[f"{street_number_column}_WAS_CORRECTED"] = (df[f"{street_number_column}_CORRECTED"].notnull() | df[f"{street_number_column}_CORRECTED_ERRORS"].apply(lambda x: len(x) > 0))
     df[f"{postal_code_column}_WAS_CORRECTED"] = (df[f"{postal_code_column}_CORRECTED"].notnull() | df[f"{postal_code_column}_CORRECTED_ERRORS"].apply(lambda x: len(x) > 0))
     df[f"{postal_city_column}_WAS_CORRECTED"] = (df[f"{postal_city_column}_CORRECTED"].notnull() | df[f"{postal_city_column}_CORRECTED_ERRORS"].apply(lambda x: len(x) > 0))
+    record_stage(timer, "was_corrected")
     
     ################################################################################
     # Step 4: Re-validate for corrected address
@@ -107,20 +193,41 @@ def run_address_pipeline(df: pd.DataFrame, street_column, street_number_column,
     )
     
     # Apply validation only if at least one of the components was corrected
-    df["FULL_ADDRESS_VALID_AFTER_CORRECTION"] = df.apply(
-        lambda row: validate_full_address(row["FULL_ADDRESS_CORRECTED"], gurs_address_set) 
-        if  row[f"{street_column}_CORRECTED"] or 
-            row[f"{street_number_column}_CORRECTED"] or 
-            row[f"{postal_code_column}_CORRECTED"] or 
-            row[f"{postal_city_column}_CORRECTED"]
-        else None,
-        axis=1
+    any_corrected = pd.Series(False, index=df.index)
+    for col in [street_column, street_number_column, postal_code_column, postal_city_column]:
+        any_corrected |= df[f"{col}_CORRECTED"].notna() & df[f"{col}_CORRECTED"].ne("")
+    df["FULL_ADDRESS_VALID_AFTER_CORRECTION"] = (
+        validate_full_address_series(df["FULL_ADDRESS_CORRECTED"], gurs_address_hashes)
+        .astype(object)
+        .where(any_corrected, None)
     )
     
     print('AP: Address re-validation completed.')
+    record_stage(timer, "revalidate")
+    
+    ################################################################################
+    # Step 5: Suggest the closest GURS address for invalid addresses that correction did not fix,
+    # including addresses without detected errors. Suggestions do not change the corrected values or the status.
+    if suggestion_index is not None:
+        df["FULL_ADDRESS_SUGGESTION"] = None
+        df["FULL_ADDRESS_SUGGESTION_SCORE"] = None
+        
+        still_invalid = ~df["FULL_ADDRESS_VALID"].astype(bool) & df["FULL_ADDRESS_VALID_AFTER_CORRECTION"].ne(True)
+        if still_invalid.any():
+            suggestions = suggest_addresses(
+                df.loc[still_invalid, f"{street_column}_CORRECTED"].fillna(df.loc[still_invalid, street_column]),
+                df.loc[still_invalid, f"{street_number_column}_CORRECTED"].fillna(df.loc[still_invalid, street_number_column]),
+                df.loc[still_invalid, f"{postal_code_column}_CORRECTED"].fillna(df.loc[still_invalid, postal_code_column]),
+                suggestion_index
+            )
+            df.loc[still_invalid, "FULL_ADDRESS_SUGGESTION"] = suggestions["suggested_address"]
+            df.loc[still_invalid, "FULL_ADDRESS_SUGGESTION_SCORE"] = suggestions["suggestion_score"]
+        
+        print('AP: Address suggestion completed.')
+        record_stage(timer, "suggest")
     
     ################################################################################
-    # Step 5: Assign status
+    # Step 6: Assign status
     def status(row):        
         columns = ["STREET", "HOUSE_NUMBER", "POSTAL_CODE", "POSTAL_CITY"]
 
@@ -154,21 +261,23 @@ def run_address_pipeline(df: pd.DataFrame, street_column, street_number_column,
     df["FULL_ADDRESS_STATUS"] = df.apply(status, axis=1)
 
     print('AP: Address status assignment completed.')
+    record_stage(timer, "status")
     
     return df
 
 if __name__ == "__main__":
     # Load customer data
     customer_data = "src/processed_data/customer_data_with_errors.xlsx"
-    df = pd.read_excel(customer_data)
+    df = read_data(customer_data)
 
-    # Run the address pipeline
-    df = run_address_pipeline(df, "STREET", "HOUSE_NUMBER", "POSTAL_CODE", "POSTAL_CITY")
+    # Run the address pipeline with all optional checks, corrections and suggestions
+    address_indexes = build_address_indexes(load_gurs_dataframe(GURS_FILE_PATH))
+    df = run_address_pipeline(df, "STREET", "HOUSE_NUMBER", "POSTAL_CODE", "POSTAL_CITY", **address_indexes)
 
     # choose the columns to keep
     # columns_to_keep = [ ]
     # df = df[columns_to_keep]
 
     # Save updated file
-    df.to_excel("src/processed_data/05_address.xlsx", index=False)
+    write_data(df, "src/processed_data/05_address.xlsx")
     print("Address pipeline completed successfully.")
@@ -2,11 +2,27 @@ import pandas as pd
 import os, sys
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.append(project_root)
+from utils.data_io import read_data, write_data
+from utils.stage_timing import start_stage_timer, record_stage
 from detection.email_detection import detect_email_errors
 from correction.email_correction import correct_email
+from correction.email_domain_suggestion import build_domain_index, collect_domains, build_domain_corrections
+from detection.email_detection import VALID_DOMAINS
 from validation.email_validation import validate_email
 
-def run_email_pipeline(df: pd.DataFrame, email_column) -> pd.DataFrame:
+def build_email_indexes(emails: pd.Series) -> dict:
+    """
+    Build the domain index of the email pipeline once, so it can be reused across runs and chunks.
+
+    Args:
+        emails (pd.Series): Email addresses of the whole dataset, used to collect the frequent observed domains.
+
+    Returns:
+        dict: Keyword arguments for run_email_pipeline, with domain_index.
+    """
+    return {"domain_index": build_domain_index(VALID_DOMAINS + collect_domains(emails))}
+
+def run_email_pipeline(df: pd.DataFrame, email_column, domain_index: dict = None, timings: list = None) -> pd.DataFrame:
     """
     Run the email pipeline on the given DataFrame.
     This function performs the following steps:
@@ -19,42 +35,58 @@ def run_email_pipeline(df: pd.DataFrame, email_column) -> pd.DataFrame:
     Args:
         df (pd.DataFrame): DataFrame containing customer data with columns "email".
         email_column (str): Name of the column containing emails.
+        domain_index (dict, optional): Domain index with VALID_DOMAINS and the observed domains (see build_email_indexes).
+            Only VALID_DOMAINS are used as correction targets if not given.
+        timings (list, optional): List that collects the wall time, CPU time and rows of every stage (see utils/stage_timing.py).
     Returns:
         pd.DataFrame: Updated DataFrame with additional columns for detected errors, corrections, and validation status.
     """
     
+    timer = start_stage_timer(timings, "email", len(df))
+
     ################################################################################
     # Step 1: Validate emails
     df[f"{email_column}_VALID"] = df[email_column].apply(validate_email)
 
     print('EP: Email validation completed.')
+    record_stage(timer, "validate")
     
     ################################################################################
     # Step 2: Detect errors
     df[f"{email_column}_DETECTED_ERRORS"] = df[email_column].apply(detect_email_errors)
     
     print('EP: Email detection completed.')
+    record_stage(timer, "detect")
     
     ################################################################################
     # Create columns to check if there are errors
     df[f"{email_column}_HAS_ERRORS"] = df[f"{email_column}_DETECTED_ERRORS"].apply(lambda x: len(x) > 0)
+    record_stage(timer, "has_errors")
     
     ################################################################################
     # Step 3: Correct if errors detected
+    # Domain corrections are looked up once per distinct domain
+    if domain_index is None:
+        domain_index = build_domain_index()
+    domain_corrections = build_domain_corrections(df[email_column], domain_index)
+    
     df[[f"{email_column}_CORRECTED", f"{email_column}_CORRECTED_ERRORS", f"{email_column}_UNCORRECTED_ERRORS"]] = df.apply(
         lambda row: pd.Series(correct_email(
             email=row[email_column],
             detected_email_errors=row[f"{email_column}_DETECTED_ERRORS"],
+            domain_corrections=domain_corrections,
         )) if (len(row[f"{email_column}_DETECTED_ERRORS"]) > 0)
         else pd.Series([None, [], []])
         , axis=1
     )
     
     print('EP: Email correction completed.')
+    record_stage(timer, "correct")
     
     ################################################################################
     # Check if the email was corrected
     df[f"{email_column}_WAS_CORRECTED"] = (df[f"{email_column}_CORRECTED"].notnull() | df[f"{email_column}_CORRECTED_ERRORS"].apply(lambda x: len(x) > 0))
+    record_stage(timer, "was_corrected")
     
     ################################################################################
     # Step 4: Re-validate for corrected emails
@@ -65,6 +97,7 @@ def run_email_pipeline(df: pd.DataFrame, email_column) -> pd.DataFrame:
     )
     
     print('EP: Email re-validation completed.')
+    record_stage(timer, "revalidate")
     
     ################################################################################
     # Step 5: Assign status
@@ -88,21 +121,22 @@ def run_email_pipeline(df: pd.DataFrame, email_column) -> pd.DataFrame:
     df[f"{email_column}_STATUS"] = df.apply(lambda row: status(row, email_column), axis=1)
     
     print('EP: Email status assignment completed.')
+    record_stage(timer, "status")
     
     return df
 
 if __name__ == "__main__":
     # Load customer data
     customer_data = "src/processed_data/customer_data_with_errors.xlsx"
-    df = pd.read_excel(customer_data)
+    df = read_data(customer_data)
 
     # Run the email pipeline
-    df = run_email_pipeline(df, "EMAIL")
+    df = run_email_pipeline(df, "EMAIL", **build_email_indexes(df["EMAIL"]))
 
     # choose the columns to keep
     # columns_to_keep = [ ]
     # df = df[columns_to_keep]
 
     # Save updated file
-    df.to_excel("src/processed_data/05_email.xlsx", index=False)
+    write_data(df, "src/processed_data/05_email.xlsx")
     print("Email pipeline completed successfully.")
@@ -2,16 +2,23 @@ import pandas as pd
 import os, sys
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.append(project_root)
-from pipelines.names_pipeline import run_name_pipeline
-from pipelines.email_pipeline import run_email_pipeline
-from pipelines.address_pipeline import run_address_pipeline
+from utils.data_io import read_data, write_data
+from utils.stage_timing import start_stage_timer, record_stage
+from pipelines.names_pipeline import run_name_pipeline, build_name_indexes
+from pipelines.email_pipeline import run_email_pipeline, build_email_indexes
+from pipelines.address_pipeline import run_address_pipeline, build_address_indexes, GURS_FILE_PATH
+from validation.address_validation import load_gurs_dataframe
 from pipelines.phone_pipeline import run_phone_pipeline
 
 def run_full_quality_pipeline(df, 
                               first_name_column, last_name_column, 
                               street_column, street_number_column, postal_code_column, postal_city_column, 
                               email_column, 
-                              phone_column) -> pd.DataFrame:
+                              phone_column,
+                              name_indexes: dict = None,
+                              email_indexes: dict = None,
+                              address_indexes: dict = None,
+                              timings: list = None) -> pd.DataFrame:
     """
     Run the full quality pipeline on the provided DataFrame.
     This function performs the following steps:
@@ -30,24 +37,34 @@ def run_full_quality_pipeline(df,
         postal_city_column (str): Name of the column containing postal cities.
         email_column (str): Name of the column containing emails.
         phone_column (str): Name of the column containing phone numbers.
+        name_indexes (dict, optional): Optional SURS indexes for the name pipeline, as returned by build_name_indexes.
+            Built once by the caller; they enable diacritic loss detection and restoration and name suggestions.
+        email_indexes (dict, optional): Domain index for the email pipeline, as returned by build_email_indexes.
+            Built once by the caller from the whole dataset; without it only VALID_DOMAINS are correction targets.
+        address_indexes (dict, optional): Optional GURS indexes for the address pipeline, as returned by build_address_indexes.
+            Built once by the caller; without them the address pipeline only validates, detects and corrects.
+        timings (list, optional): List that collects the wall time, CPU time and rows of every stage of every pipeline
+            and of the overall status (see utils/stage_timing.py).
     Returns:
         pd.DataFrame: Updated DataFrame with additional columns for detected errors, corrections, and validation status.
     """
-    df = run_name_pipeline(df, first_name_column, last_name_column)
+    df = run_name_pipeline(df, first_name_column, last_name_column, **(name_indexes or {}), timings=timings)
     print('MP: Name pipeline done')
     
-    df = run_email_pipeline(df, email_column)
+    df = run_email_pipeline(df, email_column, **(email_indexes or {}), timings=timings)
     print('MP: Email pipeline done')
     
     df = run_address_pipeline(df, 
                               street_column, street_number_column, 
-                              postal_code_column, postal_city_column)
+                              postal_code_column, postal_city_column, **(address_indexes or {}), timings=timings)
     print('MP: Address pipeline done')
     
-    df = run_phone_pipeline(df, phone_column)
+    df = run_phone_pipeline(df, phone_column, timings=timings)
     print('MP: Phone pipeline done')
     
     # Step 5: Assign overall status based on individual statuses
+    timer = start_stage_timer(timings, "overall", len(df))
+    
     def overall_status(row):
         statuses = [
             row[f"{first_name_column}_STATUS"],
@@ -72,6 +89,7 @@ def run_full_quality_pipeline(df,
     df["OVERALL_STATUS"] = df.apply(lambda row: overall_status(row), axis=1)
     
     print('MP: Overall status assigned')
+    record_stage(timer, "status")
     
     return df
 
@@ -79,7 +97,7 @@ if __name__ == "__main__":
     
     # Example usage
     customer_data = "src/processed_data/customer_data_with_errors.xlsx"
-    df = pd.read_excel(customer_data)
+    df = read_data(customer_data)
 
     run_full_quality_pipeline(df, 
                               first_name_column="FIRST_NAME", 
@@ -89,7 +107,10 @@ if __name__ == "__main__":
                               postal_code_column="POSTAL_CODE", 
                               postal_city_column="POSTAL_CITY", 
                               email_column="EMAIL", 
-                              phone_column="PHONE_NUMBER")
+                              phone_column="PHONE_NUMBER",
+                              name_indexes=build_name_indexes(),
+                              email_indexes=build_email_indexes(df["EMAIL"]),
+                              address_indexes=build_address_indexes(load_gurs_dataframe(GURS_FILE_PATH)))
     
     # Convert lists and sets to strings before saving
     for col in df.columns:
@@ -98,5 +119,5 @@ if __name__ == "__main__":
                 lambda x: ", ".join(sorted(x)) if isinstance(x, (set, list)) else x
             )
     
-    df.to_excel("src/processed_data/final_customer_data.xlsx", index=False)
+    write_data(df, "src/processed_data/final_customer_data.xlsx")
     print("Pipeline completed and saved to final_customer_data.xlsx")
\ No newline at end of file
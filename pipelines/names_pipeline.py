@@ -2,30 +2,71 @@ import pandas as pd
 import os, sys
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.append(project_root)
-from detection.names_detection import detect_name_errors
+from utils.data_io import read_data, write_data
+from utils.stage_timing import start_stage_timer, record_stage
+from detection.names_detection import detect_name_errors, detect_name_diacritic_loss
 from correction.names_correction import correct_names
-from validation.names_validation import validate_names
+from validation.names_validation import validate_names, fetch_SURS_data
+from correction.name_suggestion import suggest_name_series, load_name_suggestion_indexes
+from correction.diacritic_restoration import build_diacritic_indexes
 
-def run_name_pipeline(df: pd.DataFrame, first_name_column, last_name_column) -> pd.DataFrame:
+def build_name_indexes(all_names: pd.DataFrame = None, all_surnames: pd.DataFrame = None,
+                       name_suggestion_indexes: bool = True, diacritic_indexes: bool = True) -> dict:
+    """
+    Build the optional SURS indexes of the name pipeline once, so they can be reused across runs and chunks.
+
+    Args:
+        all_names (pd.DataFrame, optional): First names with "value", "count" and "frequency" columns. Fetched from SURS if None.
+        all_surnames (pd.DataFrame, optional): Surnames with "value", "count" and "frequency" columns. Fetched from SURS if None.
+        name_suggestion_indexes (bool): Load or build the name suggestion indexes (see load_name_suggestion_indexes).
+        diacritic_indexes (bool): Build the first name and surname diacritic restoration indexes (see build_diacritic_indexes).
+
+    Returns:
+        dict: Keyword arguments for run_name_pipeline with the requested indexes.
+    """
+    if all_names is None or all_surnames is None:
+        all_names, all_surnames = fetch_SURS_data()
+    if all_names is None or all_surnames is None:
+        raise ValueError("Failed to fetch SURS data.")
+
+    indexes = {}
+    if name_suggestion_indexes:
+        indexes["name_suggestion_indexes"] = load_name_suggestion_indexes(all_names=all_names, all_surnames=all_surnames)
+    if diacritic_indexes:
+        indexes["diacritic_indexes"] = build_diacritic_indexes(all_names=all_names, all_surnames=all_surnames)
+    return indexes
+
+def run_name_pipeline(df: pd.DataFrame, first_name_column, last_name_column, name_suggestion_indexes=None, diacritic_indexes=None,
+                      timings: list = None) -> pd.DataFrame:
     """
     Run the name validation pipeline on the provided DataFrame.
     This function performs the following steps:
     1. Validate names using the validate_name function.
-    2. Detect name and surname errors using the detect_name_errors function.
+    2. Detect name and surname errors using the detect_name_errors function (and diacritic loss of names and surnames).
     3. Correct detected errors using the correct_name_errors function.
     4. Re-validate names after correction.
-    5. Assign status to each name and surname based on validation results.
-    6. Return the updated DataFrame with additional columns for detected errors, corrections, and validation status.
+    5. Suggest the closest SURS name for names that are still not valid (only fills the *_SUGGESTION columns).
+    6. Assign status to each name and surname based on validation results.
+    7. Return the updated DataFrame with additional columns for detected errors, corrections, and validation status.
     
     Args:
         df (pd.DataFrame): DataFrame containing customer data with columns "name" and "surname".
         first_name_column (str): Name of the column containing first names.
         last_name_column (str): Name of the column containing last names.
+        name_suggestion_indexes (dict, optional): Dictionary with "first_name" and "last_name" name suggestion indexes
+            (see build_name_indexes). If given, names that are not valid after correction get the closest SURS name
+            in {first_name_column}_SUGGESTION and {last_name_column}_SUGGESTION. Suggestions do not change corrections or statuses.
+        diacritic_indexes (dict, optional): Dictionary with "first_name" and "last_name" diacritic restoration indexes
+            (see build_name_indexes). If given, ASCII names and surnames that fold to a SURS name with diacritics are
+            detected as diacritic loss (1108, 1206) and, where the error config allows it, restored by the correction step.
+        timings (list, optional): List that collects the wall time, CPU time and rows of every stage (see utils/stage_timing.py).
 
     Returns:
         pd.DataFrame: Updated DataFrame with additional columns for detected errors, corrections, and validation status.
     """
     
+    timer = start_stage_timer(timings, "names", len(df))
+
     ################################################################################
     # Step 1: Validate names
     df[[f"{first_name_column}_VALID", f"{last_name_column}_VALID"]] = df.apply(
@@ -35,6 +76,7 @@ def run_name_pipeline(df: pd.DataFrame, first_name_column, last_name_column) ->
         axis=1)
 
     print('NP: Name validation completed.')
+    record_stage(timer, "validate")
 
     ################################################################################
     # Step 2: Detect name and surname errors
@@ -43,12 +85,20 @@ def run_name_pipeline(df: pd.DataFrame, first_name_column, last_name_column) ->
         axis=1
     )
     
+    # Diacritic loss needs the SURS names, so it is detected for the whole batch at once
+    if diacritic_indexes:
+        df[f"{first_name_column}_DETECTED_ERRORS"], df[f"{last_name_column}_DETECTED_ERRORS"] = detect_name_diacritic_loss(
+            df[first_name_column], df[last_name_column],
+            df[f"{first_name_column}_DETECTED_ERRORS"], df[f"{last_name_column}_DETECTED_ERRORS"], diacritic_indexes)
+    
     print('NP: Name error detection completed.')
+    record_stage(timer, "detect")
     
     ################################################################################
     # Create columns to check if there are errors
     df[f'{first_name_column}_HAS_ERRORS'] = df[f"{first_name_column}_DETECTED_ERRORS"].apply(lambda x: len(x) > 0)
     df[f'{last_name_column}_HAS_ERRORS'] = df[f"{last_name_column}_DETECTED_ERRORS"].apply(lambda x: len(x) > 0)
+    record_stage(timer, "has_errors")
     
     ################################################################################
     # Step 3: Correct if errors detected
@@ -59,17 +109,20 @@ def run_name_pipeline(df: pd.DataFrame, first_name_column, last_name_column) ->
             last_name=row[last_name_column],
             detected_first_name_errors=row[f"{first_name_column}_DETECTED_ERRORS"],
             detected_last_name_errors=row[f"{last_name_column}_DETECTED_ERRORS"],
+            diacritic_indexes=diacritic_indexes,
         )) if (len(row[f"{first_name_column}_DETECTED_ERRORS"]) > 0 or len(row[f"{last_name_column}_DETECTED_ERRORS"]) > 0)
         else pd.Series([None, [], [], None, [], []])
         , axis=1
     )
     
     print('NP: Name correction completed.')
+    record_stage(timer, "correct")
     
     ################################################################################
     # Create columns to check which rows were corrected
     df[f"{first_name_column}_WAS_CORRECTED"] = (df[f"{first_name_column}_CORRECTED"].notnull() | df[f"{first_name_column}_CORRECTED_ERRORS"].apply(lambda x: len(x) > 0))
     df[f"{last_name_column}_WAS_CORRECTED"] = (df[f"{last_name_column}_CORRECTED"].notnull() | df[f"{last_name_column}_CORRECTED_ERRORS"].apply(lambda x: len(x) > 0))
+    record_stage(timer, "was_corrected")
 
     ################################################################################
     # Step 4: Re-validate for corrected names
@@ -88,9 +141,21 @@ def run_name_pipeline(df: pd.DataFrame, first_name_column, last_name_column) ->
     )
     
     print('NP: Name re-validation completed.')
+    record_stage(timer, "revalidate")
+    
+    ################################################################################
+    # Step 5: Suggest the closest SURS name for names that are not valid and were not fixed by correction
+    if name_suggestion_indexes:
+        for column, index_name in [(first_name_column, "first_name"), (last_name_column, "last_name")]:
+            still_invalid = ~df[f"{column}_VALID"].astype(bool) & df[f"{column}_VALID_AFTER_CORRECTION"].ne(True)
+            names = df[f"{column}_CORRECTED"].fillna(df[column])
+            df[f"{column}_SUGGESTION"] = suggest_name_series(names, name_suggestion_indexes[index_name]).where(still_invalid, None)
+        
+        print('NP: Name suggestion completed.')
+        record_stage(timer, "suggest")
     
     ################################################################################
-    # Step 5: Assign status
+    # Step 6: Assign status
     def status(row, column):
         detected_errors = row.get(f"{column}_DETECTED_ERRORS", [])
 
@@ -112,13 +177,14 @@ def run_name_pipeline(df: pd.DataFrame, first_name_column, last_name_column) ->
     df[f"{last_name_column}_STATUS"] = df.apply(lambda row: status(row, last_name_column), axis=1)
     
     print('NP: Name status assignment completed.')
+    record_stage(timer, "status")
     
     return df
 
 if __name__ == "__main__":
     # Load customer data
     customer_data = "src/processed_data/customer_data_with_errors.xlsx"
-    df = pd.read_excel(customer_data)
+    df = read_data(customer_data)
 
     # Run the name pipeline
     df = run_name_pipeline(df, "FIRST_NAME", "LAST_NAME")
@@ -136,5 +202,5 @@ if __name__ == "__main__":
     df = df[columns_to_keep]
 
     # Save updated file
-    df.to_excel("src/processed_data/05_names.xlsx", index=False)
+    write_data(df, "src/processed_data/05_names.xlsx")
     print("Name pipeline completed successfully.")
\ No newline at end of file
@@ -1,101 +1,103 @@
+import numpy as np
 import pandas as pd
 import os, sys
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.append(project_root)
+from utils.data_io import read_data, write_data
+from utils.stage_timing import start_stage_timer, record_stage
 from detection.phone_detection import detect_phone_errors
-from correction.phone_correction import correct_phone
-from validation.phone_validation import validate_phone
+from correction.phone_correction import correct_phone_series
+from validation.phone_validation import validate_phone_series
 
-def run_phone_pipeline(df: pd.DataFrame, phone_column: str) -> pd.DataFrame:
+def run_phone_pipeline(df: pd.DataFrame, phone_column: str, timings: list = None) -> pd.DataFrame:
     """
     Run the phone pipeline on the given DataFrame.
 
     This function performs the following steps:
-    1. Validate phones using the validate_phone function.
+    1. Validate phones using the validate_phone_series function.
     2. Detect phone errors using the detect_phone_errors function.
-    3. Correct detected errors using the correct_phone_errors function.
+    3. Correct detected errors using the correct_phone_series function.
     4. Re-validate phones after correction.
     5. Assign status to each phone based on validation results.
     6. Return the updated DataFrame with additional columns for detected errors, corrections, and validation status.
     Args:
         df (pd.DataFrame): DataFrame containing customer data with columns "phone".
         phone_column (str): Name of the column containing phones.
+        timings (list, optional): List that collects the wall time, CPU time and rows of every stage (see utils/stage_timing.py).
     Returns:
         pd.DataFrame: Updated DataFrame with additional columns for detected errors, corrections, and validation status.
     """
     
+    timer = start_stage_timer(timings, "phone", len(df))
+
     ################################################################################
     # Step 1: Validate phones
-    df[f"{phone_column}_VALID"] = df[phone_column].apply(validate_phone)
+    df[f"{phone_column}_VALID"] = validate_phone_series(df[phone_column])
 
     print('PP: Phone validation completed.')
+    record_stage(timer, "validate")
     
     ################################################################################
     # Step 2: Detect errors
     df[f"{phone_column}_DETECTED_ERRORS"] = df[phone_column].apply(detect_phone_errors)
     
     print('PP: Phone detection completed.')
+    record_stage(timer, "detect")
     
     ################################################################################
     # Create columns to check if there are errors
-    df[f"{phone_column}_HAS_ERRORS"] = df[f"{phone_column}_DETECTED_ERRORS"].apply(lambda x: len(x) > 0)
+    df[f"{phone_column}_HAS_ERRORS"] = df[f"{phone_column}_DETECTED_ERRORS"].map(len) > 0
+    record_stage(timer, "has_errors")
     
     ################################################################################
-    # Step 3: Correct if errors detected
-    df[[f"{phone_column}_CORRECTED", f"{phone_column}_CORRECTED_ERRORS", f"{phone_column}_UNCORRECTED_ERRORS"]] = df.apply(
-        lambda row: pd.Series(correct_phone(
-            phone=row[phone_column],
-            detected_phone_errors=row[f"{phone_column}_DETECTED_ERRORS"],
-        )) if (len(row[f"{phone_column}_DETECTED_ERRORS"]) > 0)
-        else pd.Series([None, [], []])
-        , axis=1
-    )
+    # Step 3: Correct if errors detected (vectorized, rows without errors stay uncorrected)
+    corrections = correct_phone_series(df[phone_column], df[f"{phone_column}_DETECTED_ERRORS"])
+    df[f"{phone_column}_CORRECTED"] = corrections["corrected_phone"]
+    df[f"{phone_column}_CORRECTED_ERRORS"] = corrections["corrected_phone_errors"]
+    df[f"{phone_column}_UNCORRECTED_ERRORS"] = corrections["uncorrected_phone_errors"]
     
     print('PP: Phone correction completed.')
+    record_stage(timer, "correct")
     
     ################################################################################
     # Create columns to check which rows were corrected 
-    df[f"{phone_column}_WAS_CORRECTED"] = (df[f"{phone_column}_CORRECTED"].notnull() | df[f"{phone_column}_CORRECTED_ERRORS"].apply(lambda x: len(x) > 0))
+    df[f"{phone_column}_WAS_CORRECTED"] = (df[f"{phone_column}_CORRECTED"].notnull() | (df[f"{phone_column}_CORRECTED_ERRORS"].map(len) > 0))
+    record_stage(timer, "was_corrected")
     
     ################################################################################
     # Step 4: Re-validate for corrected phones
-    df[f"{phone_column}_VALID_AFTER_CORRECTION"] = df.apply(
-        lambda row: validate_phone(phone=row[f"{phone_column}_CORRECTED"]) 
-        if row[f"{phone_column}_WAS_CORRECTED"] else None,
-        axis=1
+    df[f"{phone_column}_VALID_AFTER_CORRECTION"] = (
+        validate_phone_series(df[f"{phone_column}_CORRECTED"])
+        .astype(object)
+        .where(df[f"{phone_column}_WAS_CORRECTED"], None)
     )
     
     print('PP: Phone re-validation completed.')
+    record_stage(timer, "revalidate")
 
     ################################################################################    
     # Step 5: Assign status
-    def status(row, column):
-        detected_errors = row.get(f"{column}_DETECTED_ERRORS", [])
-
-        # Check for MISSING DATA based on error code ending
-        if any(str(error).endswith("01") for error in detected_errors):
-            return "MISSING DATA"
-        elif row.get(f"{column}_VALID"):
-            return "VALID"
-        elif not row.get(f"{column}_HAS_ERRORS", False):
-            return "UNDETECTED ERRORS"
-        elif row.get(f"{column}_UNCORRECTED_ERRORS"):
-            return "UNCORRECTED ERRORS"
-        elif row.get(f"{column}_VALID_AFTER_CORRECTION"):
-            return "CORRECTED"
-        else:
-            return "INVALID AFTER CORRECTIONS"
-    
-    df[f"{phone_column}_STATUS"] = df.apply(lambda row: status(row, phone_column), axis=1)
+    missing_data = df[f"{phone_column}_DETECTED_ERRORS"].map(
+        lambda errors: any(str(error).endswith("01") for error in errors)).astype(bool)
+    conditions = [
+        missing_data,                                                   # Check for MISSING DATA based on error code ending
+        df[f"{phone_column}_VALID"].astype(bool),
+        ~df[f"{phone_column}_HAS_ERRORS"].astype(bool),
+        df[f"{phone_column}_UNCORRECTED_ERRORS"].map(len) > 0,
+        df[f"{phone_column}_VALID_AFTER_CORRECTION"].eq(True),
+    ]
+    choices = ["MISSING DATA", "VALID", "UNDETECTED ERRORS", "UNCORRECTED ERRORS", "CORRECTED"]
+    df[f"{phone_column}_STATUS"] = np.select(conditions, choices, default="INVALID AFTER CORRECTIONS")
     
     print('PP: Phone status assignment completed.')
+    record_stage(timer, "status")
     
     return df
 
 if __name__ == "__main__":
     # Load customer data
     customer_data = "src/processed_data/customer_data_with_errors.xlsx"
-    df = pd.read_excel(customer_data)
+    df = read_data(customer_data)
 
     # Run the phone pipeline
     df = run_phone_pipeline(df, "PHONE_NUMBER")
@@ -105,5 +107,5 @@ if __name__ == "__main__":
     # df = df[columns_to_keep]
 
     # Save updated file
-    df.to_excel("src/processed_data/05_phone.xlsx", index=False)
+    write_data(df, "src/processed_data/05_phone.xlsx")
     print("Phone pipeline completed successfully.")
@@ -0,0 +1,83 @@
+import pytest
+import numpy as np
+import pandas as pd
+from correction.address_suggestion import build_address_suggestion_index, suggest_address, suggest_addresses
+from utils.string_utils import levenshtein_distance, levenshtein_distances, encode_strings
+
+GURS_DF = pd.DataFrame({
+    "ULICA_NAZIV": ["Slovenska cesta", "Slovenska cesta", "Šmartinska cesta", "Trubarjeva ulica", "Glavni trg"],
+    "HS_STEVILKA": ["1", "12", "5", "7", "3"],
+    "HS_DODATEK": ["", "a", "", "", ""],
+    "POSTNI_OKOLIS_SIFRA": ["1000", "1000", "1000", "1000", "2000"],
+    "POSTNI_OKOLIS_NAZIV": ["Ljubljana", "Ljubljana", "Ljubljana", "Ljubljana", "Maribor"],
+    "GURS_FULL_ADDRESS": [
+        "Slovenska cesta 1, 1000 Ljubljana",
+        "Slovenska cesta 12A, 1000 Ljubljana",
+        "Šmartinska cesta 5, 1000 Ljubljana",
+        "Trubarjeva ulica 7, 1000 Ljubljana",
+        "Glavni trg 3, 2000 Maribor",
+    ],
+})
+
+INDEX = build_address_suggestion_index(GURS_DF)
+
+@pytest.mark.parametrize("a, b", [
+    ("", ""),
+    ("", "abc"),
+    ("kitten", "sitting"),
+    ("SLOVENSKA CESTA 1", "SLOVENSKA CESTA 12A"),
+    ("Šmartinska", "Smartinska"),
+])
+def test_levenshtein_distances_matches_scalar(a, b):
+    codes, lengths = encode_strings([b, a, "x"])
+    distances = levenshtein_distances(a, codes, lengths)
+    assert distances[0] == levenshtein_distance(a, b)
+    assert distances[1] == 0
+
+@pytest.mark.parametrize("street, house_number, postal_code, expected_address", [
+    ("Slovenska cesta", "1", "1000", "Slovenska cesta 1, 1000 Ljubljana"),
+    ("Slovensak cesta", "1", "1000", "Slovenska cesta 1, 1000 Ljubljana"),
+    ("Slovenska cesta", "12a", "1000", "Slovenska cesta 12A, 1000 Ljubljana"),
+    ("Smartinska cesta", "5", "1000", "Šmartinska cesta 5, 1000 Ljubljana"),
+    ("Trubarjeva", "7", "1000", "Trubarjeva ulica 7, 1000 Ljubljana"),
+    ("Glavni trg", "3", "2000", "Glavni trg 3, 2000 Maribor"),
+])
+def test_suggest_address(street, house_number, postal_code, expected_address):
+    suggested_address, score = suggest_address(street, house_number, postal_code, INDEX)
+    assert suggested_address == expected_address
+    assert 0 < score <= 1
+
+def test_suggest_address_exact_match_scores_one():
+    assert suggest_address("Slovenska cesta", "1", "1000", INDEX) == ("Slovenska cesta 1, 1000 Ljubljana", 1.0)
+
+def test_suggest_address_blocks_by_postal_code():
+    # The street exists only in Ljubljana, the suggestion must stay inside 2000
+    suggested_address, _ = suggest_address("Slovenska cesta", "1", "2000", INDEX)
+    assert suggested_address == "Glavni trg 3, 2000 Maribor"
+
+@pytest.mark.parametrize("postal_code", ["9999", "", None])
+def test_suggest_address_unknown_postal_code(postal_code):
+    assert suggest_address("Slovenska cesta", "1", postal_code, INDEX) == (None, 0.0)
+
+def test_suggest_address_bounded_candidates():
+    gurs_df = pd.DataFrame({
+        "ULICA_NAZIV": ["Dolga ulica"] * 1000,
+        "HS_STEVILKA": [str(number) for number in range(1, 1001)],
+        "HS_DODATEK": [""] * 1000,
+        "POSTNI_OKOLIS_SIFRA": ["3000"] * 1000,
+        "POSTNI_OKOLIS_NAZIV": ["Celje"] * 1000,
+    })
+    gurs_df["GURS_FULL_ADDRESS"] = gurs_df["ULICA_NAZIV"] + " " + gurs_df["HS_STEVILKA"] + ", 3000 Celje"
+    index = build_address_suggestion_index(gurs_df)
+    assert suggest_address("Dolga ulica", "999", "3000", index, max_candidates=50) == ("Dolga ulica 999, 3000 Celje", 1.0)
+
+def test_suggest_addresses_batch():
+    streets = pd.Series(["Slovensak cesta", "Glavni trg", "Slovensak cesta"], index=[10, 11, 12])
+    house_numbers = pd.Series(["1", "3", "1"], index=[10, 11, 12])
+    postal_codes = pd.Series(["1000", "2000", "1000"], index=[10, 11, 12])
+    suggestions = suggest_addresses(streets, house_numbers, postal_codes, INDEX)
+    assert list(suggestions.index) == [10, 11, 12]
+    assert list(suggestions["suggested_address"]) == [
+        "Slovenska cesta 1, 1000 Ljubljana", "Glavni trg 3, 2000 Maribor", "Slovenska cesta 1, 1000 Ljubljana"
+    ]
+    assert np.isclose(suggestions.loc[11, "suggestion_score"], 1.0)
@@ -0,0 +1,104 @@
+import pytest
+import numpy as np
+import pandas as pd
+from utils.chaos_engineering_vectorized import (ATTRIBUTES, OUTPUT_COLUMNS, apply_error, apply_errors_vectorized, apply_errors_parallel,
+                                                error_bit, has_error, render_errors, repeat_dirty_variants)
+
+def customer_data(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "CUSTOMER_ID": np.arange(n).astype(str),
+        "FIRST_NAME": rng.choice(["Ana", "Janez Marko", "Špela", "Luka"], n),
+        "LAST_NAME": rng.choice(["Novak", "Kovačič", "Horvat Žagar"], n),
+        "EMAIL": rng.choice(["ana.novak@gmail.com", "janez@siol.net", "luka@t-2.net"], n),
+        "PHONE_NUMBER": rng.choice(["0038631123456", "0038640111222"], n),
+        "STREET": rng.choice(["Trubarjeva ulica", "Šmartinska cesta", "Ulica 1. maja", "Cesta IX. korpusa"], n),
+        "HOUSE_NUMBER": rng.choice(["1", "12A", "105", "7b"], n),
+        "POSTAL_CODE": rng.choice(["1000", "2000", "3000"], n),
+        "POSTAL_CITY": rng.choice(["Ljubljana", "Maribor", "Celje", "Krško"], n),
+    }, index=range(100, 100 + n))
+
+DF = customer_data(20000)
+DF_WITH_ERRORS = apply_errors_vectorized(DF, seed=42)
+
+def test_output_columns_and_index():
+    assert list(DF_WITH_ERRORS.columns) == OUTPUT_COLUMNS
+    assert list(DF_WITH_ERRORS.index) == list(DF.index)
+
+def test_reproducible_with_seed():
+    assert apply_errors_vectorized(DF, seed=42).equals(DF_WITH_ERRORS)
+    assert not apply_errors_vectorized(DF, seed=7).equals(DF_WITH_ERRORS)
+
+@pytest.mark.parametrize("attribute, prefix", ATTRIBUTES)
+def test_values_change_only_with_logged_errors(attribute, prefix):
+    errors = DF_WITH_ERRORS[f"{attribute}_INTRO_ERRORS"]
+    clean = errors == ""
+    assert (DF_WITH_ERRORS.loc[clean, attribute] == DF.loc[clean, attribute]).all()
+    codes = errors[~clean].str.split(", ").explode()
+    assert len(codes) > 0
+    assert codes.str.startswith(str(prefix)).all()
+
+def test_introduced_errors_combine_attribute_errors():
+    expected = DF_WITH_ERRORS[[f"{attribute}_INTRO_ERRORS" for attribute, _ in ATTRIBUTES]].apply(
+        lambda row: ", ".join(errors for errors in row if errors), axis=1)
+    assert (DF_WITH_ERRORS["INTRODUCED_ERRORS"] == expected).all()
+    codes = DF_WITH_ERRORS["INTRODUCED_ERRORS"].str.split(", ")
+    assert codes.map(lambda row: row == sorted(row, key=lambda code: int(code or 0))).all()
+
+def test_missing_data_stops_further_errors():
+    missing = DF_WITH_ERRORS["FIRST_NAME_INTRO_ERRORS"].str.contains("1101")
+    assert missing.any()
+    assert (DF_WITH_ERRORS.loc[missing, "FIRST_NAME_INTRO_ERRORS"] == "1101").all()
+
+@pytest.mark.parametrize("n", [0, 1, 3])
+def test_small_datasets(n):
+    assert len(apply_errors_vectorized(customer_data(n), seed=1)) == n
+
+def test_apply_error_marks_only_changed_rows():
+    values = pd.Series(["a", "b", "c"], dtype=object)
+    bits = np.zeros(3, dtype=np.uint32)
+    changed = apply_error(values, bits, "4105", np.array([True, True, False]), ["a", "x"])
+    assert list(changed) == [False, True, False]
+    assert list(values) == ["a", "x", "c"]
+    assert list(has_error(bits, "4105")) == [False, True, False]
+    assert error_bit("4105") == 1 << 4
+
+def test_render_errors():
+    bits = np.zeros((3, len(ATTRIBUTES)), dtype=np.uint32)
+    bits[0, 0] = error_bit("1102") | error_bit("1108")
+    bits[0, 4] = error_bit("4114")
+    bits[2, 7] = error_bit("4401")
+    attribute_errors, all_errors = render_errors(bits)
+    assert list(attribute_errors[0]) == ["1102, 1108", "", ""]
+    assert list(attribute_errors[4]) == ["4114", "", ""]
+    assert list(all_errors) == ["1102, 1108, 4114", "", "4401"]
+
+@pytest.mark.parametrize("workers", [2, 4])
+def test_parallel_result_independent_of_workers(workers):
+    serial = apply_errors_parallel(DF, seed=42, block_size=3000, workers=1)
+    assert list(serial.index) == list(DF.index)
+    assert apply_errors_parallel(DF, seed=42, block_size=3000, workers=workers).equals(serial)
+
+def test_parallel_blocks_use_spawned_seeds():
+    serial = apply_errors_parallel(DF, seed=42, block_size=7000, workers=1)
+    seeds = np.random.SeedSequence(42).spawn(3)
+    expected = pd.concat([apply_errors_vectorized(DF.iloc[start:start + 7000], seed) for start, seed in zip(range(0, len(DF), 7000), seeds)])
+    assert serial.equals(expected)
+    assert len(apply_errors_parallel(customer_data(0), seed=42)) == 0
+
+def test_repeat_dirty_variants():
+    clean = pd.Series(["a", "b", "a", "a", "b", "c"])
+    values = pd.Series(["a", "b!", "a?", "a", "b", "c"], dtype=object)
+    bits = np.array([0, 2, 1, 0, 0, 0], dtype=np.uint32)
+    repeat_dirty_variants(clean, values, bits, np.random.default_rng(0), 1.0)
+    # Row 2 is the template of "a", row 1 of "b", "c" has no dirty variant
+    assert list(values) == ["a?", "b!", "a?", "a?", "b!", "c"]
+    assert list(bits) == [1, 2, 1, 1, 2, 0]
+
+@pytest.mark.parametrize("attribute, prefix", ATTRIBUTES)
+def test_repeated_dirty_variants_recur(attribute, prefix):
+    repeated = apply_errors_vectorized(DF, seed=42, repeat_rate=0.5)
+    dirty = repeated[f"{attribute}_INTRO_ERRORS"] != ""
+    assert repeated.loc[dirty, attribute].nunique() < DF_WITH_ERRORS.loc[DF_WITH_ERRORS[f"{attribute}_INTRO_ERRORS"] != "", attribute].nunique()
+    assert dirty.mean() > (DF_WITH_ERRORS[f"{attribute}_INTRO_ERRORS"] != "").mean()
+    assert apply_errors_vectorized(DF, seed=42, repeat_rate=0.0).equals(DF_WITH_ERRORS)
@@ -0,0 +1,82 @@
+import pytest
+import pandas as pd
+import correction.email_correction as email_correction
+import pipelines.email_pipeline as email_pipeline
+from pipelines.email_pipeline import build_email_indexes
+from correction.email_correction import correct_email
+from detection.email_detection import VALID_DOMAINS
+from correction.email_domain_suggestion import (build_domain_index, suggest_domain, build_domain_corrections, collect_domains,
+                                                domain_max_distance)
+from utils.string_utils import build_bk_tree, search_bk_tree
+
+DOMAIN_INDEX = build_domain_index()
+
+def test_search_bk_tree():
+    tree = build_bk_tree(["gmail.com", "hotmail.com", "siol.net", "amis.net"])
+    assert search_bk_tree(tree, "gmial.com", 2) == [("gmail.com", 2)]
+    assert search_bk_tree(tree, "siol.ne", 1) == [("siol.net", 1)]
+    assert search_bk_tree(tree, "example.org", 2) == []
+
+@pytest.mark.parametrize("domain, expected_domain", [
+    ("gmai.com", "gmail.com"),
+    ("gmail.co", "gmail.com"),
+    ("hotmial.com", "hotmail.com"),
+    ("sioll.net", "siol.net"),
+    ("Yahooo.com", "yahoo.com"),
+])
+def test_suggest_domain(domain, expected_domain):
+    assert suggest_domain(domain, DOMAIN_INDEX) == expected_domain
+
+@pytest.mark.parametrize("domain", [
+    "gmail.com", "unknown123domain.com", "",
+    "yahoo.de",         # short domains allow one edit only
+    "email.cz",
+])
+def test_suggest_domain_no_suggestion(domain):
+    assert suggest_domain(domain, DOMAIN_INDEX) is None
+
+def test_build_domain_corrections_one_lookup_per_domain():
+    index = build_domain_index()
+    emails = pd.Series(["a@hotmial.com", "b@hotmial.com", "c@gmail.com", "d@unknown123domain.com", None, "no-at-sign"])
+    assert build_domain_corrections(emails, index) == {"hotmial.com": "hotmail.com"}
+    assert set(index["cache"]) == {"hotmial.com", "unknown123domain.com"}
+
+def test_collect_domains():
+    emails = pd.Series(["a@firma.si"] * 5 + ["b@podjetje.si"] * 3 + ["c@rare.si", "bad@domain"])
+    assert collect_domains(emails, min_share=0.2) == ["firma.si", "podjetje.si"]
+
+def test_collect_domains_skips_near_valid_domains():
+    # A frequent typo must not become a known domain, or it would never be corrected
+    emails = pd.Series(["a@hotmial.com"] * 5 + ["b@gmail.com"] * 3 + ["c@firma.si"] * 2 + ["d@yahoo.de"] * 2)
+    domains = collect_domains(emails, min_share=0.1)
+    assert domains == ["firma.si", "yahoo.de"]
+    assert build_domain_corrections(emails, build_domain_index(VALID_DOMAINS + domains)) == {"hotmial.com": "hotmail.com"}
+
+@pytest.mark.parametrize("domain, expected", [("gmai.com", 1), ("gmail.com", 1), ("hotmial.com", 2), ("guest.arnes.si", 2)])
+def test_domain_max_distance(domain, expected):
+    assert domain_max_distance(domain) == expected
+    assert domain_max_distance(domain, max_distance=1) == 1
+
+@pytest.mark.parametrize("email, expected", [
+    ("ana@hotmial.com", ("ana@hotmail.com", ["2107"], [])),
+    ("ana@unknown123domain.com", (None, [], ["2107"])),
+])
+def test_correct_email_domain(monkeypatch, email, expected):
+    monkeypatch.setitem(email_correction.error_config, "2107", {**email_correction.error_config["2107"], "correct": True})
+    domain_corrections = build_domain_corrections(pd.Series([email]), build_domain_index())
+    assert correct_email(email, {"2107"}, domain_corrections=domain_corrections) == expected
+
+def test_correct_email_domain_disabled_in_config(monkeypatch):
+    monkeypatch.setitem(email_correction.error_config, "2107", {**email_correction.error_config["2107"], "correct": False})
+    assert correct_email("ana@gmial.com", {"2107"}, domain_corrections={"gmial.com": "gmail.com"}) == (None, [], ["2107"])
+
+def test_email_pipeline_reuses_domain_index(monkeypatch):
+    df = pd.DataFrame({"EMAIL": ["ana@firma.si", "bor@hotmial.com", "eva@gmail.com"]})
+    indexes = build_email_indexes(pd.concat([df["EMAIL"]] * 3))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("observed domains collected again")
+    monkeypatch.setattr(email_pipeline, "collect_domains", fail)
+    monkeypatch.setitem(email_correction.error_config, "2107", {**email_correction.error_config["2107"], "correct": True})
+    result = email_pipeline.run_email_pipeline(df, "EMAIL", **indexes)
+    assert result["EMAIL_CORRECTED"].tolist() == [None, "bor@hotmail.com", None]
@@ -0,0 +1,61 @@
+import pytest
+import pandas as pd
+from detection.phone_detection import detect_phone_errors
+from correction.phone_correction import correct_phone, correct_phone_series, normalize_phone_series
+from validation.phone_validation import validate_phone, validate_phone_series
+
+PHONES = [
+    "0038631123456",
+    " 0038631123456",
+    "0038631  123456 ",
+    "+38631123456",
+    "+0038631123456",
+    "031 123 456",
+    "031/123-456",
+    "041123456",
+    "01234567",
+    "386123456789",
+    "0038612345678911",
+    "0038631123456, 0038641123456",
+    "",
+    "x",
+    None,
+]
+
+# Normalization to canonical 00386 form
+@pytest.mark.parametrize("phone, expected", [
+    ("+38631123456", "0038631123456"),
+    ("+0038631123456", "0038631123456"),
+    ("031 123 456", "0038631123456"),
+    ("031/123-456", "0038631123456"),
+    (" 041123456 ", "0038641123456"),
+    ("01234567", "003861234567"),
+    ("0038631123456", "0038631123456"),
+    (None, ""),
+])
+def test_normalize_phone_series(phone, expected):
+    assert normalize_phone_series(pd.Series([phone])).iloc[0] == expected
+
+# Batch correction gives the same result as the row-wise correction
+def test_correct_phone_series_matches_correct_phone():
+    phones = pd.Series(PHONES)
+    detected = phones.apply(detect_phone_errors)
+    result = correct_phone_series(phones, detected)
+
+    for i, (phone, errors) in enumerate(zip(phones, detected)):
+        expected = correct_phone(phone, errors) if errors else (None, [], [])
+        assert tuple(result.iloc[i]) == expected
+
+# Vectorized validation gives the same result as the scalar validation
+def test_validate_phone_series_matches_validate_phone():
+    phones = pd.Series(PHONES + [12345, float("nan")], dtype=object)
+    expected = [validate_phone(phone) for phone in phones]
+    assert validate_phone_series(phones).tolist() == expected
+
+@pytest.mark.parametrize("phones", [
+    pd.Series([float("nan"), float("nan")]),               # all-missing chunk
+    pd.Series([38631123456, 38640123456]),                 # numeric phone column
+    pd.Series([38631123456, None], dtype="Int64"),
+])
+def test_validate_phone_series_without_strings(phones):
+    assert validate_phone_series(phones).tolist() == [validate_phone(phone) for phone in phones] == [False, False]
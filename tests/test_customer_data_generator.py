@@ -0,0 +1,138 @@
+import pytest
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import utils.customer_data_generator as customer_data_generator
+from utils.customer_data_generator import (CUSTOMER_COLUMNS, EMAIL_DOMAINS, generate_customer_data_chunks, write_customer_data_parquet,
+                                          generate_slo_phone_numbers, generate_random_emails, clean_email_names,
+                                          calculate_frequencies, load_SURS_snapshot, zipf_weights, duplicate_customers)
+from utils.sampling_utils import build_alias_table, sample_alias
+
+ADDRESSES = pd.DataFrame({
+    "ULICA_NAZIV": ["Trubarjeva ulica", "Šmartinska cesta", "Glavni trg"],
+    "HS_STEVILKA": [7, 5, 3],
+    "HS_DODATEK": [None, "a", None],
+    "ST_STANOVANJA": pd.array([None, 12, None], dtype="Int64"),
+    "POSTNI_OKOLIS_SIFRA": [1000, 1000, 2000],
+    "POSTNI_OKOLIS_NAZIV": ["Ljubljana", "Ljubljana", "Maribor - okolica"],
+})
+NAMES = pd.DataFrame({"value": ["Ana", "Janez", "Špela"], "frequency": [0.5, 0.3, 0.2]})
+SURNAMES = pd.DataFrame({"value": ["Novak", "Kovačič"], "frequency": [0.6, 0.4]})
+
+def chunks(dataset_size, chunk_size, seed=42, **options):
+    return generate_customer_data_chunks(None, dataset_size, seed, chunk_size,
+                                         addresses=ADDRESSES, all_names=NAMES, all_surnames=SURNAMES, **options)
+
+def test_chunks_sizes_and_columns():
+    generated = list(chunks(2500, 1000))
+    assert [len(chunk) for chunk in generated] == [1000, 1000, 500]
+    assert all(list(chunk.columns) == CUSTOMER_COLUMNS for chunk in generated)
+    customer_ids = pd.concat(generated)["CUSTOMER_ID"]
+    assert list(customer_ids) == list(range(1, 2501))
+
+def test_chunks_content():
+    chunk = next(chunks(1000, 1000))
+    assert set(chunk["FIRST_NAME"]) <= set(NAMES["value"])
+    assert set(chunk["HOUSE_NUMBER"]) <= {"7", "5A", "3"}
+    assert set(chunk["POSTAL_CITY"]) <= {"Ljubljana", "Maribor"}
+    assert (chunk.loc[chunk["HOUSE_NUMBER"] == "5A", "APARTMENT_NUMBER"] == 12).all()
+    assert chunk["PHONE_NUMBER"].str.startswith("00386").all()
+
+def test_synthetic_customer_data_uses_local_rng(monkeypatch):
+    monkeypatch.setattr(customer_data_generator, "fetch_GURS_data", lambda path: ADDRESSES)
+    monkeypatch.setattr(customer_data_generator, "load_SURS_snapshot", lambda: (NAMES.copy(), SURNAMES.copy()))
+    np.random.seed(0)
+    global_state = np.random.get_state()[1].copy()
+    first = customer_data_generator.generate_synthetic_customer_data(None, 200, seed=7)
+    second = customer_data_generator.generate_synthetic_customer_data(None, 200, seed=7)
+    pd.testing.assert_frame_equal(first, second)
+    assert (np.random.get_state()[1] == global_state).all()
+
+def test_chunks_reproducible():
+    first = pd.concat(chunks(2500, 1000))
+    second = pd.concat(chunks(2500, 1000))
+    pd.testing.assert_frame_equal(first, second)
+
+def test_write_customer_data_parquet(tmp_path):
+    path = tmp_path / "customers.parquet"
+    assert write_customer_data_parquet(chunks(2500, 1000), str(path)) == 2500
+    assert pq.ParquetFile(path).num_row_groups == 3
+    pd.testing.assert_frame_equal(pd.read_parquet(path), pd.concat(chunks(2500, 1000), ignore_index=True))
+
+@pytest.mark.parametrize("exponent", [0, 1, 2])
+def test_zipf_weights(exponent):
+    weights = zipf_weights(1000, exponent, np.random.default_rng(5))
+    assert np.allclose(np.sort(weights)[::-1], 1.0 / np.arange(1, 1001) ** exponent)
+
+def test_chunks_zipf_addresses():
+    addresses = pd.concat([ADDRESSES] * 100, ignore_index=True)
+    addresses["HS_STEVILKA"] = np.arange(len(addresses))
+    generated = list(generate_customer_data_chunks(None, 20000, 42, 5000, addresses=addresses, all_names=NAMES,
+                                                   all_surnames=SURNAMES, zipf_exponent=1.2))
+    counts = pd.concat(generated)["HOUSE_NUMBER"].value_counts()
+    # Uniform sampling would give about 67 records per address
+    assert counts.iloc[0] > 2000
+    # The same addresses are popular in every chunk
+    assert len({chunk["HOUSE_NUMBER"].value_counts().index[0] for chunk in generated}) == 1
+
+@pytest.mark.parametrize("duplicate_rate", [0.1, 0.5])
+def test_chunks_duplicate_customers(duplicate_rate):
+    generated = pd.concat(chunks(20000, 10000, duplicate_rate=duplicate_rate))
+    duplicated = generated.drop(columns="CUSTOMER_ID").duplicated()
+    assert duplicate_rate - 0.02 < duplicated.mean() < duplicate_rate + 0.02
+    assert generated["CUSTOMER_ID"].is_unique
+
+def test_chunks_default_options_unchanged():
+    pd.testing.assert_frame_equal(pd.concat(chunks(2500, 1000)),
+                                  pd.concat(chunks(2500, 1000, zipf_exponent=None, duplicate_rate=0.0)))
+
+def test_duplicate_customers():
+    customer_df = next(chunks(100, 100))
+    duplicates = duplicate_customers(customer_df.copy(), 1.0, np.random.default_rng(0))
+    pd.testing.assert_frame_equal(duplicates, customer_df)
+
+def test_generate_slo_phone_numbers():
+    phones = pd.Series(generate_slo_phone_numbers(10000, np.random.default_rng(1)))
+    assert phones.str.fullmatch(r"00386(1\d{7}|(30|31|40|41|51|64|65|68|70)\d{6})").all()
+    assert phones.nunique() > 9000
+
+def test_clean_email_names():
+    assert list(clean_email_names(["Špela", "Janez Marko", None, "Špela"])) == ["spela", "janezmarko", "", "spela"]
+
+def test_generate_random_emails():
+    first_names = ["Špela", "Janez Marko"] * 5000
+    last_names = ["Kovačič", "Novak"] * 5000
+    emails = pd.Series(generate_random_emails(first_names, last_names, np.random.default_rng(1)))
+    local, domain = emails.str.split("@").str[0], emails.str.split("@").str[1]
+    assert local.str.fullmatch(r"(spela\.kovacic|spelakovacic|s\.kovacic|janezmarko\.novak|janezmarkonovak|j\.novak)\d{0,2}").all()
+    assert set(domain) == set(EMAIL_DOMAINS)
+    assert 0.35 < domain.eq("gmail.com").mean() < 0.45
+    assert 0.25 < local.str.contains(r"\d").mean() < 0.35
+    # Formats are drawn per row, not reset by a seed on every call
+    assert local.str.replace(r"\d", "", regex=True).nunique() == 6
+
+@pytest.mark.parametrize("weights", [[0.5, 0.3, 0.2], [900, 0, 5, 300, 1000], [1], [0, 0, 1, np.nan]])
+def test_alias_sampling_matches_weights(weights):
+    weights = np.nan_to_num(np.asarray(weights, dtype=float))
+    draws = sample_alias(build_alias_table(weights), 200000, np.random.default_rng(3))
+    shares = np.bincount(draws, minlength=len(weights)) / len(draws)
+    assert np.allclose(shares, weights / weights.sum(), atol=0.005)
+    assert shares[weights == 0].sum() == 0
+
+def test_alias_table_needs_positive_weight():
+    with pytest.raises(ValueError):
+        build_alias_table([0, 0])
+
+def test_calculate_frequencies():
+    df = calculate_frequencies(pd.DataFrame({"value": ["Ana", "Janez", "Luka"], "count": [3, None, 1]}))
+    assert list(df["frequency"]) == [0.75, 0, 0.25]
+
+def test_load_SURS_snapshot(tmp_path):
+    names_path, surnames_path = tmp_path / "names.csv", tmp_path / "surnames.csv"
+    pd.DataFrame({"value": ["Ana", "Nan"], "count": [3, 1]}).to_csv(names_path, index=False)
+    pd.DataFrame({"value": ["Novak", "NA"], "count": [1, None]}).to_csv(surnames_path, index=False)
+    all_names, all_surnames = load_SURS_snapshot(str(names_path), str(surnames_path))
+    assert list(all_names["value"]) == ["Ana", "Nan"]
+    assert list(all_names["frequency"]) == [0.75, 0.25]
+    assert list(all_surnames["value"]) == ["Novak", "NA"]
+    assert list(all_surnames["frequency"]) == [1, 0]
@@ -0,0 +1,69 @@
+import pytest
+import numpy as np
+import pandas as pd
+from utils.data_io import data_format, read_data, iter_data, write_data
+
+def sample_data():
+    return pd.DataFrame({
+        "CUSTOMER_ID": np.arange(1, 8),
+        "FIRST_NAME": ["Ana", "Bojan", "Cene", None, "Eva", "Filip", "Gal"],
+        "EMAIL": [f"user{i}@gmail.com" for i in range(7)],
+    })
+
+@pytest.mark.parametrize("path, expected", [
+    ("data.parquet", "parquet"),
+    ("src/cache/data.CSV", "csv"),
+    ("data.feather", "feather"),
+    ("data.arrow", "feather"),
+    ("data.xlsx", "excel"),
+])
+def test_data_format(path, expected):
+    assert data_format(path) == expected
+
+@pytest.mark.parametrize("path", ["data.json", "data.xls"])
+def test_data_format_unsupported(path):
+    with pytest.raises(ValueError):
+        data_format(path)
+
+@pytest.mark.parametrize("extension", [".parquet", ".csv", ".feather", ".xlsx"])
+def test_write_and_read_data(tmp_path, extension):
+    path = str(tmp_path / f"data{extension}")
+    df = sample_data()
+    assert write_data(df, path) == path
+
+    result = read_data(path)
+    assert result["CUSTOMER_ID"].tolist() == df["CUSTOMER_ID"].tolist()
+    assert result["FIRST_NAME"].isna().tolist() == df["FIRST_NAME"].isna().tolist()
+    assert list(read_data(path, columns=["CUSTOMER_ID", "EMAIL"]).columns) == ["CUSTOMER_ID", "EMAIL"]
+
+@pytest.mark.parametrize("extension", [".parquet", ".csv", ".feather", ".xlsx"])
+@pytest.mark.parametrize("chunk_size", [1, 3, 10])
+def test_iter_data(tmp_path, extension, chunk_size):
+    path = str(tmp_path / f"data{extension}")
+    df = sample_data()
+    write_data(df, path)
+
+    chunks = list(iter_data(path, chunk_size=chunk_size, columns=["EMAIL", "CUSTOMER_ID"]))
+    assert [len(chunk) for chunk in chunks] == [min(chunk_size, len(df) - start) for start in range(0, len(df), chunk_size)]
+    result = pd.concat(chunks)
+    assert list(result.columns) == ["EMAIL", "CUSTOMER_ID"]
+    assert list(result.index) == list(range(len(df)))
+    assert result["EMAIL"].tolist() == df["EMAIL"].tolist()
+    assert result["CUSTOMER_ID"].tolist() == df["CUSTOMER_ID"].tolist()
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 10])
+def test_iter_data_feather_record_batches(tmp_path, chunk_size):
+    # Record batches of 2 rows, so chunks span several batches
+    path = str(tmp_path / "data.feather")
+    df = sample_data()
+    write_data(df, path, chunksize=2)
+
+    chunks = list(iter_data(path, chunk_size=chunk_size, columns=["EMAIL", "CUSTOMER_ID"]))
+    assert [len(chunk) for chunk in chunks] == [min(chunk_size, len(df) - start) for start in range(0, len(df), chunk_size)]
+    pd.testing.assert_frame_equal(pd.concat(chunks), df[["EMAIL", "CUSTOMER_ID"]])
+
+@pytest.mark.parametrize("extension", [".parquet", ".csv", ".feather", ".xlsx"])
+def test_read_data_column_order(tmp_path, extension):
+    path = str(tmp_path / f"data{extension}")
+    write_data(sample_data(), path)
+    assert list(read_data(path, columns=["EMAIL", "CUSTOMER_ID"]).columns) == ["EMAIL", "CUSTOMER_ID"]
@@ -0,0 +1,118 @@
+import pytest
+import pandas as pd
+import correction.address_correction as address_correction
+import correction.names_correction as names_correction
+from correction.address_correction import correct_address
+from correction.names_correction import correct_names
+from correction.diacritic_restoration import build_diacritic_index, build_diacritic_indexes, restore_diacritics, restore_diacritics_series
+from pipelines.address_pipeline import run_address_pipeline, build_address_indexes
+from pipelines.names_pipeline import run_name_pipeline, build_name_indexes
+from validation.names_validation import validate_names
+
+GURS_DF = pd.DataFrame({
+    "ULICA_NAZIV": ["Šmartinska cesta", "Šmartinska cesta", "Čopova ulica", "Tržaška cesta"],
+    "POSTNI_OKOLIS_NAZIV": ["Ljubljana", "Ljubljana", "Ljubljana", "Škofja Loka"],
+})
+ALL_NAMES = pd.DataFrame({"value": ["Matevž", "Matevź", "Ana"], "count": [800, 2, 5000]})
+ALL_SURNAMES = pd.DataFrame({"value": ["Kovačič", "Kovacic", "Kovačić", "Novak", "Šarc", "Sarc"], "count": [900, 5, 300, 1000, 40, 20]})
+INDEXES = build_diacritic_indexes(GURS_DF, all_names=ALL_NAMES, all_surnames=ALL_SURNAMES)
+
+@pytest.mark.parametrize("value, index_name, expected", [
+    ("Smartinska cesta", "street", "Šmartinska cesta"),
+    ("Copova ulica", "street", "Čopova ulica"),
+    ("TRZASKA CESTA", "street", "TRŽAŠKA CESTA"),
+    ("Skofja Loka", "city", "Škofja Loka"),
+    ("Matevz", "first_name", "Matevž"),        # most frequent form wins
+])
+def test_restore_diacritics(value, index_name, expected):
+    assert restore_diacritics(value, INDEXES[index_name]) == expected
+
+@pytest.mark.parametrize("value, index_name", [
+    ("Šmartinska cesta", "street"),     # already has diacritics
+    ("Ljubljana", "city"),              # canonical form has no diacritics
+    ("Unknown street", "street"),
+    ("Novak", "last_name"),
+    ("Kovacic", "last_name"),           # the ASCII form is a valid surname itself
+    ("SARC", "last_name"),              # also in another letter case
+    (None, "city"),
+])
+def test_restore_diacritics_nothing_to_restore(value, index_name):
+    assert restore_diacritics(value, INDEXES[index_name]) is None
+
+def test_build_diacritic_index_ranks_forms_by_frequency():
+    index = build_diacritic_index(ALL_SURNAMES["value"], ALL_SURNAMES["count"])
+    assert index["forms"]["KOVACIC"] == [("Kovačič", 900), ("Kovačić", 300), ("Kovacic", 5)]
+
+def test_restore_diacritics_series():
+    cities = pd.Series(["Skofja Loka", None, "Ljubljana", "Skofja Loka"], index=[5, 6, 7, 8])
+    restored = restore_diacritics_series(cities, INDEXES["city"])
+    assert list(restored.index) == [5, 6, 7, 8]
+    assert list(restored) == ["Škofja Loka", None, None, "Škofja Loka"]
+
+def enable_correction(monkeypatch, module, codes):
+    for code in codes:
+        monkeypatch.setitem(module.error_config, code, {**module.error_config[code], "correct": True})
+
+def test_build_diacritic_index_keeps_valid_ascii_forms():
+    index = build_diacritic_index(pd.Series(["ŠARC", "SARC"]))
+    assert restore_diacritics("SARC", index) is None
+
+def test_correct_address_restores_diacritics(monkeypatch):
+    enable_correction(monkeypatch, address_correction, ["4114", "4408"])
+    result = correct_address("Smartinska cesta", "1", "1000", "Skofja Loka", {"4114"}, set(), set(), {"4408"}, diacritic_indexes=INDEXES)
+    assert result[0:3] == ("Šmartinska cesta", ["4114"], [])
+    assert result[9:12] == ("Škofja Loka", ["4408"], [])
+
+def test_correct_address_keeps_undetected_diacritics(monkeypatch):
+    enable_correction(monkeypatch, address_correction, ["4114", "4408"])
+    result = correct_address("Smartinska cesta", "1", "1000", "Skofja Loka", set(), set(), set(), set(), diacritic_indexes=INDEXES)
+    assert result[0:3] == (None, [], [])
+    assert result[9:12] == (None, [], [])
+
+def test_correct_names_restores_diacritics(monkeypatch):
+    enable_correction(monkeypatch, names_correction, ["1108", "1206"])
+    result = correct_names("Matevz", "Sarc", {"1108"}, {"1206"}, diacritic_indexes=INDEXES)
+    # Sarc is a valid surname, so 1206 stays uncorrected
+    assert result == ("Matevž", ["1108"], [], None, [], ["1206"])
+
+def test_correct_names_keeps_undetected_diacritics(monkeypatch):
+    enable_correction(monkeypatch, names_correction, ["1108", "1206"])
+    result = correct_names("Matevz", "Kovacic", set(), set(), diacritic_indexes=INDEXES)
+    assert result == (None, [], [], None, [], [])
+
+PIPELINE_GURS_DF = pd.DataFrame({
+    "ULICA_NAZIV": ["Šmartinska cesta", "Glavni trg"],
+    "HS_STEVILKA": ["5", "3"],
+    "HS_DODATEK": ["", ""],
+    "POSTNI_OKOLIS_SIFRA": ["1000", "5290"],
+    "POSTNI_OKOLIS_NAZIV": ["Ljubljana", "Šempeter pri Gorici"],
+    "GURS_FULL_ADDRESS": ["Šmartinska cesta 5, 1000 Ljubljana", "Glavni trg 3, 5290 Šempeter pri Gorici"],
+})
+
+def test_address_pipeline_restores_folded_city():
+    df = pd.DataFrame({
+        "STREET": ["Glavni trg", "Smartinska cesta"],
+        "HOUSE_NUMBER": ["3", "5"],
+        "POSTAL_CODE": ["5290", "1000"],
+        "POSTAL_CITY": ["Sempeter pri Gorici", "Ljubljana"],
+    })
+    result = run_address_pipeline(df, "STREET", "HOUSE_NUMBER", "POSTAL_CODE", "POSTAL_CITY",
+                                  **build_address_indexes(PIPELINE_GURS_DF, component_index=False, postal_city_mapping=False,
+                                                          suggestion_index=False))
+    assert list(result["POSTAL_CITY_CORRECTED"]) == ["Šempeter pri Gorici", None]
+    assert list(result["STREET_CORRECTED"]) == [None, "Šmartinska cesta"]
+    assert list(result["POSTAL_CITY_DETECTED_ERRORS"]) == [["4408"], []]
+    assert list(result["FULL_ADDRESS_STATUS"]) == ["CORRECTED", "CORRECTED"]
+
+def test_name_pipeline_restores_folded_name(monkeypatch):
+    all_names = ALL_NAMES.assign(frequency=ALL_NAMES["count"] / ALL_NAMES["count"].sum())
+    all_surnames = ALL_SURNAMES.assign(frequency=ALL_SURNAMES["count"] / ALL_SURNAMES["count"].sum())
+    monkeypatch.setattr(validate_names, "all_names", all_names, raising=False)
+    monkeypatch.setattr(validate_names, "all_surnames", all_surnames, raising=False)
+    df = pd.DataFrame({"FIRST_NAME": ["Matevz", "Ana"], "LAST_NAME": ["Novak", "Kovacic"]})
+    result = run_name_pipeline(df, "FIRST_NAME", "LAST_NAME",
+                               **build_name_indexes(all_names, all_surnames, name_suggestion_indexes=False))
+    assert list(result["FIRST_NAME_CORRECTED"]) == ["Matevž", None]
+    assert list(result["FIRST_NAME_STATUS"]) == ["CORRECTED", "VALID"]
+    # Kovacic is a valid surname itself, so it is not flagged
+    assert list(result["LAST_NAME_DETECTED_ERRORS"]) == [[], []]
@@ -0,0 +1,117 @@
+import pytest
+import numpy as np
+import pandas as pd
+from utils.evaluation_utils import (FIELDS, code_counts, status_table, parse_errors, error_code_matrix, render_code_matrix, build_error_matrices,
+                                    error_code_counts, field_error_summary, has_errors_flags,
+                                    dimension_incidence_matrix, dimension_totals, dimension_totals_from_chunks, dimension_summary)
+
+def evaluation_data():
+    df = pd.DataFrame({
+        "INTRODUCED_ERRORS": ["1101, 2102", "", None, "4101, 4102"],
+        "EMAIL_INTRO_ERRORS": ["2102", "", "", ""],
+        "EMAIL_DETECTED_ERRORS": [{"2102"}, set(), [], np.array(["4101"], dtype=object)],
+        "EMAIL_CORRECTED_ERRORS": [["2102"], [], set(), np.array([], dtype=object)],
+        "STREET_INTRO_ERRORS": ["", "", "", "4101, 4102"],
+        "STREET_DETECTED_ERRORS": [set(), {"4102", "4101"}, set(), set()],
+        "STREET_CORRECTED_ERRORS": [set(), {"4101"}, set(), set()],
+    })
+    return df
+
+@pytest.mark.parametrize("value, expected", [
+    ("1101, 2102", {"1101", "2102"}),
+    ("{'4101', '4102'}", {"4101", "4102"}),
+    ("['3101']", {"3101"}),
+    ("set()", set()),
+    ("", set()),
+    (None, set()),
+    (np.nan, set()),
+    ({"1101"}, {"1101"}),
+    (np.array(["2101", "2102"]), {"2101", "2102"}),
+])
+def test_parse_errors(value, expected):
+    assert parse_errors(value) == expected
+
+def test_error_code_matrix():
+    matrix, codes = error_code_matrix(pd.Series(["1102, 1101", {"2101"}, [], None, np.array(["1101"])], index=[5, 3, 9, 1, 0]))
+    assert codes == ["1101", "1102", "2101"]
+    assert matrix.tolist() == [[True, True, False], [False, False, True], [False] * 3, [False] * 3, [True, False, False]]
+    matrix, codes = error_code_matrix(pd.Series(["1101"]), codes=["1101", "4101"])
+    assert matrix.tolist() == [[True, False]]
+    assert error_code_matrix(pd.Series([], dtype=object))[0].shape == (0, 0)
+
+def test_render_code_matrix():
+    matrix = np.array([[True, False, True], [False, False, False], [True, False, True]])
+    assert list(render_code_matrix(matrix, ["1101", "1102", "2101"])) == ["1101, 2101", "", "1101, 2101"]
+
+def test_build_error_matrices():
+    matrices = build_error_matrices(evaluation_data())
+    assert matrices["codes"] == ["1101", "2102", "4101", "4102"]
+    assert list(render_code_matrix(matrices["detected"], matrices["codes"])) == ["2102", "4101, 4102", "", "4101"]
+    assert list(render_code_matrix(matrices["corrected"], matrices["codes"])) == ["2102", "4101", "", ""]
+    assert set(matrices["fields"]) == set(FIELDS)
+    # Fields without columns get empty matrices
+    assert not matrices["fields"]["PHONE_NUMBER"]["detected"].any()
+    assert matrices["fields"]["STREET"]["introduced"].sum() == 2
+
+def test_error_code_counts():
+    counts = error_code_counts(build_error_matrices(evaluation_data()))
+    assert list(counts.index) == ["1101", "2102", "4101", "4102"]
+    assert counts.loc["4101", ["Introduced", "Detected", "Corrected"]].tolist() == [1, 2, 1]
+    assert counts.loc["2102", "Detection Rate (%)"] == 100
+
+def test_field_error_summary():
+    summary = field_error_summary(build_error_matrices(evaluation_data()))
+    assert list(summary.index) == FIELDS
+    assert summary.loc["STREET", ["Introduced Errors", "Detected Errors", "Corrected Errors"]].tolist() == [2, 2, 1]
+    assert summary.loc["STREET", "Correction Rate (%)"] == 50
+    assert summary.loc["EMAIL", "Rows with Detected Errors"] == 2
+
+def test_has_errors_flags():
+    matrices = build_error_matrices(evaluation_data())
+    flags = has_errors_flags(matrices["introduced"], matrices["detected"], matrices["corrected"])
+    assert flags["has_introduced"].tolist() == [True, False, False, True]
+    assert flags["has_detected"].tolist() == [True, True, False, True]
+    assert flags["has_corrected"].tolist() == [True, False, False, False]
+    assert flags["has_detected_errors"].tolist() == [False, True, False, False]
+    assert flags["has_corrected_errors"].tolist() == [False, True, False, False]
+
+ERROR_CONFIG = {
+    "1101": {"dq_dimension": "Completeness"},
+    "2102": {"dq_dimension": "Validity"},
+    "4101": {"dq_dimension": "Validity"},
+    "4102": {"dq_dimension": float("nan")},
+    "9999": {"dq_dimension": "Accuracy"},
+}
+
+def test_dimension_incidence_matrix():
+    incidence, dimensions = dimension_incidence_matrix(ERROR_CONFIG, ["1101", "2102", "4101", "4102", "5555"])
+    assert dimensions == ["Accuracy", "Completeness", "Validity"]
+    assert incidence.tolist() == [[0, 1, 0], [0, 0, 1], [0, 0, 1], [0, 0, 0], [0, 0, 0]]
+
+def test_dimension_totals():
+    matrices = build_error_matrices(evaluation_data())
+    incidence, dimensions = dimension_incidence_matrix(ERROR_CONFIG, matrices["codes"])
+    totals = dimension_totals(code_counts(matrices), incidence, dimensions)
+    assert totals.loc["Completeness"].tolist() == [1, 0, 0]
+    assert totals.loc["Validity"].tolist() == [2, 3, 2]
+    assert totals.loc["Accuracy"].tolist() == [0, 0, 0]
+
+    summary = dimension_summary(totals)
+    assert list(summary.index) == ["Validity", "Completeness"]
+    assert summary.loc["Validity", "Detection Rate (%)"] == 150
+    assert summary.loc["Validity", "Correction Rate (%)"] == 100
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 4])
+def test_dimension_totals_from_chunks(chunk_size):
+    df = evaluation_data()
+    matrices = build_error_matrices(df)
+    incidence, dimensions = dimension_incidence_matrix(ERROR_CONFIG, matrices["codes"])
+    chunks = (df.iloc[start:start + chunk_size] for start in range(0, len(df), chunk_size))
+    pd.testing.assert_frame_equal(dimension_totals_from_chunks(chunks, ERROR_CONFIG),
+                                  dimension_totals(code_counts(matrices), incidence, dimensions))
+
+def test_status_table():
+    table = status_table({"EMAIL_STATUS": {"VALID": 3, "CORRECTED": 1}, "OVERALL_STATUS": pd.Series({"VALID": 2, "MISSING DATA": 2})})
+    assert list(table.columns) == ["OVERALL_STATUS", "EMAIL_STATUS"]
+    assert table.loc["MISSING DATA"].tolist() == [2, 0]
+    assert table.loc["CORRECTED"].tolist() == [0, 1]
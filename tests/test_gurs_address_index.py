@@ -0,0 +1,67 @@
+import pytest
+import pandas as pd
+import pipelines.address_pipeline as address_pipeline
+from pipelines.address_pipeline import build_address_indexes
+from validation.address_validation import validate_full_address
+from validation.gurs_address_index import (build_gurs_address_index, save_gurs_address_index, load_gurs_address_index,
+                                           gurs_address_index_size, validate_full_address_in_index, validate_full_addresses_in_index)
+
+GURS_ADDRESSES = {
+    "Trubarjeva ulica 7, 1000 Ljubljana",
+    "Trubarjeva ulica 71, 1000 Ljubljana",
+    "Šmartinska cesta 5, 1000 Ljubljana",
+    "Glavni trg 3, 2000 Maribor",
+    "Ul 1, 3000 Celje",
+}
+INDEX = build_gurs_address_index(GURS_ADDRESSES)
+
+QUERIES = [
+    "Trubarjeva ulica 7, 1000 Ljubljana",
+    "Trubarjeva ulica 71, 1000 Ljubljana",
+    "Trubarjeva ulica 8, 1000 Ljubljana",
+    " Šmartinska  cesta 5, 1000 Ljubljana",
+    "Glavni trg 3, 2000 Maribor",
+    "Ul 1, 3000 Celje",
+    "Ul",
+    "Zzz",
+    "",
+    None,
+]
+
+def test_index_size():
+    assert gurs_address_index_size(INDEX) == len(GURS_ADDRESSES)
+
+@pytest.mark.parametrize("full_address", QUERIES)
+def test_validate_full_address_in_index_matches_set(full_address):
+    assert validate_full_address_in_index(full_address, INDEX) == validate_full_address(full_address, GURS_ADDRESSES)
+
+def test_validate_full_addresses_in_index_batch():
+    full_addresses = pd.Series(QUERIES, index=range(100, 100 + len(QUERIES)))
+    result = validate_full_addresses_in_index(full_addresses, INDEX)
+    assert list(result.index) == list(full_addresses.index)
+    assert list(result) == [validate_full_address(address, GURS_ADDRESSES) for address in QUERIES]
+
+def test_index_memory_mapped_roundtrip(tmp_path):
+    save_gurs_address_index(INDEX, str(tmp_path))
+    index = load_gurs_address_index(str(tmp_path))
+    assert [validate_full_address_in_index(address, index) for address in QUERIES] == \
+           [validate_full_address_in_index(address, INDEX) for address in QUERIES]
+
+def test_empty_index():
+    index = build_gurs_address_index(set())
+    assert validate_full_address_in_index("Glavni trg 3, 2000 Maribor", index) is False
+
+def test_address_pipeline_reuses_prebuilt_hashes(monkeypatch):
+    gurs_df = pd.DataFrame({"GURS_FULL_ADDRESS": sorted(GURS_ADDRESSES)})
+    indexes = build_address_indexes(gurs_df, component_index=False, postal_city_mapping=False,
+                                    diacritic_indexes=False, suggestion_index=False)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("GURS addresses hashed again")
+    monkeypatch.setattr(address_pipeline, "build_gurs_address_set", fail)
+    monkeypatch.setattr(address_pipeline, "build_gurs_address_hashes", fail)
+
+    df = pd.DataFrame({"STREET": ["Glavni trg", "Glavni trg"], "HOUSE_NUMBER": ["3", "4"],
+                       "POSTAL_CODE": ["2000", "2000"], "POSTAL_CITY": ["Maribor", "Maribor"]})
+    result = address_pipeline.run_address_pipeline(df, "STREET", "HOUSE_NUMBER", "POSTAL_CODE", "POSTAL_CITY", **indexes)
+    assert list(result["FULL_ADDRESS_VALID"]) == [True, False]
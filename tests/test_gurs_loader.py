@@ -0,0 +1,90 @@
+import pytest
+import os
+import pandas as pd
+from utils.gurs_loader import gurs_cache_path, load_gurs_register
+from utils.customer_data_generator import fetch_GURS_data
+from validation import address_validation
+from validation.address_validation import load_gurs_dataframe
+
+GURS_CSV = """EID_NASLOV,OBCINA_NAZIV,NASELJE_NAZIV,ULICA_NAZIV,HS_STEVILKA,HS_DODATEK,ST_STANOVANJA,POSTNI_OKOLIS_SIFRA,POSTNI_OKOLIS_NAZIV,D96_E
+11,Ljubljana,Ljubljana,Trubarjeva ulica,7,,,1000,Ljubljana,461000.5
+12,Ljubljana,Ljubljana,Šmartinska cesta,5,a,12,1000,Ljubljana,462000.5
+13,Maribor,Maribor,,3,,,2000,Maribor,550000.5
+14,Lendava,Lendava,Glavna ulica,1,,,9220,Lendava - Lendva,610000.5
+"""
+
+@pytest.fixture
+def gurs_csv(tmp_path):
+    path = tmp_path / "RN_SLO_NASLOVI_test.csv"
+    path.write_text(GURS_CSV, encoding="utf-8")
+    return str(path)
+
+def test_load_gurs_register_dtypes(gurs_csv, tmp_path):
+    gurs_df = load_gurs_register(gurs_csv, cache_dir=str(tmp_path / "cache"))
+    assert "D96_E" not in gurs_df.columns
+    for column in ["EID_NASLOV", "HS_STEVILKA", "ST_STANOVANJA", "POSTNI_OKOLIS_SIFRA"]:
+        assert gurs_df[column].dtype == "Int64"
+    for column in ["ULICA_NAZIV", "HS_DODATEK", "POSTNI_OKOLIS_NAZIV"]:
+        assert gurs_df[column].dtype == object
+    assert gurs_df["ST_STANOVANJA"].isna().sum() == 3
+    assert gurs_df["HS_DODATEK"].isna().tolist() == [True, False, True, True]
+    assert gurs_df["ULICA_NAZIV"].isna().sum() == 1
+
+@pytest.mark.parametrize("columns", [None, ["ULICA_NAZIV", "HS_STEVILKA"], ["POSTNI_OKOLIS_SIFRA"]])
+def test_load_gurs_register_projection(gurs_csv, tmp_path, columns):
+    cache_dir = str(tmp_path / "cache")
+    first = load_gurs_register(gurs_csv, columns=columns, cache_dir=cache_dir)
+    second = load_gurs_register(gurs_csv, columns=columns, cache_dir=cache_dir)
+    if columns:
+        assert list(first.columns) == columns
+    pd.testing.assert_frame_equal(first, second)
+
+def test_load_gurs_register_reuses_cache(gurs_csv, tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    load_gurs_register(gurs_csv, cache_dir=cache_dir)
+    assert os.path.exists(gurs_cache_path(gurs_csv, cache_dir))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("CSV parsed again")
+    monkeypatch.setattr(pd, "read_csv", fail)
+    gurs_df = load_gurs_register(gurs_csv, columns=["ULICA_NAZIV"], cache_dir=cache_dir)
+    assert len(gurs_df) == 4
+
+def test_load_gurs_register_stale_cache(gurs_csv, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    load_gurs_register(gurs_csv, cache_dir=cache_dir)
+    cache_mtime = os.path.getmtime(gurs_cache_path(gurs_csv, cache_dir))
+    with open(gurs_csv, "a", encoding="utf-8") as f:
+        f.write("15,Koper,Koper,Ulica XY,2,,,6000,Koper - Capodistria,400000.5\n")
+    os.utime(gurs_csv, (cache_mtime + 10, cache_mtime + 10))
+    assert len(load_gurs_register(gurs_csv, cache_dir=cache_dir)) == 5
+
+def test_load_gurs_register_same_file_name(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    for folder, street in [("a", "Glavni trg"), ("b", "Prešernova ulica")]:
+        (tmp_path / folder).mkdir()
+        (tmp_path / folder / "gurs.csv").write_text(f"ULICA_NAZIV,HS_STEVILKA\n{street},3\n", encoding="utf-8")
+    first = load_gurs_register(str(tmp_path / "a" / "gurs.csv"), cache_dir=cache_dir)
+    second = load_gurs_register(str(tmp_path / "b" / "gurs.csv"), cache_dir=cache_dir)
+    assert first["ULICA_NAZIV"].tolist() == ["Glavni trg"]
+    assert second["ULICA_NAZIV"].tolist() == ["Prešernova ulica"]
+
+def test_load_gurs_register_missing_columns(tmp_path):
+    path = tmp_path / "gurs_small.csv"
+    path.write_text("ULICA_NAZIV,HS_STEVILKA\nGlavni trg,3\n", encoding="utf-8")
+    gurs_df = load_gurs_register(str(path), cache_dir=None)
+    assert list(gurs_df.columns) == ["ULICA_NAZIV", "HS_STEVILKA"]
+    assert not os.path.exists(tmp_path / "cache")
+
+def test_fetch_GURS_data(gurs_csv, tmp_path, monkeypatch):
+    monkeypatch.setattr(load_gurs_register, "__defaults__", (None, str(tmp_path / "cache")))
+    addresses = fetch_GURS_data(gurs_csv)
+    assert addresses["ULICA_NAZIV"].tolist() == ["Trubarjeva ulica", "Šmartinska cesta", "Glavna ulica"]
+    assert addresses["ST_STANOVANJA"].dtype == "Int64"
+
+def test_load_gurs_dataframe(gurs_csv, tmp_path, monkeypatch):
+    monkeypatch.setattr(load_gurs_register, "__defaults__", (None, str(tmp_path / "cache")))
+    gurs_df = load_gurs_dataframe(gurs_csv)
+    assert "Trubarjeva ulica 7, 1000 Ljubljana" in set(gurs_df["GURS_FULL_ADDRESS"])
+    assert "Šmartinska cesta 5A, 1000 Ljubljana" in set(gurs_df["GURS_FULL_ADDRESS"])
+    assert "Glavna ulica 1, 9220 Lendava" in set(gurs_df["GURS_FULL_ADDRESS"])
@@ -0,0 +1,58 @@
+import pytest
+import numpy as np
+from utils.metrics_utils import (confusion_counts, binary_metrics, classification_report_text, evaluate_performance,
+                                 evaluate_performance_batched)
+
+TRUE = np.array([1, 1, 1, 0, 0, 0, 0, 0, 1, 0], dtype=bool)
+PRED = np.array([1, 0, 1, 0, 1, 0, 0, 0, 1, 0], dtype=bool)
+
+# Output of sklearn.metrics.classification_report(TRUE, PRED, target_names=["No Error", "Error"])
+REPORT = """              precision    recall  f1-score   support
+
+    No Error       0.83      0.83      0.83         6
+       Error       0.75      0.75      0.75         4
+
+    accuracy                           0.80        10
+   macro avg       0.79      0.79      0.79        10
+weighted avg       0.80      0.80      0.80        10
+"""
+
+def test_confusion_counts():
+    assert confusion_counts(TRUE, PRED).tolist() == [[5, 1], [1, 3]]
+    # Missing classes still give a 2 x 2 matrix
+    assert confusion_counts([False, False], [False, False]).tolist() == [[2, 0], [0, 0]]
+
+def test_evaluate_performance():
+    accuracy, precision, recall, f1, cm, report = evaluate_performance(TRUE, PRED)
+    assert accuracy == pytest.approx(0.8)
+    assert precision == pytest.approx(0.75)
+    assert recall == pytest.approx(0.75)
+    assert f1 == pytest.approx(0.75)
+    assert cm.tolist() == [[5, 1], [1, 3]]
+    assert report == REPORT
+
+@pytest.mark.parametrize("true, pred, expected", [
+    ([0, 0, 1], [0, 0, 0], {"accuracy": 2 / 3, "precision": 0, "recall": 0, "f1": 0}),
+    ([0, 0, 0], [1, 0, 0], {"accuracy": 2 / 3, "precision": 0, "recall": 0, "f1": 0}),
+    ([1, 1, 0, 0, 1, 1, 1, 1], [1, 0, 1, 0, 0, 0, 0, 0], {"accuracy": 0.25, "precision": 0.5, "recall": 1 / 6, "f1": 0.25}),
+])
+def test_binary_metrics(true, pred, expected):
+    metrics = binary_metrics(confusion_counts(np.array(true, dtype=bool), np.array(pred, dtype=bool)))
+    assert metrics == pytest.approx(expected)
+
+def test_f1_rounding_matches_counts():
+    # F1 = 2 * 3 / (2 * 3 + 7 + 3) = 0.375 exactly, 2PR / (P + R) gives 0.37499...
+    cm = np.array([[10, 7], [3, 3]])
+    assert "0.38" in classification_report_text(cm).splitlines()[3]
+
+def test_evaluate_performance_batched():
+    rng = np.random.default_rng(0)
+    true_matrix = rng.random((1000, 5)) < 0.3
+    pred_matrix = rng.random((1000, 5)) < 0.4
+    results = evaluate_performance_batched(true_matrix, pred_matrix)
+    assert len(results) == 5
+    for column, result in enumerate(results):
+        expected = evaluate_performance(true_matrix[:, column], pred_matrix[:, column])
+        assert result[:4] == pytest.approx(expected[:4])
+        assert (result[4] == expected[4]).all()
+        assert result[5] == expected[5]
@@ -0,0 +1,75 @@
+import pytest
+import pandas as pd
+from correction.name_suggestion import (generate_deletes, build_name_suggestion_index, suggest_names, suggest_name,
+                                        suggest_name_series, name_suggestion_source_key, save_name_suggestion_indexes,
+                                        load_name_suggestion_indexes)
+from correction.names_correction import correct_names
+
+FIRST_NAMES = pd.DataFrame({
+    "value": ["Žiga", "Janez", "Jana", "Jan", "Ana", "Matjaž", "Maja"],
+    "frequency": [0.05, 0.30, 0.10, 0.15, 0.25, 0.10, 0.05],
+})
+LAST_NAMES = pd.DataFrame({
+    "value": ["Novak", "Horvat", "Kovačič", "Krajnc"],
+    "frequency": [0.4, 0.3, 0.2, 0.1],
+})
+FIRST_NAME_INDEX = build_name_suggestion_index(FIRST_NAMES)
+LAST_NAME_INDEX = build_name_suggestion_index(LAST_NAMES)
+
+def test_generate_deletes():
+    assert generate_deletes("ABC", 1) == {"ABC", "BC", "AC", "AB"}
+    assert generate_deletes("ABC", 2) == {"ABC", "BC", "AC", "AB", "A", "B", "C"}
+
+@pytest.mark.parametrize("name, expected_suggestion", [
+    ("Ziga", "Žiga"),        # diacritic loss
+    ("Jnaez", "Janez"),      # transposition
+    ("Matja", "Matjaž"),     # missing character and diacritic
+    ("Anna", "Ana"),         # extra character
+])
+def test_suggest_name(name, expected_suggestion):
+    assert suggest_name(name, FIRST_NAME_INDEX) == expected_suggestion
+
+@pytest.mark.parametrize("name", ["Janez", "Xyzqwerty", "", None])
+def test_suggest_name_no_suggestion(name):
+    assert suggest_name(name, FIRST_NAME_INDEX) is None
+
+def test_suggest_names_ranked_by_distance_then_frequency():
+    suggestions = suggest_names("Jana", FIRST_NAME_INDEX)
+    assert [suggestion for suggestion, _, _ in suggestions[:4]] == ["Jana", "Ana", "Jan", "Janez"]
+    assert all(distance <= 2 for _, distance, _ in suggestions)
+    assert "Jana" in FIRST_NAME_INDEX["cache"]
+
+def test_suggest_name_series():
+    names = pd.Series(["Ziga", None, "Janez", "Ziga"], index=[3, 4, 5, 6])
+    suggestions = suggest_name_series(names, FIRST_NAME_INDEX)
+    assert list(suggestions.index) == [3, 4, 5, 6]
+    assert list(suggestions) == ["Žiga", None, None, "Žiga"]
+
+def test_correct_names_does_not_apply_suggestions():
+    assert correct_names("Ziga", "Kovacic", set(), set()) == (None, [], [], None, [], [])
+
+def test_name_suggestion_indexes_persisted(tmp_path, capsys):
+    path = str(tmp_path / "name_suggestion_index.pkl")
+    source_key = name_suggestion_source_key(FIRST_NAMES, LAST_NAMES, 2)
+    save_name_suggestion_indexes({"first_name": FIRST_NAME_INDEX, "last_name": LAST_NAME_INDEX}, source_key, path)
+    indexes = load_name_suggestion_indexes(path, all_names=FIRST_NAMES, all_surnames=LAST_NAMES)
+    assert "loaded from cache" in capsys.readouterr().out
+    assert suggest_name("Novk", indexes["last_name"]) == "Novak"
+
+@pytest.mark.parametrize("all_surnames, max_distance", [
+    (pd.DataFrame({"value": ["Novak", "Horvat"], "frequency": [0.6, 0.4]}), 2),    # SURS data changed
+    (LAST_NAMES, 1),                                                                # other max_distance
+])
+def test_name_suggestion_indexes_rebuilt_when_source_changes(tmp_path, all_surnames, max_distance):
+    path = str(tmp_path / "name_suggestion_index.pkl")
+    load_name_suggestion_indexes(path, all_names=FIRST_NAMES, all_surnames=LAST_NAMES)
+    indexes = load_name_suggestion_indexes(path, max_distance, all_names=FIRST_NAMES, all_surnames=all_surnames)
+    assert indexes["last_name"]["max_distance"] == max_distance
+    assert set(indexes["last_name"]["words"]) == set(all_surnames["value"])
+
+def test_name_suggestion_indexes_not_cached_without_surs_data(tmp_path):
+    path = tmp_path / "name_suggestion_index.pkl"
+    empty = pd.DataFrame(columns=["value", "frequency"])
+    with pytest.raises(ValueError):
+        load_name_suggestion_indexes(str(path), all_names=FIRST_NAMES, all_surnames=empty)
+    assert not path.exists()
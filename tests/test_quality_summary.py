@@ -0,0 +1,91 @@
+import pytest
+import numpy as np
+import pandas as pd
+from utils.evaluation_utils import (FIELDS, build_error_matrices, error_code_counts, field_error_summary, has_errors_flags,
+                                    status_table, code_counts, dimension_incidence_matrix, dimension_totals, dimension_summary)
+from utils.metrics_utils import evaluate_performance
+from utils.quality_summary import (new_quality_summary, update_quality_summary, merge_quality_summaries, summarize_chunks,
+                                   summarize_parquet, quality_summary_reports)
+
+CODES = {"FIRST_NAME": ["1101", "1102"], "EMAIL": ["2101", "2103"], "STREET": ["4101", "4105"]}
+ERROR_CONFIG = {"1101": {"dq_dimension": "Completness"}, "1102": {"dq_dimension": "Validity"},
+                "2101": {"dq_dimension": "Completness"}, "2103": {"dq_dimension": "Validity"},
+                "4101": {"dq_dimension": "Completness"}, "4105": {"dq_dimension": "Accuracy"}}
+STATUSES = ["VALID", "CORRECTED", "MISSING DATA", "UNDETECTED ERRORS"]
+
+def processed_data(n, seed=0):
+    rng = np.random.default_rng(seed)
+    def errors(codes, probability):
+        return [set(code for code in codes if rng.random() < probability) for _ in range(n)]
+    df = pd.DataFrame({"CUSTOMER_ID": np.arange(n)})
+    introduced = []
+    for field, codes in CODES.items():
+        df[f"{field}_INTRO_ERRORS"] = [", ".join(sorted(errors)) for errors in errors(codes, 0.2)]
+        df[f"{field}_DETECTED_ERRORS"] = errors(codes, 0.2)
+        df[f"{field}_CORRECTED_ERRORS"] = [sorted(errors) for errors in errors(codes, 0.1)]
+        df[f"{field}_STATUS"] = rng.choice(STATUSES, n)
+        introduced.append(df[f"{field}_INTRO_ERRORS"])
+    df["INTRODUCED_ERRORS"] = pd.concat(introduced, axis=1).apply(lambda row: ", ".join(errors for errors in row if errors), axis=1)
+    df["OVERALL_STATUS"] = rng.choice(STATUSES[:3], n)
+    return df
+
+DF = processed_data(3000)
+
+def full_frame_reports(df):
+    matrices = build_error_matrices(df, list(CODES))
+    incidence, dimensions = dimension_incidence_matrix(ERROR_CONFIG, matrices["codes"])
+    flags = has_errors_flags(matrices["introduced"], matrices["detected"], matrices["corrected"])
+    return {
+        "error_comparison": error_code_counts(matrices),
+        "field_error_summary": field_error_summary(matrices),
+        "status_summary": status_table({col: df[col].value_counts() for col in df.columns if col.endswith("_STATUS")}),
+        "dq_summary": dimension_summary(dimension_totals(code_counts(matrices), incidence, dimensions)),
+        "detection": evaluate_performance(flags["has_introduced"], flags["has_detected"]),
+        "code_correction": evaluate_performance(flags["has_introduced"], flags["has_corrected_errors"]),
+    }
+
+def chunks(df, chunk_size):
+    return (df.iloc[start:start + chunk_size] for start in range(0, len(df), chunk_size))
+
+@pytest.mark.parametrize("chunk_size", [250, 1000, 3000])
+def test_streamed_reports_match_full_frame(chunk_size):
+    reports = quality_summary_reports(summarize_chunks(chunks(DF, chunk_size), list(CODES)), ERROR_CONFIG)
+    expected = full_frame_reports(DF)
+    for table in ("error_comparison", "field_error_summary", "status_summary", "dq_summary"):
+        pd.testing.assert_frame_equal(reports[table], expected[table], check_dtype=False)
+    for name in ("detection", "code_correction"):
+        assert reports["metrics"][name][:4] == pytest.approx(expected[name][:4])
+        assert (reports["metrics"][name][4] == expected[name][4]).all()
+        assert reports["metrics"][name][5] == expected[name][5]
+
+def test_merge_quality_summaries():
+    first = summarize_chunks(chunks(DF.iloc[:1200], 500), list(CODES))
+    second = summarize_chunks(chunks(DF.iloc[1200:], 500), list(CODES))
+    merged = merge_quality_summaries(first, second)
+    whole = summarize_chunks([DF], list(CODES))
+    assert merged["rows"] == whole["rows"] == len(DF)
+    assert merged["status_counts"] == whole["status_counts"]
+    assert merged["code_counts"] == whole["code_counts"]
+    assert merged["field_counts"] == whole["field_counts"]
+    assert merged["confusion"].keys() == whole["confusion"].keys()
+    assert all((merged["confusion"][name] == whole["confusion"][name]).all() for name in whole["confusion"])
+    # Merging does not change the merged summaries
+    assert first["rows"] == 1200
+
+def test_empty_summary():
+    summary = new_quality_summary()
+    assert merge_quality_summaries(summary, summary)["rows"] == 0
+    update_quality_summary(summary, DF.iloc[:0], list(CODES))
+    assert summary["code_counts"]["introduced"] == {}
+    assert summary["confusion"]["detection"].tolist() == [[0, 0], [0, 0]]
+
+def test_summarize_parquet(tmp_path):
+    path = tmp_path / "final_customer_data.parquet"
+    df = DF.copy()
+    for field in CODES:
+        df[f"{field}_DETECTED_ERRORS"] = df[f"{field}_DETECTED_ERRORS"].map(sorted)
+    df.to_parquet(path, index=False)
+    streamed = quality_summary_reports(summarize_parquet(str(path), batch_size=700, fields=list(CODES)), ERROR_CONFIG)
+    in_memory = quality_summary_reports(summarize_chunks([DF], list(CODES)), ERROR_CONFIG)
+    for table in ("error_comparison", "field_error_summary", "status_summary", "dq_summary"):
+        pd.testing.assert_frame_equal(streamed[table], in_memory[table])
@@ -0,0 +1,74 @@
+import pytest
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+from utils.report_writer import (REPORT_SHEETS, escape_excel_formulas, serialize_error_columns, report_sheet_columns,
+                                 write_excel_report, write_report)
+
+def report_data():
+    return pd.DataFrame({
+        "CUSTOMER_ID": [1, 2, 3],
+        "FIRST_NAME": ["=SUM(A1)", "Ana", None],
+        "FIRST_NAME_VALID": pd.Series([True, None, False], dtype=object),
+        "FIRST_NAME_DETECTED_ERRORS": [{"1102", "1101"}, set(), ["2101"]],
+        "FIRST_NAME_STATUS": ["CORRECTED", "VALID", "MISSING DATA"],
+        "EMAIL": ["a@b.si", "=1+1", np.nan],
+        "EMAIL_STATUS": ["VALID", "INVALID", "MISSING DATA"],
+        "INTRODUCED_ERRORS": ["1101, 1102", "", "2101"],
+        "OVERALL_STATUS": ["CORRECTED", "INVALID", "MISSING DATA"],
+    })
+
+def test_escape_excel_formulas():
+    df = report_data()
+    escaped = escape_excel_formulas(df)
+    assert escaped["FIRST_NAME"].tolist()[:2] == ["'=SUM(A1)", "Ana"]
+    assert escaped["EMAIL"].tolist()[:2] == ["a@b.si", "'=1+1"]
+    assert escaped["FIRST_NAME_VALID"].tolist() == [True, None, False]
+    # The input is not changed
+    assert df.loc[0, "FIRST_NAME"] == "=SUM(A1)"
+    assert df.loc[1, "EMAIL"] == "=1+1"
+
+def test_serialize_error_columns():
+    df = report_data()
+    serialized = serialize_error_columns(df)
+    assert df.loc[0, "FIRST_NAME_DETECTED_ERRORS"] == {"1102", "1101"}
+    assert serialized["FIRST_NAME_DETECTED_ERRORS"].tolist() == ["1101, 1102", "", "2101"]
+    assert serialized["INTRODUCED_ERRORS"].tolist() == ["1101, 1102", "", "2101"]
+
+@pytest.mark.parametrize("sheet, expected", [
+    ("Overview", ["CUSTOMER_ID", "FIRST_NAME_STATUS", "EMAIL_STATUS", "OVERALL_STATUS"]),
+    ("First name", ["CUSTOMER_ID", "FIRST_NAME", "FIRST_NAME_VALID", "FIRST_NAME_DETECTED_ERRORS", "FIRST_NAME_STATUS"]),
+    ("Email", ["CUSTOMER_ID", "EMAIL", "EMAIL_STATUS"]),
+    ("Street", ["CUSTOMER_ID"]),
+])
+def test_report_sheet_columns(sheet, expected):
+    spec = {name: spec for name, *spec in REPORT_SHEETS}[sheet]
+    assert report_sheet_columns(list(report_data().columns), *spec) == expected
+
+@pytest.mark.parametrize("write_rows", [1, 2, 10_000])
+def test_write_excel_report(tmp_path, monkeypatch, write_rows):
+    # Small sheet limit, so the long sheet continues on a second sheet
+    monkeypatch.setattr("utils.report_writer.EXCEL_MAX_ROWS", 2)
+    monkeypatch.setattr("utils.report_writer.EXCEL_WRITE_ROWS", write_rows)
+    path = str(tmp_path / "report.xlsx")
+    write_report(report_data(), path, sheets=[("Email", ["CUSTOMER_ID"], ("EMAIL",), []), ("Overview", ["CUSTOMER_ID"], (), [])])
+
+    workbook = load_workbook(path)
+    assert workbook.sheetnames == ["Email", "Email (2)", "Overview", "Overview (2)"]
+    rows = [list(row) for row in workbook["Email"].iter_rows(values_only=True)]
+    assert rows == [["CUSTOMER_ID", "EMAIL", "EMAIL_STATUS"], [1, "a@b.si", "VALID"], [2, "'=1+1", "INVALID"]]
+    rows = [list(row) for row in workbook["Email (2)"].iter_rows(values_only=True)]
+    assert rows == [["CUSTOMER_ID", "EMAIL", "EMAIL_STATUS"], [3, None, "MISSING DATA"]]
+
+@pytest.mark.parametrize("extension", [".parquet", ".csv"])
+def test_write_report_fast_formats(tmp_path, extension):
+    path = str(tmp_path / f"report{extension}")
+    write_report(report_data(), path)
+    result = pd.read_parquet(path) if extension == ".parquet" else pd.read_csv(path, keep_default_na=False)
+    assert list(result.columns) == list(report_data().columns)
+    assert result["FIRST_NAME_DETECTED_ERRORS"].tolist() == ["1101, 1102", "", "2101"]
+    assert result.loc[0, "FIRST_NAME"] == ("=SUM(A1)" if extension == ".parquet" else "'=SUM(A1)")
+
+def test_write_report_unsupported_format(tmp_path):
+    with pytest.raises(ValueError):
+        write_report(report_data(), str(tmp_path / "report.json"))
@@ -0,0 +1,50 @@
+import json
+import pytest
+import pandas as pd
+from utils.stage_timing import start_stage_timer, record_stage, stage_timings_summary, stage_timings_json, stage_timings_table
+
+def collect_timings():
+    timings = []
+    for pipeline, rows in (("names", 10), ("email", 10)):
+        timer = start_stage_timer(timings, pipeline, rows)
+        for stage in ("validate", "detect", "status"):
+            sum(range(10_000))
+            record_stage(timer, stage)
+    return timings
+
+def test_record_stage():
+    timings = collect_timings()
+    assert [(timing["pipeline"], timing["stage"]) for timing in timings] == [
+        ("names", "validate"), ("names", "detect"), ("names", "status"),
+        ("email", "validate"), ("email", "detect"), ("email", "status"),
+    ]
+    assert all(timing["rows"] == 10 for timing in timings)
+    assert all(timing["wall_time"] >= 0 and timing["cpu_time"] >= 0 for timing in timings)
+
+def test_disabled_timer():
+    timer = start_stage_timer(None, "names", 10)
+    assert timer is None
+    record_stage(timer, "validate")
+
+def test_stage_timings_summary():
+    timings = collect_timings()
+    summary = stage_timings_summary(timings)
+    assert set(summary["pipelines"]) == {"names", "email"}
+    assert summary["pipelines"]["names"]["rows"] == 10
+    assert summary["pipelines"]["names"]["wall_time"] == pytest.approx(sum(t["wall_time"] for t in timings[:3]))
+    assert summary["total"]["cpu_time"] == pytest.approx(sum(t["cpu_time"] for t in timings))
+
+def test_stage_timings_json(tmp_path):
+    path = tmp_path / "stage_timings.json"
+    timings = collect_timings()
+    summary_json = stage_timings_json(timings, str(path))
+    assert json.loads(summary_json) == json.loads(path.read_text(encoding="utf-8"))
+    assert len(json.loads(summary_json)["stages"]) == 6
+
+def test_stage_timings_table():
+    table = stage_timings_table(collect_timings())
+    assert list(table.index) == [("names", "validate"), ("names", "detect"), ("names", "status"),
+                                 ("email", "validate"), ("email", "detect"), ("email", "status")]
+    assert list(table.columns) == ["Rows", "Wall Time (s)", "CPU Time (s)", "Rows per Second", "Wall Time (%)"]
+    assert table["Wall Time (%)"].sum() == pytest.approx(100, abs=0.1)
+    assert stage_timings_table([]).empty
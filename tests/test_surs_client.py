@@ -0,0 +1,64 @@
+import pytest
+import os
+from utils.surs_client import (SURS_NAME_TABLES, SURS_SURNAME_TABLES, create_surs_session, fetch_surs_data,
+                               fetch_surs_table, fetch_surs_tables)
+from utils.surs_stub_server import start_surs_stub_server
+
+ALL_TABLES = SURS_NAME_TABLES + SURS_SURNAME_TABLES
+
+@pytest.fixture
+def surs_server():
+    server, base_url = start_surs_stub_server()
+    yield server, base_url
+    server.shutdown()
+    server.server_close()
+
+def test_fetch_surs_data(surs_server, tmp_path):
+    server, base_url = surs_server
+    all_names, all_surnames = fetch_surs_data(create_surs_session(), base_url, str(tmp_path))
+    assert list(all_names["value"]) == ["Marija", "Ana", "Špela", "Franc", "Janez", "Luka"]
+    assert list(all_surnames["value"]) == ["Novak", "Horvat", "Kovačič", "Krajnc", "Zupančič", "Potočnik"]
+    assert all_names["frequency"].sum() == pytest.approx(1)
+    assert all_names.loc[all_names["value"] == "Luka", "frequency"].item() == 0
+    assert sorted(server.requests) == sorted(ALL_TABLES)
+
+def test_fetch_surs_tables_revalidates_cache(surs_server, tmp_path):
+    server, base_url = surs_server
+    session = create_surs_session()
+    first = fetch_surs_tables(session, base_url, str(tmp_path))
+    assert len(os.listdir(tmp_path)) == len(ALL_TABLES)
+
+    # The stand-in answers 304 to a matching ETag, the tables then come from the cache
+    second = fetch_surs_tables(session, base_url, str(tmp_path))
+    assert len(server.requests) == 2 * len(ALL_TABLES)
+    for before, after in zip(first, second):
+        assert before.equals(after)
+
+def test_fetch_surs_table_retries(tmp_path):
+    server, base_url = start_surs_stub_server(failures=2)
+    try:
+        table = fetch_surs_table(create_surs_session(backoff_factor=0), f"{base_url}/05X1016S.px", "PRIIMEK", str(tmp_path))
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert list(table["value"]) == ["Kovačič"]
+    assert server.requests == ["05X1016S"] * 3
+
+def test_fetch_surs_table_falls_back_to_cache(surs_server, tmp_path):
+    server, base_url = surs_server
+    url = f"{base_url}/05X1016S.px"
+    fetch_surs_table(create_surs_session(), url, "PRIIMEK", str(tmp_path))
+    server.failures = 10
+    table = fetch_surs_table(create_surs_session(retries=0), url, "PRIIMEK", str(tmp_path))
+    assert list(table["value"]) == ["Kovačič"]
+
+def test_fetch_surs_table_unavailable(surs_server):
+    server, base_url = surs_server
+    table = fetch_surs_table(create_surs_session(), f"{base_url}/UNKNOWN.px", "IME", cache_dir=None)
+    assert table is None
+
+def test_fetch_surs_data_unavailable(surs_server):
+    server, base_url = surs_server
+    server.failures = 10
+    all_names, all_surnames = fetch_surs_data(create_surs_session(retries=0), base_url, cache_dir=None)
+    assert all_names is None and all_surnames is None
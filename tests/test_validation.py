@@ -7,7 +7,11 @@ sys.path.append(project_root)
 from validation.names_validation import validate_names
 from validation.phone_validation import validate_phone
 from validation.email_validation import validate_email
-from validation.address_validation import validate_full_address
+import pandas as pd
+from validation.address_validation import (validate_full_address, build_gurs_component_index, validate_address_components, validate_address_components_series,
+                                        build_postal_city_mapping, validate_postal_city_series,
+                                        build_gurs_address_hashes, validate_full_address_series,
+                                        normalize_text, normalize_text_series)
 
 # === NAME VALIDATION ===
 def test_valid_names():
@@ -44,3 +48,80 @@ def test_valid_address():
 def test_invalid_address_not_in_ref():
     reference_addresses = {"Cankarjeva 5, Maribor"}
     assert validate_full_address("Fake Street 1, Nowhere", reference_addresses) is False
+
+GURS_DF = pd.DataFrame({
+    "ULICA_NAZIV": ["Trubarjeva ulica", "Trubarjeva ulica", "Slovenska cesta", "Glavni trg"],
+    "HS_STEVILKA": ["7", "9", "1", "3"],
+    "HS_DODATEK": ["", "a", "", ""],
+    "POSTNI_OKOLIS_SIFRA": ["1000", "1000", "1000", "2000"],
+    "POSTNI_OKOLIS_NAZIV": ["Ljubljana", "Ljubljana", "Ljubljana", "Maribor"],
+})
+COMPONENT_INDEX = build_gurs_component_index(GURS_DF)
+
+ADDRESS_COMPONENT_CASES = [
+    (("Trubarjeva ulica", "7", "1000", "Ljubljana"), []),
+    (("Trubarjeva ulica", "9a", "1000", "Ljubljana"), []),
+    ((" Trubarjeva  ulica", "9A", "1000", "Ljubljana "), []),
+    (("Trubarjeva ulica", "8", "1000", "Ljubljana"), ["HOUSE_NUMBER"]),
+    (("Trubarjeva ulica", "7", "1000", "Maribor"), ["POSTAL_CITY"]),
+    (("Glavni trg", "3", "1000", "Ljubljana"), ["STREET"]),
+    (("Glavni trg", "7", "1000", "Maribor"), ["POSTAL_CITY", "STREET"]),
+    (("Trubarjeva ulica", "7", "9999", "Ljubljana"), ["POSTAL_CODE"]),
+    ((None, None, None, None), ["POSTAL_CODE"]),
+]
+
+@pytest.mark.parametrize("components, expected_invalid", ADDRESS_COMPONENT_CASES)
+def test_validate_address_components(components, expected_invalid):
+    assert validate_address_components(*components, COMPONENT_INDEX) == expected_invalid
+
+def test_validate_address_components_series_matches_scalar():
+    streets, house_numbers, postal_codes, cities = (pd.Series(values, index=range(10, 10 + len(ADDRESS_COMPONENT_CASES)))
+                                                    for values in zip(*(components for components, _ in ADDRESS_COMPONENT_CASES)))
+    result = validate_address_components_series(streets, house_numbers, postal_codes, cities, COMPONENT_INDEX)
+    assert list(result.index) == list(streets.index)
+    assert list(result) == [expected_invalid for _, expected_invalid in ADDRESS_COMPONENT_CASES]
+
+def test_build_postal_city_mapping():
+    mapping = build_postal_city_mapping(GURS_DF)
+    assert list(mapping["POSTAL_CODE"]) == ["1000", "2000"]
+    assert list(mapping["GURS_POSTAL_CITY"]) == ["Ljubljana", "Maribor"]
+
+def test_validate_postal_city_series():
+    postal_codes = pd.Series(["1000", "1000", "2000", "9999", "2000 "], index=[3, 4, 5, 6, 7])
+    cities = pd.Series(["Ljubljana", "Maribor", "", "Ljubljana", None], index=[3, 4, 5, 6, 7])
+    result = validate_postal_city_series(postal_codes, cities, build_postal_city_mapping(GURS_DF))
+    assert list(result.index) == [3, 4, 5, 6, 7]
+    assert list(result["postal_code_exists"]) == [True, True, True, False, True]
+    assert list(result["city_matches"]) == [True, False, False, False, False]
+    assert list(result["gurs_city"]) == ["Ljubljana", "Ljubljana", "Maribor", None, "Maribor"]
+
+def test_validate_full_address_series_matches_scalar():
+    reference_addresses = {"Trubarjeva ulica 7, 1000 Ljubljana", "Šmartinska cesta 5, 1000 Ljubljana"}
+    full_addresses = pd.Series([
+        "Trubarjeva ulica 7, 1000 Ljubljana",
+        " Trubarjeva  ulica 7, 1000 Ljubljana ",
+        "Šmartinska cesta 5, 1000 Ljubljana",
+        "Smartinska cesta 5, 1000 Ljubljana",
+        "",
+        None,
+    ], index=[9, 8, 7, 6, 5, 4])
+    result = validate_full_address_series(full_addresses, build_gurs_address_hashes(reference_addresses))
+    assert list(result.index) == list(full_addresses.index)
+    assert list(result) == [validate_full_address(address, reference_addresses) for address in full_addresses]
+
+NORMALIZE_TEXT_CASES = [
+    "Trubarjeva ulica 7",
+    "  Trubarjeva \t ulica\n7  ",
+    "Šmartinska\u00a0cesta",       # non-breaking space
+    "ＫＯＰＥＲ",                    # full-width characters
+    "ﬁ\u3000x",                    # ligature and ideographic space
+    "a\x1cb ",                     # not whitespace for the regex module
+    "",
+    None,
+    float("nan"),
+    1000,
+]
+
+def test_normalize_text_series_matches_scalar():
+    texts = pd.Series(NORMALIZE_TEXT_CASES, dtype=object)
+    assert list(normalize_text_series(texts)) == [normalize_text(text) for text in NORMALIZE_TEXT_CASES]
@@ -1,7 +1,19 @@
 import pandas as pd
-import requests
 import numpy as np
 import unidecode
+import pyarrow as pa
+import pyarrow.parquet as pq
+import os, sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from utils.sampling_utils import build_alias_table, sample_alias
+from utils.surs_client import fetch_surs_data, calculate_frequencies
+from utils.gurs_loader import load_gurs_register
+
+SURS_NAMES_PATH = "src/raw_data/SURS_names.csv"
+SURS_SURNAMES_PATH = "src/raw_data/SURS_surnames.csv"
+
+CUSTOMER_COLUMNS = ['CUSTOMER_ID', 'FIRST_NAME', 'LAST_NAME', 'STREET', 'HOUSE_NUMBER',
+                    'APARTMENT_NUMBER', 'POSTAL_CODE', 'POSTAL_CITY', 'COUNTRY', 'PHONE_NUMBER', 'EMAIL']
 
 def fetch_GURS_data(file_path):
     """
@@ -17,10 +29,6 @@ def fetch_GURS_data(file_path):
     pd.DataFrame
         Processed address data containing relevant columns.
     """
-    addresses = pd.read_csv(file_path)
-
-    addresses = addresses[addresses['ULICA_NAZIV'].notna() & addresses['ULICA_NAZIV'].str.strip().ne('')]
-
     columns_to_keep = ['EID_NASLOV'
                     ,'OBCINA_NAZIV'
                     ,'NASELJE_NAZIV'
@@ -30,9 +38,9 @@ def fetch_GURS_data(file_path):
                     ,'HS_STEVILKA'
                     ,'HS_DODATEK'
                     ,'ST_STANOVANJA']
-    addresses = addresses[columns_to_keep]
+    addresses = load_gurs_register(file_path, columns=columns_to_keep)
 
-    addresses['ST_STANOVANJA'] = addresses['ST_STANOVANJA'].astype('Int64')
+    addresses = addresses[addresses['ULICA_NAZIV'].notna() & addresses['ULICA_NAZIV'].str.strip().ne('')]
 
     print("SD: GURS data extracted")
     return addresses
@@ -47,130 +55,204 @@ def fetch_SURS_data():
         - all_names : DataFrame containing first names and their frequencies.
         - all_surnames : DataFrame containing last names and their frequencies.
     """
-    
-    query = {
-    "query": [
-        {"code": "MERITVE", "selection": {"filter": "item", "values": ["1"]}},
-        {"code": "LETO", "selection": {"filter": "item", "values": ["2024"]}}
-    ],
-    "response": {"format": "json-stat"}
-    }
-    
-    def fetch_data(url, key):
-        response = requests.post(url, json=query)
-        if response.status_code == 200:
-            data = response.json()
-            # Extract dimensions and values
-            category = data['dataset']['dimension'][key]['category']
-            labels = category['label']  # Extract names or surnames
-            values = data['dataset']['value']  # Extract counts
-            # Create a DataFrame
-            df = pd.DataFrame({
-                "value": list(labels.values()),
-                "count": values
-            })
-            return df[["value", "count"]]
-        else:
-            print(f"Failed to fetch data from {url}. Status code: {response.status_code}")
-            return pd.DataFrame()
-
-    # Combine all dataframes into one and calculate frequencies
-    def calculate_frequencies(df):
-        # Calculate total count
-        total_count = df["count"].sum()
-        # Calculate frequencies
-        df["frequency"] = df.apply(
-            lambda row: row["count"] / total_count if not pd.isna(row["count"]) else 0,
-            axis=1)
-        return df
-
-    # Fetch and combine male and female names
-    name_urls = {
-        "female": "https://pxweb.stat.si/SiStatData/api/v1/sl/Data/05X1010S.px",
-        "male": "https://pxweb.stat.si/SiStatData/api/v1/sl/Data/05X1005S.px"}
-    female_names = fetch_data(name_urls["female"], key="IME")
-    male_names = fetch_data(name_urls["male"], key="IME")
-    all_names = pd.concat([female_names, male_names], ignore_index=True)
-    
-    surname_urls = [
-        "https://pxweb.stat.si:443/SiStatData/api/v1/sl/Data/05X1015S.px",
-        "https://pxweb.stat.si:443/SiStatData/api/v1/sl/Data/05X1016S.px",
-        "https://pxweb.stat.si:443/SiStatData/api/v1/sl/Data/05X1017S.px",
-        "https://pxweb.stat.si:443/SiStatData/api/v1/sl/Data/05X1018S.px"]
-    surname_dataframes = [fetch_data(url, key="PRIIMEK") for url in surname_urls]
-    all_surnames = pd.concat(surname_dataframes, ignore_index=True)
-
-    # Calculate frequencies for names and surnames
-    all_names = calculate_frequencies(all_names)
-    all_surnames = calculate_frequencies(all_surnames)
+    all_names, all_surnames = fetch_surs_data()
     
     print("SD: SURS data extracted")
     return all_names, all_surnames
-  
-def generate_slo_phone_number():
+
+def refresh_SURS_snapshot(names_path=SURS_NAMES_PATH, surnames_path=SURS_SURNAMES_PATH):
     """
-    Generate a random Slovenian phone number.
+    Fetch the SURS name and surname tables and store them as a local snapshot.
+
+    Parameters:
+    -----------
+    names_path : str
+        CSV file for the first names.
+    surnames_path : str
+        CSV file for the last names.
 
     Returns:
     --------
-    str
-        A valid Slovenian phone number in the format '00386XXXXXXXX'.
+    tuple (pd.DataFrame, pd.DataFrame)
+        - all_names : DataFrame containing first names and their frequencies.
+        - all_surnames : DataFrame containing last names and their frequencies.
     """
-    
-    country_code = "00386"
-    mobile_prefixes = ['1', '30', '31', '40', '41', '51', '64', '65', '68', '70']
-    # Randomly choose a mobile prefix
-    prefix = np.random.choice(mobile_prefixes)
-    # Generate the rest of the number, depending if its 01 or smthing else
-    if len(prefix) == 2:
-        number = f"{np.random.randint(100000, 1000000)}"
-    else:
-        number = f"{np.random.randint(1000000, 10000000)}"
-    # Combine to form the full phone number
-    phone_number = f"{country_code}{prefix}{number}"
-    
-    return phone_number
+    all_names, all_surnames = fetch_SURS_data()
+    if all_names is None or all_surnames is None:
+        raise RuntimeError("SURS data could not be fetched, the snapshot was not refreshed")
+    for df, path in ((all_names, names_path), (all_surnames, surnames_path)):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        df[["value", "count"]].to_csv(path, index=False)
+    print("SD: SURS snapshot refreshed")
+    return all_names, all_surnames
 
-def generate_random_email(first_name, last_name, seed=42):
+def load_SURS_snapshot(names_path=SURS_NAMES_PATH, surnames_path=SURS_SURNAMES_PATH):
     """
-    Generate a realistic random email based on the given first and last names.
+    Load the SURS name and surname tables from the local snapshot, refreshing it first if it does not exist.
 
     Parameters:
     -----------
-    first_name : str
-        The user's first name.
-    last_name : str
-        The user's last name.
+    names_path : str
+        CSV file with the first names.
+    surnames_path : str
+        CSV file with the last names.
 
     Returns:
     --------
-    str
-        A randomly generated email address.
+    tuple (pd.DataFrame, pd.DataFrame)
+        - all_names : DataFrame containing first names and their frequencies.
+        - all_surnames : DataFrame containing last names and their frequencies.
     """
-    
-    # Set random seed for reproducibility
-    np.random.seed(seed)
-    
-    domains = ['gmail.com', 'hotmail.com', 'yahoo.com', 'icloud.com', 'siol.net', 't-2.net', 'amis.net', 'guest.arnes.net']
-    domain_weights = [0.4, 0.2, 0.2, 0.1, 0.05, 0.025, 0.015, 0.01]  # Weights for each domain
-    # Clean and sanitize names
-    clean_first_name = unidecode.unidecode(first_name).lower().replace(" ", "")
-    clean_last_name = unidecode.unidecode(last_name).lower().replace(" ", "")
-    # Choose a random format for the email
-    formats = [
-        f"{clean_first_name}.{clean_last_name}",
-        f"{clean_first_name}{clean_last_name}",
-        f"{clean_first_name[0]}.{clean_last_name}"]
-    email_base = np.random.choice(formats)
-    # Add a unique ID with some probability
-    if np.random.rand() > 0.7:  # 30% chance to add a number
-        email_base += str(np.random.randint(1, 100))
+    if not (os.path.exists(names_path) and os.path.exists(surnames_path)):
+        return refresh_SURS_snapshot(names_path, surnames_path)
+    # Keep names such as "Na" or "Nan" as values instead of parsing them as missing
+    all_names, all_surnames = (
+        calculate_frequencies(pd.read_csv(path, dtype={"value": str}, keep_default_na=False, na_values={"count": [""]}))
+        for path in (names_path, surnames_path)
+    )
+    return all_names, all_surnames
+
+MOBILE_PREFIXES = ['1', '30', '31', '40', '41', '51', '64', '65', '68', '70']
+EMAIL_DOMAINS = ['gmail.com', 'hotmail.com', 'yahoo.com', 'icloud.com', 'siol.net', 't-2.net', 'amis.net', 'guest.arnes.net']
+EMAIL_DOMAIN_WEIGHTS = [0.4, 0.2, 0.2, 0.1, 0.05, 0.025, 0.015, 0.01]
+
+def generate_slo_phone_numbers(size, rng):
+    """
+    Generate random Slovenian phone numbers in one batch, with a mobile prefix followed by a 6 or 7 digit number.
+
+    Parameters:
+    -----------
+    size : int
+        Number of phone numbers.
+    rng : np.random.Generator
+        Random generator.
+
+    Returns:
+    --------
+    np.ndarray
+        Phone numbers in the format '00386XXXXXXXX'.
+    """
+    prefixes = np.array(MOBILE_PREFIXES)[rng.integers(0, len(MOBILE_PREFIXES), size)]
+    one_digit = np.char.str_len(prefixes) == 1
+    # A one digit prefix is followed by 7 digits and a two digit prefix by 6, so prefix and number form 8 digits
+    numbers = np.where(one_digit, rng.integers(1000000, 10000000, size), rng.integers(100000, 1000000, size))
+    digits = prefixes.astype(np.int64) * np.where(one_digit, 10**7, 10**6) + numbers
+    return np.char.add("00386", digits.astype("U8")).astype(object)
+
+def clean_email_names(names):
+    """
+    Transliterate names to lower case ASCII without spaces, once per distinct name.
+
+    Parameters:
+    -----------
+    names : array-like of str
+        First names or last names.
+
+    Returns:
+    --------
+    np.ndarray
+        Cleaned names.
+    """
+    codes, unique_names = pd.factorize(pd.Series(names, dtype=object))
+    # Missing names get code -1, which picks the trailing ""
+    cleaned = np.array([unidecode.unidecode(str(name)).lower().replace(" ", "") for name in unique_names] + [""], dtype=object)
+    return cleaned[codes]
+
+def generate_random_emails(first_names, last_names, rng):
+    """
+    Generate realistic random emails for the given names in one batch.
+
+    Parameters:
+    -----------
+    first_names : array-like of str
+        The users' first names.
+    last_names : array-like of str
+        The users' last names, aligned with first_names.
+    rng : np.random.Generator
+        Random generator.
+
+    Returns:
+    --------
+    np.ndarray
+        Randomly generated email addresses.
+    """
+    first = clean_email_names(first_names)
+    last = clean_email_names(last_names)
+    size = len(first)
+
+    # Choose a random format for every email and build each format only for its rows
+    formats = rng.integers(0, 3, size)
+    email_base = np.empty(size, dtype=object)
+    dotted, joined, initial = formats == 0, formats == 1, formats == 2
+    email_base[dotted] = first[dotted] + "." + last[dotted]
+    email_base[joined] = first[joined] + last[joined]
+    email_base[initial] = np.array([name[:1] for name in first[initial]], dtype=object) + "." + last[initial]
+
+    # Add a number with 30% probability
+    numbers = np.array([""] + [str(number) for number in range(1, 100)], dtype=object)
+    with_number = rng.random(size) > 0.7
+    email_number = numbers[np.where(with_number, rng.integers(1, 100, size), 0)]
+
     # Select a domain with weighted probability
-    domain = np.random.choice(domains, p=domain_weights)
-    
-    return f"{email_base}@{domain}"
+    domains = np.array(["@" + domain for domain in EMAIL_DOMAINS], dtype=object)
+    email_domain = domains[rng.choice(len(EMAIL_DOMAINS), size=size, p=EMAIL_DOMAIN_WEIGHTS)]
+
+    return email_base + email_number + email_domain
+
+def zipf_weights(size, exponent, rng):
+    """
+    Assign Zipf weights 1 / rank ** exponent to a random ranking of the values.
+
+    Parameters:
+    -----------
+    size : int
+        Number of values.
+    exponent : float
+        Zipf exponent, larger values concentrate the draws on fewer values. 0 gives uniform weights.
+    rng : np.random.Generator or np.random.RandomState
+        Random generator for the ranking.
 
-def generate_synthetic_customer_data(gurs_file_path, dataset_size = 10000, seed = 42):
+    Returns:
+    --------
+    np.ndarray
+        Weight of every value, in the order of the values.
+    """
+    weights = np.empty(size, dtype=np.float64)
+    weights[rng.permutation(size)] = 1.0 / np.arange(1, size + 1, dtype=np.float64) ** exponent
+    return weights
+
+def duplicate_customers(customer_df, duplicate_rate, rng):
+    """
+    Turn a share of the customers into exact duplicates of other customers in the same DataFrame.
+
+    Every column except CUSTOMER_ID is copied from a randomly chosen customer that is not a duplicate itself.
+
+    Parameters:
+    -----------
+    customer_df : pd.DataFrame
+        Customer data, changed in place.
+    duplicate_rate : float
+        Probability that a customer is a duplicate.
+    rng : np.random.Generator or np.random.RandomState
+        Random generator.
+
+    Returns:
+    --------
+    pd.DataFrame
+        The same DataFrame.
+    """
+    is_duplicate = rng.random(len(customer_df)) < duplicate_rate
+    originals, duplicates = np.flatnonzero(~is_duplicate), np.flatnonzero(is_duplicate)
+    if len(originals) == 0 or len(duplicates) == 0:
+        return customer_df
+
+    sources = originals[rng.integers(0, len(originals), len(duplicates))]
+    for position, column in enumerate(customer_df.columns):
+        if column != 'CUSTOMER_ID':
+            customer_df.iloc[duplicates, position] = customer_df.iloc[sources, position].to_numpy()
+    return customer_df
+
+def generate_synthetic_customer_data(gurs_file_path, dataset_size = 10000, seed = 42, zipf_exponent = None, duplicate_rate = 0.0):
     """
     Generate a synthetic customer dataset using GURS and SURS data.
 
@@ -182,6 +264,10 @@ def generate_synthetic_customer_data(gurs_file_path, dataset_size = 10000, seed
         Number of synthetic customer records to generate.
     seed : int, default=42
         Random seed for reproducibility.
+    zipf_exponent : float, optional
+        Sample addresses with Zipf weights (see zipf_weights) instead of uniformly, so a few addresses recur often.
+    duplicate_rate : float, default=0.0
+        Share of customers that are exact duplicates of other customers (see duplicate_customers).
 
     Returns:
     --------
@@ -189,23 +275,17 @@ def generate_synthetic_customer_data(gurs_file_path, dataset_size = 10000, seed
         Generated synthetic customer dataset.
     """
     
-    # Set random seed for reproducibility
-    np.random.seed(seed)
+    # Local generator for reproducibility, the global NumPy random state is left untouched
+    rng = np.random.default_rng(seed)
 
     addresses = fetch_GURS_data(gurs_file_path)
-    all_names, all_surnames = fetch_SURS_data()
-    
+    all_names, all_surnames = load_SURS_snapshot()
     
     # Randomly sample names and surnames based on their frequencies
-    random_names = np.random.choice(
-        all_names["value"],
-        size=dataset_size,
-        p=all_names["frequency"])
-    random_surnames = np.random.choice(
-        all_surnames["value"],
-        size=dataset_size,
-        p=all_surnames["frequency"])
-    random_addresses = addresses.sample(dataset_size, replace=True).reset_index(drop=True)
+    random_names = all_names["value"].to_numpy()[sample_alias(build_alias_table(all_names["frequency"]), dataset_size, rng)]
+    random_surnames = all_surnames["value"].to_numpy()[sample_alias(build_alias_table(all_surnames["frequency"]), dataset_size, rng)]
+    address_weights = zipf_weights(len(addresses), zipf_exponent, rng) if zipf_exponent is not None else None
+    random_addresses = addresses.sample(dataset_size, replace=True, weights=address_weights, random_state=rng).reset_index(drop=True)
 
     customer_df = pd.DataFrame({
         'CUSTOMER_ID': np.arange(1, dataset_size + 1)
@@ -218,10 +298,10 @@ def generate_synthetic_customer_data(gurs_file_path, dataset_size = 10000, seed
         ,'POSTAL_CODE': random_addresses['POSTNI_OKOLIS_SIFRA']
         ,'POSTAL_CITY': random_addresses['POSTNI_OKOLIS_NAZIV']
         ,'COUNTRY': 'Slovenia'
-        ,'PHONE_NUMBER': [generate_slo_phone_number() for i in range(dataset_size)]
+        ,'PHONE_NUMBER': generate_slo_phone_numbers(dataset_size, rng)
     })
 
-    customer_df['EMAIL'] = [generate_random_email(name, surname) for name, surname in zip(random_names, random_surnames)]
+    customer_df['EMAIL'] = generate_random_emails(random_names, random_surnames, rng)
 
     # Combine 'HOUSE_NUMBER' and 'HOUSE_NUMBER_ADDITION' into 'HOUSE_NUMBER_FULL' without spaces
     customer_df['HOUSE_NUMBER'] = customer_df['HN'].astype(str) + customer_df['HN_ADDITION']
@@ -231,16 +311,158 @@ def generate_synthetic_customer_data(gurs_file_path, dataset_size = 10000, seed
     customer_df['POSTAL_CITY'] = customer_df['POSTAL_CITY'].str.split('-').str[0].str.strip()
 
 
-    columns_order = ['CUSTOMER_ID', 'FIRST_NAME', 'LAST_NAME', 'STREET', 'HOUSE_NUMBER', 
-                    'APARTMENT_NUMBER', 'POSTAL_CODE', 'POSTAL_CITY', 'COUNTRY', 'PHONE_NUMBER', 'EMAIL']
-    customer_df = customer_df[columns_order]
+    customer_df = customer_df[CUSTOMER_COLUMNS]
+    if duplicate_rate > 0:
+        customer_df = duplicate_customers(customer_df, duplicate_rate, rng)
 
-        
     return customer_df
 
+def prepare_customer_addresses(addresses):
+    """
+    Prepare the GURS addresses once for sampling, with the same columns and cleanup as generate_synthetic_customer_data.
+
+    Parameters:
+    -----------
+    addresses : pd.DataFrame
+        Address data returned by fetch_GURS_data.
+
+    Returns:
+    --------
+    pd.DataFrame
+        Addresses with STREET, HOUSE_NUMBER, APARTMENT_NUMBER, POSTAL_CODE and POSTAL_CITY columns and a RangeIndex.
+    """
+    return pd.DataFrame({
+        'STREET': addresses['ULICA_NAZIV'].to_numpy(),
+        'HOUSE_NUMBER': (addresses['HS_STEVILKA'].astype(str)
+                         + addresses['HS_DODATEK'].apply(lambda x: str(x).upper() if pd.notna(x) else "")).to_numpy(),
+        'APARTMENT_NUMBER': addresses['ST_STANOVANJA'].astype('Int64').array,
+        'POSTAL_CODE': addresses['POSTNI_OKOLIS_SIFRA'].to_numpy(),
+        'POSTAL_CITY': addresses['POSTNI_OKOLIS_NAZIV'].str.split('-').str[0].str.strip().to_numpy(),
+    })
+
+def generate_customer_data_chunks(gurs_file_path, dataset_size=10000, seed=42, chunk_size=1_000_000,
+                                  addresses=None, all_names=None, all_surnames=None, zipf_exponent=None, duplicate_rate=0.0):
+    """
+    Generate a synthetic customer dataset in fixed-size chunks, with constant memory.
+
+    GURS and SURS data are loaded and prepared once, every chunk samples from them with its own
+    np.random.Generator, seeded with a child of np.random.SeedSequence(seed). The chunks depend only
+    on the seed and the chunk size.
+
+    Parameters:
+    -----------
+    gurs_file_path : str
+        Path to the GURS address data CSV file. Not read if addresses are given.
+    dataset_size : int
+        Number of synthetic customer records to generate.
+    seed : int, default=42
+        Random seed for reproducibility.
+    chunk_size : int, default=1_000_000
+        Number of records per chunk.
+    addresses : pd.DataFrame, optional
+        Address data as returned by fetch_GURS_data.
+    all_names, all_surnames : pd.DataFrame, optional
+        Names and surnames with "value" and "frequency" columns, as returned by load_SURS_snapshot.
+    zipf_exponent : float, optional
+        Sample addresses with Zipf weights (see zipf_weights) instead of uniformly. The ranking of the
+        addresses is drawn once, so the same addresses are popular in every chunk.
+    duplicate_rate : float, default=0.0
+        Share of customers that are exact duplicates of other customers in the same chunk (see duplicate_customers).
+
+    Yields:
+    -------
+    pd.DataFrame
+        Chunks of the customer dataset, with the columns of generate_synthetic_customer_data.
+    """
+    if addresses is None:
+        addresses = fetch_GURS_data(gurs_file_path)
+    if all_names is None or all_surnames is None:
+        all_names, all_surnames = load_SURS_snapshot()
+
+    addresses = prepare_customer_addresses(addresses)
+    names, name_table = all_names["value"].to_numpy(), build_alias_table(all_names["frequency"])
+    surnames, surname_table = all_surnames["value"].to_numpy(), build_alias_table(all_surnames["frequency"])
+
+    starts = range(0, dataset_size, chunk_size)
+    seed_sequence = np.random.SeedSequence(seed)
+    chunk_seeds = seed_sequence.spawn(len(starts))
+    if zipf_exponent is not None:
+        # Spawned after the chunk seeds, so the chunks without Zipf weights stay the same
+        address_table = build_alias_table(zipf_weights(len(addresses), zipf_exponent, np.random.default_rng(seed_sequence.spawn(1)[0])))
+
+    for start, chunk_seed in zip(starts, chunk_seeds):
+        size = min(chunk_size, dataset_size - start)
+        rng = np.random.default_rng(chunk_seed)
+
+        random_names = names[sample_alias(name_table, size, rng)]
+        random_surnames = surnames[sample_alias(surname_table, size, rng)]
+        if zipf_exponent is not None:
+            address_positions = sample_alias(address_table, size, rng)
+        else:
+            address_positions = rng.integers(0, len(addresses), size)
+        random_addresses = addresses.take(address_positions).reset_index(drop=True)
+
+        chunk = pd.DataFrame({
+            'CUSTOMER_ID': np.arange(start + 1, start + size + 1),
+            'FIRST_NAME': random_names,
+            'LAST_NAME': random_surnames,
+        })
+        chunk = pd.concat([chunk, random_addresses], axis=1)
+        chunk['COUNTRY'] = 'Slovenia'
+        chunk['PHONE_NUMBER'] = generate_slo_phone_numbers(size, rng)
+        chunk['EMAIL'] = generate_random_emails(random_names, random_surnames, rng)
+        chunk = chunk[CUSTOMER_COLUMNS]
+        if duplicate_rate > 0:
+            chunk = duplicate_customers(chunk, duplicate_rate, rng)
+
+        yield chunk
+
+def write_customer_data_parquet(chunks, parquet_path):
+    """
+    Stream customer data chunks to a Parquet file, one row group per chunk.
+
+    Parameters:
+    -----------
+    chunks : iterable of pd.DataFrame
+        Chunks, e.g. from generate_customer_data_chunks.
+    parquet_path : str
+        Path of the Parquet file to write.
+
+    Returns:
+    --------
+    int
+        Number of records written.
+    """
+    writer = None
+    schema = None
+    rows = 0
+    try:
+        for chunk in chunks:
+            # The schema of the first chunk is used for all chunks, so a column that is empty in one chunk keeps its type
+            table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+            if writer is None:
+                schema = table.schema
+                writer = pq.ParquetWriter(parquet_path, schema)
+            writer.write_table(table, row_group_size=len(chunk))
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
 if __name__ == "__main__":
     # Example usage
     GURS_file_path = 'src/raw_data/RN_SLO_NASLOVI_register_naslovov_20240929.csv'
-    customer_df = generate_synthetic_customer_data(GURS_file_path, dataset_size=10000, seed=42)
-    print("Synthetic customer dataset generated")
-    customer_df.to_excel("src/processed_data/customer_data.xlsx", index=False)
+    stream_to_parquet = False
+
+    # python utils/customer_data_generator.py --refresh-surs
+    if "--refresh-surs" in sys.argv:
+        refresh_SURS_snapshot()
+    elif stream_to_parquet:
+        chunks = generate_customer_data_chunks(GURS_file_path, dataset_size=10_000_000, seed=42, chunk_size=1_000_000)
+        rows = write_customer_data_parquet(chunks, "src/processed_data/customer_data.parquet")
+        print(f"Synthetic customer dataset with {rows} records streamed to 'customer_data.parquet'")
+    else:
+        customer_df = generate_synthetic_customer_data(GURS_file_path, dataset_size=10000, seed=42)
+        print("Synthetic customer dataset generated")
+        customer_df.to_excel("src/processed_data/customer_data.xlsx", index=False)
@@ -0,0 +1,169 @@
+import os
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+from openpyxl import load_workbook
+
+# File extension -> data format
+DATA_FORMATS = {
+    ".parquet": "parquet",
+    ".csv": "csv",
+    ".feather": "feather",
+    ".arrow": "feather",
+    ".ipc": "feather",
+    ".xlsx": "excel",
+}
+
+def data_format(path: str) -> str:
+    """
+    Detect the data format of a file from its extension.
+
+    Args:
+        path (str): Path of the file.
+
+    Returns:
+        str: "parquet", "csv", "feather" (Arrow IPC) or "excel".
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in DATA_FORMATS:
+        raise ValueError(f"Unsupported data format: {extension}, expected one of {', '.join(DATA_FORMATS)}")
+    return DATA_FORMATS[extension]
+
+def read_data(path: str, columns: list = None, **kwargs) -> pd.DataFrame:
+    """
+    Read a dataset in the format given by the file extension.
+
+    Args:
+        path (str): Path of the file.
+        columns (list): Columns to read, in this order, all columns if None. Parquet and Feather read only these columns from disk.
+        **kwargs: Extra arguments of the pandas reader, e.g. dtype=str for CSV and Excel.
+
+    Returns:
+        pd.DataFrame: The dataset.
+    """
+    file_format = data_format(path)
+    if file_format == "parquet":
+        return pd.read_parquet(path, columns=columns, **kwargs)
+    if file_format == "feather":
+        return pd.read_feather(path, columns=columns, **kwargs)
+    if file_format == "csv":
+        df = pd.read_csv(path, usecols=columns, **kwargs)
+    else:
+        df = pd.read_excel(path, usecols=columns, **kwargs)
+    # usecols keeps the order of the file
+    return df[columns] if columns is not None else df
+
+def iter_excel_chunks(path: str, chunk_size: int, columns: list = None):
+    """
+    Read the first sheet of an Excel file in chunks, streaming the rows with openpyxl in read-only mode.
+
+    Args:
+        path (str): Path of the .xlsx file.
+        chunk_size (int): Rows per chunk.
+        columns (list): Columns to read, all columns if None.
+
+    Yields:
+        pd.DataFrame: Chunks of the sheet.
+    """
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = list(next(rows, ()))
+        positions = [header.index(col) for col in columns] if columns is not None else list(range(len(header)))
+        names = [header[position] for position in positions]
+
+        chunk = []
+        for row in rows:
+            chunk.append([row[position] if position < len(row) else None for position in positions])
+            if len(chunk) == chunk_size:
+                yield pd.DataFrame(chunk, columns=names)
+                chunk = []
+        if chunk:
+            yield pd.DataFrame(chunk, columns=names)
+    finally:
+        workbook.close()
+
+def iter_feather_chunks(path: str, chunk_size: int, columns: list = None):
+    """
+    Read a Feather (Arrow IPC) file in chunks, loading and decompressing one record batch at a time.
+
+    Args:
+        path (str): Path of the Feather file.
+        chunk_size (int): Rows per chunk.
+        columns (list): Columns to read, in this order, all columns if None.
+
+    Yields:
+        pd.DataFrame: Chunks of the file.
+    """
+    with pa.memory_map(path) as source:
+        reader = ipc.open_file(source)
+        pending, pending_rows = [], 0
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            pending.append(batch.select(columns) if columns is not None else batch)
+            pending_rows += batch.num_rows
+            # Record batches and chunks do not line up, carry the remainder over to the next chunk
+            while pending_rows >= chunk_size:
+                table = pa.Table.from_batches(pending)
+                yield table.slice(0, chunk_size).to_pandas()
+                rest = table.slice(chunk_size)
+                pending, pending_rows = rest.to_batches(), rest.num_rows
+        if pending_rows:
+            yield pa.Table.from_batches(pending).to_pandas()
+
+def iter_data(path: str, chunk_size: int = 100_000, columns: list = None):
+    """
+    Read a dataset chunk by chunk, in the format given by the file extension, so a large file never has to fit in memory.
+    Parquet and Feather are read one record batch at a time, CSV and Excel are streamed row by row.
+
+    Args:
+        path (str): Path of the file.
+        chunk_size (int): Rows per chunk.
+        columns (list): Columns to read, in this order, all columns if None.
+
+    Yields:
+        pd.DataFrame: Chunks of the dataset, with a RangeIndex that continues across chunks.
+    """
+    file_format = data_format(path)
+    if file_format == "parquet":
+        batches = pq.ParquetFile(path).iter_batches(batch_size=chunk_size, columns=columns)
+        chunks = (batch.to_pandas() for batch in batches)
+    elif file_format == "feather":
+        chunks = iter_feather_chunks(path, chunk_size, columns)
+    elif file_format == "csv":
+        chunks = pd.read_csv(path, usecols=columns, chunksize=chunk_size)
+        if columns is not None:
+            chunks = (chunk[columns] for chunk in chunks)
+    else:
+        chunks = iter_excel_chunks(path, chunk_size, columns)
+
+    start = 0
+    for chunk in chunks:
+        chunk.index = pd.RangeIndex(start, start + len(chunk))
+        start += len(chunk)
+        yield chunk
+
+def write_data(df: pd.DataFrame, path: str, **kwargs) -> str:
+    """
+    Write a dataset in the format given by the file extension, without the index.
+
+    Args:
+        df (pd.DataFrame): The dataset.
+        path (str): Path of the file.
+        **kwargs: Extra arguments of the pandas writer.
+
+    Returns:
+        str: The path.
+    """
+    file_format = data_format(path)
+    if file_format == "parquet":
+        df.to_parquet(path, index=False, **kwargs)
+    elif file_format == "feather":
+        feather.write_feather(df.reset_index(drop=True), path, **kwargs)
+    elif file_format == "csv":
+        df.to_csv(path, index=False, **kwargs)
+    else:
+        df.to_excel(path, index=False, **kwargs)
+    return path
@@ -0,0 +1,384 @@
+import numpy as np
+import pandas as pd
+
+FIELDS = [
+    "FIRST_NAME", "LAST_NAME", "STREET", "HOUSE_NUMBER",
+    "POSTAL_CODE", "POSTAL_CITY", "EMAIL", "PHONE_NUMBER"
+]
+
+def parse_errors(error_str) -> set:
+    """
+    Parse one error value into a set of error codes.
+
+    Args:
+        error_str (str, set, list or np.ndarray): Comma separated codes (optionally written as a set or list), or a collection of codes.
+
+    Returns:
+        set: Set of error codes as strings.
+    """
+    if error_str is None:
+        return set()
+    if isinstance(error_str, (set, list, np.ndarray)):
+        return set(str(error) for error in error_str)
+    if isinstance(error_str, float) and np.isnan(error_str):
+        return set()
+
+    error_str = str(error_str).strip()
+    if error_str in ["set()", "[]", "{}"]:
+        return set()
+    error_str = error_str.strip("{}[]").replace("'", "")
+    return set(item.strip() for item in error_str.split(",") if item.strip())
+
+def parse_error_column(values: pd.Series) -> dict:
+    """
+    Parse an error column, parsing every distinct value only once.
+
+    Collections (sets, lists, arrays) are exploded to one element per row first, so the distinct values
+    are single codes or comma separated strings.
+
+    Args:
+        values (pd.Series): Error column, e.g. INTRODUCED_ERRORS or EMAIL_DETECTED_ERRORS.
+
+    Returns:
+        dict: A dictionary with the following keys:
+            - rows (np.ndarray): Row position of every exploded element, in increasing order.
+            - keys (np.ndarray): Distinct value of every exploded element, -1 for missing values.
+            - parsed (list): Set of error codes of every distinct value.
+    """
+    exploded = values.reset_index(drop=True).explode()
+    keys, uniques = pd.factorize(exploded.to_numpy(dtype=object))
+    return {
+        "rows": exploded.index.to_numpy(dtype=np.int64),
+        "keys": keys,
+        "parsed": [parse_errors(value) for value in uniques],
+    }
+
+def code_matrix_from_parsed(parsed_column: dict, n_rows: int, code_index: dict) -> np.ndarray:
+    """
+    Build the boolean (rows x codes) matrix of a column parsed by parse_error_column.
+
+    Args:
+        parsed_column (dict): Result of parse_error_column.
+        n_rows (int): Number of rows of the column.
+        code_index (dict): Error code -> matrix column. Codes without a column are left out.
+
+    Returns:
+        np.ndarray: Boolean matrix, True where the row has the error code.
+    """
+    unique_matrix = np.zeros((len(parsed_column["parsed"]) + 1, len(code_index)), dtype=bool)   # last row for missing values
+    for position, codes in enumerate(parsed_column["parsed"]):
+        unique_matrix[position, [code_index[code] for code in codes if code in code_index]] = True
+    if n_rows == 0:
+        return np.zeros((0, len(code_index)), dtype=bool)
+
+    # Exploded elements of a row are adjacent, every row has at least one element
+    rows = parsed_column["rows"]
+    starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+    return np.logical_or.reduceat(unique_matrix[parsed_column["keys"]], starts, axis=0)
+
+def error_code_matrix(values: pd.Series, codes: list = None) -> tuple:
+    """
+    Turn an error column into a boolean (rows x codes) matrix.
+
+    Args:
+        values (pd.Series): Error column.
+        codes (list, optional): Error codes of the matrix columns, other codes are left out. Defaults to the sorted codes found in the column.
+
+    Returns:
+        tuple: (np.ndarray boolean matrix, list of error codes of its columns)
+    """
+    parsed_column = parse_error_column(values)
+    if codes is None:
+        codes = sorted(set().union(*parsed_column["parsed"]))
+    code_index = {code: position for position, code in enumerate(codes)}
+    return code_matrix_from_parsed(parsed_column, len(values), code_index), list(codes)
+
+def render_code_matrix(matrix: np.ndarray, codes: list) -> np.ndarray:
+    """
+    Render every row of an error code matrix as a comma separated string of its sorted codes.
+    Every distinct row is rendered once.
+
+    Args:
+        matrix (np.ndarray): Boolean (rows x codes) matrix.
+        codes (list): Sorted error codes of the matrix columns.
+
+    Returns:
+        np.ndarray: Object array with one string per row, empty for rows without errors.
+    """
+    if len(matrix) == 0:
+        return np.array([], dtype=object)
+    packed = np.ascontiguousarray(np.packbits(matrix, axis=1))
+    row_keys = packed.view(np.dtype((np.void, packed.shape[1]))).ravel()
+    _, first_rows, inverse = np.unique(row_keys, return_index=True, return_inverse=True)
+    rendered = np.array([", ".join(np.asarray(codes, dtype=object)[matrix[row]]) for row in first_rows], dtype=object)
+    return rendered[inverse.reshape(-1)]
+
+def build_error_matrices(df: pd.DataFrame, fields: list = FIELDS, codes: list = None) -> dict:
+    """
+    Build the introduced, detected and corrected error code matrices of a processed dataset.
+
+    Every error column is parsed once. All matrices share the same code columns, the detected and
+    corrected matrices combine all *_DETECTED_ERRORS and *_CORRECTED_ERRORS columns.
+
+    Args:
+        df (pd.DataFrame): Dataset with INTRODUCED_ERRORS, <field>_INTRO_ERRORS and the pipeline error columns.
+        fields (list): Fields with per-field matrices.
+        codes (list, optional): Error codes of the matrix columns, other codes are left out. Defaults to the sorted
+            codes found in the columns. Fixed codes give the same columns for every chunk of a dataset.
+
+    Returns:
+        dict: A dictionary with the following keys:
+            - codes (list): Error codes of the matrix columns.
+            - introduced, detected, corrected (np.ndarray): Boolean (rows x codes) matrices of the whole rows.
+            - fields (dict): Field -> {"introduced", "detected", "corrected"} matrices of the field.
+    """
+    detected_cols = [col for col in df.columns if col.endswith('_DETECTED_ERRORS')]
+    corrected_cols = [col for col in df.columns if col.endswith('_CORRECTED_ERRORS')]
+    field_cols = {field: {"introduced": f"{field}_INTRO_ERRORS", "detected": f"{field}_DETECTED_ERRORS",
+                          "corrected": f"{field}_CORRECTED_ERRORS"} for field in fields}
+
+    columns = ["INTRODUCED_ERRORS"] + detected_cols + corrected_cols + [col for cols in field_cols.values() for col in cols.values()]
+    parsed = {col: parse_error_column(df[col]) for col in dict.fromkeys(columns) if col in df.columns}
+    if codes is None:
+        codes = sorted(set().union(*(column_codes for column in parsed.values() for column_codes in column["parsed"])))
+    code_index = {code: position for position, code in enumerate(codes)}
+
+    empty = np.zeros((len(df), len(codes)), dtype=bool)
+    matrices = {col: code_matrix_from_parsed(parsed_column, len(df), code_index) for col, parsed_column in parsed.items()}
+
+    return {
+        "codes": list(codes),
+        "introduced": matrices.get("INTRODUCED_ERRORS", empty),
+        "detected": np.logical_or.reduce([matrices[col] for col in detected_cols]) if detected_cols else empty,
+        "corrected": np.logical_or.reduce([matrices[col] for col in corrected_cols]) if corrected_cols else empty,
+        "fields": {field: {kind: matrices.get(col, empty) for kind, col in cols.items()} for field, cols in field_cols.items()},
+    }
+
+def code_counts(matrices: dict) -> pd.DataFrame:
+    """
+    Count the introduced, detected and corrected rows of every error code.
+
+    Args:
+        matrices (dict): Result of build_error_matrices.
+
+    Returns:
+        pd.DataFrame: Introduced, Detected and Corrected counts (columns) of every matrix code (rows).
+    """
+    return pd.DataFrame({
+        "Introduced": matrices["introduced"].sum(axis=0),
+        "Detected": matrices["detected"].sum(axis=0),
+        "Corrected": matrices["corrected"].sum(axis=0),
+    }, index=matrices["codes"], dtype=int)
+
+def error_code_table(counts: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add detection and correction rates to the per-code counts.
+
+    Args:
+        counts (pd.DataFrame): Introduced, Detected and Corrected counts per error code, e.g. from code_counts.
+
+    Returns:
+        pd.DataFrame: The counts with detection and correction rates, for the codes that occur at least once, sorted by code.
+    """
+    error_comparison = counts[counts.any(axis=1)].sort_index().astype(int)
+    error_comparison["Detection Rate (%)"] = (error_comparison["Detected"] / error_comparison["Introduced"]) * 100
+    error_comparison["Correction Rate (%)"] = (error_comparison["Corrected"] / error_comparison["Introduced"]) * 100
+    return error_comparison.round(2)
+
+def error_code_counts(matrices: dict) -> pd.DataFrame:
+    """
+    Count the introduced, detected and corrected rows of every error code.
+
+    Args:
+        matrices (dict): Result of build_error_matrices.
+
+    Returns:
+        pd.DataFrame: Introduced, Detected, Corrected counts and detection and correction rates per error code,
+        for the codes that occur at least once.
+    """
+    return error_code_table(code_counts(matrices))
+
+def field_counts(matrices: dict) -> dict:
+    """
+    Count error codes and affected rows per field.
+
+    Args:
+        matrices (dict): Result of build_error_matrices.
+
+    Returns:
+        dict: Field -> {"introduced", "detected", "corrected", "introduced_rows", "detected_rows", "corrected_rows"} counts.
+    """
+    counts = {}
+    for field, field_matrices in matrices["fields"].items():
+        counts[field] = {}
+        for kind in ("introduced", "detected", "corrected"):
+            counts[field][kind] = int(field_matrices[kind].sum())
+            counts[field][f"{kind}_rows"] = int(field_matrices[kind].any(axis=1).sum())
+    return counts
+
+def field_error_table(counts: dict) -> pd.DataFrame:
+    """
+    Build the per-field error table from the per-field counts.
+
+    Args:
+        counts (dict): Result of field_counts.
+
+    Returns:
+        pd.DataFrame: One row per field with error counts, detection and correction rates and row counts.
+    """
+    results = []
+    for field, field_count in counts.items():
+        intro_count, detected_count, corrected_count = field_count["introduced"], field_count["detected"], field_count["corrected"]
+        detection_rate = (detected_count / intro_count * 100) if intro_count else 0
+        correction_rate = (corrected_count / intro_count * 100) if intro_count else 0
+
+        results.append({
+            "Field": field,
+            "Introduced Errors": intro_count,
+            "Detected Errors": detected_count,
+            "Corrected Errors": corrected_count,
+            "Detection Rate (%)": round(detection_rate, 2),
+            "Correction Rate (%)": round(correction_rate, 2),
+            "Rows with Introduced Errors": field_count["introduced_rows"],
+            "Rows with Detected Errors": field_count["detected_rows"],
+            "Rows with Corrected Errors": field_count["corrected_rows"],
+        })
+    return pd.DataFrame(results).set_index("Field")
+
+def field_error_summary(matrices: dict) -> pd.DataFrame:
+    """
+    Count error codes and affected rows per field.
+
+    Args:
+        matrices (dict): Result of build_error_matrices.
+
+    Returns:
+        pd.DataFrame: One row per field with error counts, detection and correction rates and row counts.
+    """
+    return field_error_table(field_counts(matrices))
+
+def status_table(status_counts: dict) -> pd.DataFrame:
+    """
+    Combine the value counts of the *_STATUS columns into one table.
+
+    Args:
+        status_counts (dict): Status column -> counts of its statuses (pd.Series or dict).
+
+    Returns:
+        pd.DataFrame: One column per status column, OVERALL_STATUS first, then alphabetical, one row per status, sorted by status.
+    """
+    if not status_counts:
+        return pd.DataFrame()
+    status_summary = pd.concat([pd.Series(counts, dtype="int64", name=col) for col, counts in status_counts.items()], axis=1)
+
+    # Fill NaNs with 0 and convert to int
+    status_summary = status_summary.fillna(0).astype(int).sort_index()
+
+    # Sort columns for clarity: OVERALL_STATUS first, then alphabetical
+    cols_sorted = ['OVERALL_STATUS'] + sorted([c for c in status_summary.columns if c != 'OVERALL_STATUS'])
+    return status_summary[cols_sorted] if 'OVERALL_STATUS' in status_summary.columns else status_summary
+
+def has_errors_flags(introduced: np.ndarray, detected: np.ndarray, corrected: np.ndarray) -> dict:
+    """
+    Compute the record level flags used for the evaluation.
+
+    Args:
+        introduced, detected, corrected (np.ndarray): Boolean (rows x codes) matrices with the same columns.
+
+    Returns:
+        dict: A dictionary with the following boolean arrays:
+            - has_introduced: The row has introduced errors.
+            - has_detected: The row has detected errors.
+            - has_corrected: All detected errors were corrected and there was at least one.
+            - has_detected_errors: All introduced errors are among the corrected errors (False if nothing was introduced or detected).
+            - has_corrected_errors: All introduced errors are among the corrected errors (False if nothing was introduced or corrected).
+    """
+    has_introduced = introduced.any(axis=1)
+    has_detected = detected.any(axis=1)
+    has_any_corrected = corrected.any(axis=1)
+    introduced_corrected = ~(introduced & ~corrected).any(axis=1)
+
+    return {
+        "has_introduced": has_introduced,
+        "has_detected": has_detected,
+        "has_corrected": (corrected == detected).all(axis=1) & has_any_corrected,
+        "has_detected_errors": (has_detected | has_introduced) & introduced_corrected,
+        "has_corrected_errors": (has_any_corrected | has_introduced) & introduced_corrected,
+    }
+
+def dimension_incidence_matrix(error_config: dict, codes: list) -> tuple:
+    """
+    Build the (codes x DQ dimensions) incidence matrix of the error config.
+
+    Args:
+        error_config (dict): Error code -> {"dq_dimension": ...}, as returned by load_error_config.
+        codes (list): Error codes of the rows, e.g. the codes of build_error_matrices.
+
+    Returns:
+        tuple: (np.ndarray int64 matrix with a 1 where the code belongs to the dimension, sorted list of all DQ dimensions
+        in the config). Codes without a DQ dimension in the config get an empty row.
+    """
+    config_dimensions = {code: entry.get("dq_dimension") for code, entry in error_config.items()}
+    config_dimensions = {code: dimension for code, dimension in config_dimensions.items() if isinstance(dimension, str) and dimension}
+    dimensions = sorted(set(config_dimensions.values()))
+    code_dimensions = [config_dimensions.get(code) for code in codes]
+    dimension_index = {dimension: position for position, dimension in enumerate(dimensions)}
+
+    incidence = np.zeros((len(codes), len(dimensions)), dtype=np.int64)
+    rows = [row for row, dimension in enumerate(code_dimensions) if dimension]
+    incidence[rows, [dimension_index[code_dimensions[row]] for row in rows]] = 1
+    return incidence, dimensions
+
+def dimension_totals(counts: pd.DataFrame, incidence: np.ndarray, dimensions: list) -> pd.DataFrame:
+    """
+    Count the introduced, detected and corrected errors per DQ dimension with one matrix product.
+
+    Args:
+        counts (pd.DataFrame): Per-code counts of code_counts, rows in the order of the incidence matrix rows.
+        incidence (np.ndarray): Incidence matrix of dimension_incidence_matrix.
+        dimensions (list): DQ dimensions of the incidence matrix columns.
+
+    Returns:
+        pd.DataFrame: Introduced, Detected and Corrected errors (columns) per DQ dimension (rows).
+    """
+    counts = counts[["Introduced", "Detected", "Corrected"]]
+    return pd.DataFrame(counts.to_numpy(dtype=np.int64).T @ incidence, index=counts.columns,
+                        columns=pd.Index(dimensions, name="DQ Dimension")).T
+
+def dimension_totals_from_chunks(chunks, error_config: dict) -> pd.DataFrame:
+    """
+    Count the introduced, detected and corrected errors per DQ dimension chunk by chunk, for streaming runs.
+
+    The matrix columns are the codes of the error config, so every chunk uses the same incidence matrix
+    and the chunk totals add up. Codes missing from the config have no dimension and are not counted.
+
+    Args:
+        chunks (iterable of pd.DataFrame): Chunks of a processed dataset.
+        error_config (dict): Error config, as returned by load_error_config.
+
+    Returns:
+        pd.DataFrame: Introduced, Detected and Corrected errors per DQ dimension, as returned by dimension_totals.
+    """
+    codes = sorted(error_config)
+    incidence, dimensions = dimension_incidence_matrix(error_config, codes)
+    totals = pd.DataFrame(0, index=pd.Index(dimensions, name="DQ Dimension"), columns=["Introduced", "Detected", "Corrected"])
+    for chunk in chunks:
+        totals += dimension_totals(code_counts(build_error_matrices(chunk, fields=[], codes=codes)), incidence, dimensions)
+    return totals
+
+def dimension_summary(totals: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build the DQ dimension improvements table from the dimension totals.
+
+    Args:
+        totals (pd.DataFrame): Result of dimension_totals or dimension_totals_from_chunks.
+
+    Returns:
+        pd.DataFrame: Introduced, Detected and Corrected Errors with detection and correction rates per DQ dimension
+        with at least one error, sorted by correction rate.
+    """
+    dq_summary = totals[totals.any(axis=1)].rename(columns=lambda kind: f"{kind} Errors").astype(float)
+    dq_summary.index.name = None
+    dq_summary["Detection Rate (%)"] = (dq_summary["Detected Errors"] / dq_summary["Introduced Errors"]) * 100
+    dq_summary["Correction Rate (%)"] = (dq_summary["Corrected Errors"] / dq_summary["Introduced Errors"]) * 100
+    return dq_summary.round(2).sort_values(by="Correction Rate (%)", ascending=False)
@@ -0,0 +1,96 @@
+import hashlib
+import os
+import numpy as np
+import pandas as pd
+
+GURS_CACHE_DIR = "src/cache/gurs"
+# Columns used by the generator and the address validation, with their dtypes. Text columns are parsed as
+# 'string' (dtype=str would turn empty cells into "None") and returned as object columns with NaN.
+GURS_DTYPES = {
+    'EID_NASLOV': 'Int64',
+    'OBCINA_NAZIV': 'string',
+    'NASELJE_NAZIV': 'string',
+    'ULICA_NAZIV': 'string',
+    'POSTNI_OKOLIS_SIFRA': 'Int64',
+    'POSTNI_OKOLIS_NAZIV': 'string',
+    'HS_STEVILKA': 'Int64',
+    'HS_DODATEK': 'string',
+    'ST_STANOVANJA': 'Int64',
+}
+
+def gurs_cache_path(path_to_gurs_RN_csv: str, cache_dir: str = GURS_CACHE_DIR) -> str:
+    """
+    Return the Parquet cache file of a GURS register snapshot.
+
+    The file name includes a hash of the absolute CSV path, size and modification time, so
+    snapshots with the same file name in different directories, or a CSV that was replaced,
+    never share a cache file.
+
+    Args:
+        path_to_gurs_RN_csv (str): Path to the GURS RN CSV file.
+        cache_dir (str): Cache directory.
+
+    Returns:
+        str: Path of the Parquet file, named after the CSV file and its hash.
+    """
+    stat = os.stat(path_to_gurs_RN_csv)
+    source = f"{os.path.abspath(path_to_gurs_RN_csv)}|{stat.st_size}|{stat.st_mtime_ns}"
+    key = hashlib.sha1(source.encode("utf-8")).hexdigest()[:16]
+    name = os.path.splitext(os.path.basename(path_to_gurs_RN_csv))[0]
+    return os.path.join(cache_dir, f"{name}-{key}.parquet")
+
+def text_columns_to_object(gurs_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Turn the text columns of the GURS register into object columns with NaN for missing values.
+
+    Args:
+        gurs_df (pd.DataFrame): GURS register read from the CSV or from the Parquet copy.
+
+    Returns:
+        pd.DataFrame: The same DataFrame, text columns converted in place.
+    """
+    for column in gurs_df.columns:
+        if GURS_DTYPES.get(column) == 'string':
+            gurs_df[column] = gurs_df[column].astype(object).where(gurs_df[column].notna(), np.nan)
+    return gurs_df
+
+def read_gurs_csv(path_to_gurs_RN_csv: str) -> pd.DataFrame:
+    """
+    Parse the GURS RN CSV file with the multithreaded pyarrow engine, reading only the columns in GURS_DTYPES.
+
+    Args:
+        path_to_gurs_RN_csv (str): Path to the GURS RN CSV file.
+
+    Returns:
+        pd.DataFrame: The GURS columns that exist in the file, with Int64 numeric and object text columns.
+    """
+    header = pd.read_csv(path_to_gurs_RN_csv, nrows=0).columns
+    columns = [column for column in GURS_DTYPES if column in header]
+    gurs_df = pd.read_csv(path_to_gurs_RN_csv, engine="pyarrow", usecols=columns,
+                          dtype={column: GURS_DTYPES[column] for column in columns})
+    return text_columns_to_object(gurs_df)
+
+def load_gurs_register(path_to_gurs_RN_csv: str, columns: list = None, cache_dir: str = GURS_CACHE_DIR) -> pd.DataFrame:
+    """
+    Load the GURS RN register, parsing the CSV only once per snapshot.
+
+    The first call parses the CSV and stores a Parquet copy of the GURS columns. Later calls read
+    only the requested columns from the Parquet copy, as long as the CSV file has not changed.
+
+    Args:
+        path_to_gurs_RN_csv (str): Path to the GURS RN CSV file.
+        columns (list, optional): Columns to load. Defaults to all columns in GURS_DTYPES that exist in the file.
+        cache_dir (str, optional): Cache directory, None disables the Parquet copy.
+
+    Returns:
+        pd.DataFrame: The GURS register.
+    """
+    cache_path = gurs_cache_path(path_to_gurs_RN_csv, cache_dir) if cache_dir else None
+    if cache_path and os.path.exists(cache_path):
+        return text_columns_to_object(pd.read_parquet(cache_path, columns=columns))
+
+    gurs_df = read_gurs_csv(path_to_gurs_RN_csv)
+    if cache_path:
+        os.makedirs(cache_dir, exist_ok=True)
+        gurs_df.to_parquet(cache_path, index=False)
+    return gurs_df[columns] if columns else gurs_df
@@ -0,0 +1,123 @@
+import numpy as np
+
+def confusion_counts(true, pred) -> np.ndarray:
+    """
+    Count true/false negatives and positives of boolean labels with one np.bincount on 2 * true + pred.
+
+    Args:
+        true (array-like): Boolean true labels, a vector or a (rows x columns) matrix.
+        pred (array-like): Boolean predicted labels, with the same shape as true.
+
+    Returns:
+        np.ndarray: Confusion matrix [[tn, fp], [fn, tp]] of shape (2, 2) for vectors,
+        or one per column of shape (columns, 2, 2) for matrices.
+    """
+    true = np.asarray(true, dtype=bool)
+    pred = np.asarray(pred, dtype=bool)
+    cells = 2 * true.astype(np.int64) + pred
+    if cells.ndim == 1:
+        return np.bincount(cells, minlength=4).reshape(2, 2)
+
+    # Every column gets its own four bins
+    columns = cells.shape[1]
+    cells = cells + 4 * np.arange(columns, dtype=np.int64)
+    return np.bincount(cells.ravel(), minlength=4 * columns).reshape(columns, 2, 2)
+
+def safe_divide(numerator, denominator):
+    """ Divide element-wise, 0 where the denominator is 0 (the zero_division=0 behaviour of sklearn). """
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    return np.divide(numerator, denominator, out=np.zeros(np.broadcast(numerator, denominator).shape), where=denominator != 0)
+
+def binary_metrics(cm: np.ndarray) -> dict:
+    """
+    Compute accuracy, precision, recall and F1 of the positive class from confusion matrices.
+
+    Args:
+        cm (np.ndarray): Confusion matrix of shape (2, 2) or (columns, 2, 2), as returned by confusion_counts.
+
+    Returns:
+        dict: accuracy, precision, recall and f1, floats for one matrix or arrays with one value per column.
+    """
+    cm = np.asarray(cm)
+    tn, fp, fn, tp = cm[..., 0, 0], cm[..., 0, 1], cm[..., 1, 0], cm[..., 1, 1]
+    metrics = {
+        "accuracy": safe_divide(tp + tn, cm.sum(axis=(-2, -1))),
+        "precision": safe_divide(tp, tp + fp),
+        "recall": safe_divide(tp, tp + fn),
+        "f1": safe_divide(2 * tp, 2 * tp + fp + fn),   # same as 2PR / (P + R), without its rounding errors
+    }
+    return {name: value.item() if value.ndim == 0 else value for name, value in metrics.items()}
+
+def classification_report_text(cm: np.ndarray, target_names: list = ("No Error", "Error"), digits: int = 2) -> str:
+    """
+    Build a text report with per-class precision, recall, F1 and support, in the format of sklearn's classification_report.
+
+    Args:
+        cm (np.ndarray): Confusion matrix of shape (2, 2), as returned by confusion_counts.
+        target_names (list): Names of the negative and the positive class.
+        digits (int): Number of digits of the floats.
+
+    Returns:
+        str: The report.
+    """
+    cm = np.asarray(cm)
+    support = cm.sum(axis=1)
+    predicted = cm.sum(axis=0)
+    correct = np.diag(cm)
+    precision = safe_divide(correct, predicted)
+    recall = safe_divide(correct, support)
+    f1 = safe_divide(2 * correct, support + predicted)
+    total = int(support.sum())
+
+    headers = ["precision", "recall", "f1-score", "support"]
+    width = max(max(len(name) for name in target_names), len("weighted avg"), digits)
+    head_fmt = "{:>{width}s} " + " {:>9}" * len(headers)
+    row_fmt = "{:>{width}s} " + " {:>9.{digits}f}" * 3 + " {:>9}\n"
+
+    report = head_fmt.format("", *headers, width=width) + "\n\n"
+    for name, row in zip(target_names, zip(precision, recall, f1, support)):
+        report += row_fmt.format(name, *row[:3], int(row[3]), width=width, digits=digits)
+    report += "\n"
+
+    accuracy = correct.sum() / total if total else 0.0
+    report += ("{:>{width}s} " + " {:>9.{digits}}" * 2 + " {:>9.{digits}f}" + " {:>9}\n").format(
+        "accuracy", "", "", accuracy, total, width=width, digits=digits)
+    report += row_fmt.format("macro avg", precision.mean(), recall.mean(), f1.mean(), total, width=width, digits=digits)
+    weighted = [np.average(values, weights=support) if total else 0.0 for values in (precision, recall, f1)]
+    report += row_fmt.format("weighted avg", *weighted, total, width=width, digits=digits)
+    return report
+
+def evaluate_performance(true_col, pred_col) -> tuple:
+    """
+    Evaluate boolean predictions against boolean true labels.
+
+    Args:
+        true_col (array-like): Boolean true labels.
+        pred_col (array-like): Boolean predicted labels.
+
+    Returns:
+        tuple: (accuracy, precision, recall, f1, confusion matrix, classification report text)
+    """
+    cm = confusion_counts(true_col, pred_col)
+    metrics = binary_metrics(cm)
+    report = classification_report_text(cm)
+    return metrics["accuracy"], metrics["precision"], metrics["recall"], metrics["f1"], cm, report
+
+def evaluate_performance_batched(true_matrix, pred_matrix) -> list:
+    """
+    Evaluate many boolean columns at once, e.g. one column per attribute or per error code.
+    All confusion matrices come from a single np.bincount.
+
+    Args:
+        true_matrix (array-like): Boolean (rows x columns) true labels.
+        pred_matrix (array-like): Boolean (rows x columns) predicted labels.
+
+    Returns:
+        list: One (accuracy, precision, recall, f1, confusion matrix, classification report text) tuple per column,
+        as returned by evaluate_performance.
+    """
+    cms = confusion_counts(true_matrix, pred_matrix)
+    metrics = binary_metrics(cms)
+    return [(float(metrics["accuracy"][column]), float(metrics["precision"][column]), float(metrics["recall"][column]),
+             float(metrics["f1"][column]), cm, classification_report_text(cm)) for column, cm in enumerate(cms)]
@@ -0,0 +1,173 @@
+from collections import Counter
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from utils.evaluation_utils import (FIELDS, build_error_matrices, code_counts, error_code_table, field_counts, field_error_table,
+                                    has_errors_flags, status_table, dimension_incidence_matrix, dimension_totals, dimension_summary)
+from utils.metrics_utils import confusion_counts, binary_metrics, classification_report_text
+
+# Confusion matrices of the evaluation in main.py: name -> (true flag, predicted flag) of has_errors_flags
+RECORD_CONFUSIONS = {
+    "detection": ("has_introduced", "has_detected"),
+    "correction": ("has_introduced", "has_corrected"),
+    "code_detection": ("has_introduced", "has_detected_errors"),
+    "code_correction": ("has_introduced", "has_corrected_errors"),
+}
+FIELD_CONFUSIONS = {
+    "detection": ("has_introduced", "has_detected"),
+    "correction": ("has_introduced", "has_corrected"),
+}
+
+def new_quality_summary() -> dict:
+    """
+    Create an empty quality summary.
+
+    A quality summary holds only counts, so it can be updated chunk by chunk with update_quality_summary,
+    merged across workers with merge_quality_summaries and turned into the reports of main.py with
+    quality_summary_reports, without keeping the processed rows in memory.
+
+    Returns:
+        dict: A dictionary with the following keys:
+            - rows (int): Number of rows.
+            - status_counts (dict): *_STATUS column -> Counter of its statuses.
+            - code_counts (dict): "introduced", "detected", "corrected" -> Counter of rows per error code.
+            - field_counts (dict): Field -> Counter of error codes and affected rows, see field_counts.
+            - confusion (dict): Name -> 2 x 2 confusion matrix, see RECORD_CONFUSIONS and FIELD_CONFUSIONS.
+    """
+    return {
+        "rows": 0,
+        "status_counts": {},
+        "code_counts": {kind: Counter() for kind in ("introduced", "detected", "corrected")},
+        "field_counts": {},
+        "confusion": {},
+    }
+
+def update_quality_summary(summary: dict, chunk: pd.DataFrame, fields: list = FIELDS) -> dict:
+    """
+    Add the counts of a chunk of a processed dataset to a quality summary.
+
+    Args:
+        summary (dict): Quality summary, changed in place.
+        chunk (pd.DataFrame): Chunk with the *_STATUS columns and the error columns used by build_error_matrices.
+        fields (list): Fields with per-field counts and confusion matrices.
+
+    Returns:
+        dict: The updated summary.
+    """
+    summary["rows"] += len(chunk)
+    for col in [col for col in chunk.columns if col.endswith('_STATUS')]:
+        summary["status_counts"].setdefault(col, Counter()).update(chunk[col].value_counts().to_dict())
+
+    matrices = build_error_matrices(chunk, fields)
+    counts = code_counts(matrices)
+    for kind, column in (("introduced", "Introduced"), ("detected", "Detected"), ("corrected", "Corrected")):
+        summary["code_counts"][kind].update({code: int(count) for code, count in counts[column].items() if count})
+    for field, counts in field_counts(matrices).items():
+        summary["field_counts"].setdefault(field, Counter()).update(counts)
+
+    confusions = {}
+    flags = has_errors_flags(matrices["introduced"], matrices["detected"], matrices["corrected"])
+    for name, (true_flag, pred_flag) in RECORD_CONFUSIONS.items():
+        confusions[name] = confusion_counts(flags[true_flag], flags[pred_flag])
+    for field, field_matrices in matrices["fields"].items():
+        field_flags = has_errors_flags(field_matrices["introduced"], field_matrices["detected"], field_matrices["corrected"])
+        for name, (true_flag, pred_flag) in FIELD_CONFUSIONS.items():
+            confusions[f"{field}_{name}"] = confusion_counts(field_flags[true_flag], field_flags[pred_flag])
+    for name, cm in confusions.items():
+        summary["confusion"][name] = summary["confusion"].get(name, np.zeros((2, 2), dtype=np.int64)) + cm
+
+    return summary
+
+def merge_quality_summaries(*summaries) -> dict:
+    """
+    Merge quality summaries, e.g. of chunks processed by different workers.
+
+    Args:
+        *summaries (dict): Quality summaries.
+
+    Returns:
+        dict: New summary with the counts of all summaries.
+    """
+    merged = new_quality_summary()
+    for summary in summaries:
+        merged["rows"] += summary["rows"]
+        for col, counts in summary["status_counts"].items():
+            merged["status_counts"].setdefault(col, Counter()).update(counts)
+        for kind, counts in summary["code_counts"].items():
+            merged["code_counts"][kind].update(counts)
+        for field, counts in summary["field_counts"].items():
+            merged["field_counts"].setdefault(field, Counter()).update(counts)
+        for name, cm in summary["confusion"].items():
+            merged["confusion"][name] = merged["confusion"].get(name, np.zeros((2, 2), dtype=np.int64)) + cm
+    return merged
+
+def summarize_chunks(chunks, fields: list = FIELDS) -> dict:
+    """
+    Build the quality summary of a dataset that is read or processed chunk by chunk.
+
+    Args:
+        chunks (iterable of pd.DataFrame): Chunks of a processed dataset.
+        fields (list): Fields with per-field counts and confusion matrices.
+
+    Returns:
+        dict: The quality summary.
+    """
+    summary = new_quality_summary()
+    for chunk in chunks:
+        update_quality_summary(summary, chunk, fields)
+    return summary
+
+def summarize_parquet(parquet_path: str, batch_size: int = 1_000_000, fields: list = FIELDS) -> dict:
+    """
+    Build the quality summary of a processed dataset stored as Parquet, one record batch at a time.
+    Only the *_STATUS and error columns are read.
+
+    Args:
+        parquet_path (str): Path of the Parquet file, e.g. the cached result of main.py.
+        batch_size (int): Rows per batch.
+        fields (list): Fields with per-field counts and confusion matrices.
+
+    Returns:
+        dict: The quality summary.
+    """
+    parquet_file = pq.ParquetFile(parquet_path)
+    columns = [col for col in parquet_file.schema_arrow.names if col.endswith(('_STATUS', '_ERRORS'))]
+    batches = parquet_file.iter_batches(batch_size=batch_size, columns=columns)
+    return summarize_chunks((batch.to_pandas() for batch in batches), fields)
+
+def quality_summary_reports(summary: dict, error_config: dict) -> dict:
+    """
+    Build the reports of main.py from a quality summary.
+
+    Args:
+        summary (dict): Quality summary.
+        error_config (dict): Error config, as returned by load_error_config.
+
+    Returns:
+        dict: A dictionary with the following keys:
+            - error_comparison (pd.DataFrame): Counts and rates per error code, see error_code_table.
+            - field_error_summary (pd.DataFrame): Counts and rates per field, see field_error_table.
+            - status_summary (pd.DataFrame): Status counts, see status_table.
+            - dq_summary (pd.DataFrame): Counts and rates per DQ dimension, see dimension_summary.
+            - metrics (dict): Confusion matrix name -> (accuracy, precision, recall, f1, confusion matrix, classification report text).
+    """
+    counts = pd.DataFrame({column: pd.Series(summary["code_counts"][kind], dtype="int64")
+                           for kind, column in (("introduced", "Introduced"), ("detected", "Detected"), ("corrected", "Corrected"))}
+                          ).fillna(0).astype(int).sort_index()
+    incidence, dimensions = dimension_incidence_matrix(error_config, list(counts.index))
+
+    metrics = {}
+    for name, cm in summary["confusion"].items():
+        scores = binary_metrics(cm)
+        metrics[name] = (scores["accuracy"], scores["precision"], scores["recall"], scores["f1"], cm, classification_report_text(cm))
+
+    empty_field = {f"{kind}{suffix}": 0 for kind in ("introduced", "detected", "corrected") for suffix in ("", "_rows")}
+    return {
+        "error_comparison": error_code_table(counts),
+        "field_error_summary": field_error_table({field: {**empty_field, **counts} for field, counts in summary["field_counts"].items()}),
+        "status_summary": status_table(summary["status_counts"]),
+        "dq_summary": dimension_summary(dimension_totals(counts, incidence, dimensions)),
+        "metrics": metrics,
+    }
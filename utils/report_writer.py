@@ -0,0 +1,140 @@
+import os
+import pandas as pd
+from openpyxl import Workbook
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from utils.evaluation_utils import error_code_matrix, render_code_matrix
+from utils.data_io import data_format, write_data
+
+# Excel sheets hold at most 1,048,576 rows, one is the header
+EXCEL_MAX_ROWS = 1_048_575
+# Rows converted to Python values at a time while streaming a sheet
+EXCEL_WRITE_ROWS = 10_000
+
+ADDRESS_LEADING = ["CUSTOMER_ID", "FULL_ADDRESS", "FULL_ADDRESS_VALID", "FULL_ADDRESS_CORRECTED"]
+ADDRESS_TRAILING = ["FULL_ADDRESS_VALID_AFTER_CORRECTION", "FULL_ADDRESS_STATUS"]
+
+# Report sheets: (sheet name, leading columns, prefixes of the columns in between, trailing columns)
+REPORT_SHEETS = [
+    ("Overview", ["CUSTOMER_ID", "FIRST_NAME_STATUS", "LAST_NAME_STATUS", "FULL_ADDRESS_STATUS",
+                  "EMAIL_STATUS", "PHONE_NUMBER_STATUS", "OVERALL_STATUS"], (), []),
+    ("Names", ["CUSTOMER_ID"], ("FIRST_NAME", "LAST_NAME"), []),
+    ("First name", ["CUSTOMER_ID"], ("FIRST_NAME",), []),
+    ("Last name", ["CUSTOMER_ID"], ("LAST_NAME",), []),
+    ("Address", ADDRESS_LEADING, ("STREET", "HOUSE_NUMBER", "POSTAL_CODE", "POSTAL_CITY"), ADDRESS_TRAILING),
+    ("Street", ADDRESS_LEADING, ("STREET",), ADDRESS_TRAILING),
+    ("House number", ADDRESS_LEADING, ("HOUSE_NUMBER",), ADDRESS_TRAILING),
+    ("Postal code", ADDRESS_LEADING, ("POSTAL_CODE",), ADDRESS_TRAILING),
+    ("Postal city", ADDRESS_LEADING, ("POSTAL_CITY",), ADDRESS_TRAILING),
+    ("Email", ["CUSTOMER_ID"], ("EMAIL",), []),
+    ("Phone", ["CUSTOMER_ID"], ("PHONE_NUMBER",), []),
+]
+
+def escape_excel_formulas(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Prefix text values starting with "=" with an apostrophe, so Excel shows them as text instead of evaluating them.
+    Only object columns are checked, with one vectorized string operation per column.
+
+    Args:
+        df (pd.DataFrame): Report data.
+
+    Returns:
+        pd.DataFrame: Shallow copy of the data, only the columns with escaped values are copied.
+    """
+    df = df.copy(deep=False)
+    for col in df.columns[df.dtypes == object]:
+        # The .str accessor refuses object columns without text, e.g. booleans with missing values
+        if pd.api.types.infer_dtype(df[col], skipna=True) not in ("string", "mixed", "mixed-integer"):
+            continue
+        formulas = df[col].str.startswith("=", na=False).to_numpy(dtype=bool)
+        if formulas.any():
+            escaped = df[col].copy()
+            escaped[formulas] = "'" + escaped[formulas]
+            df[col] = escaped
+    return df
+
+def serialize_error_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Write the error sets and lists of the *ERRORS* columns as comma separated strings of sorted codes.
+    Every column is parsed once into an error code matrix and every distinct row is rendered once.
+
+    Args:
+        df (pd.DataFrame): Processed data.
+
+    Returns:
+        pd.DataFrame: Shallow copy of the data, only the error columns are replaced.
+    """
+    df = df.copy(deep=False)
+    for col in df.columns:
+        if "ERRORS" in col and df[col].dtype == "object":
+            matrix, codes = error_code_matrix(df[col])
+            df[col] = render_code_matrix(matrix, codes)
+    return df
+
+def report_sheet_columns(columns, leading: list, prefixes: tuple, trailing: list) -> list:
+    """
+    Select the columns of a report sheet.
+
+    Args:
+        columns (list): Columns of the data.
+        leading (list): Columns at the start of the sheet.
+        prefixes (tuple): Prefixes of the columns in between, in the order of the data.
+        trailing (list): Columns at the end of the sheet.
+
+    Returns:
+        list: Sheet columns that exist in the data.
+    """
+    middle = [col for col in columns if prefixes and col.startswith(prefixes) and col not in leading and col not in trailing]
+    return [col for col in leading if col in columns] + middle + [col for col in trailing if col in columns]
+
+def write_excel_report(df: pd.DataFrame, path: str, sheets: list = REPORT_SHEETS) -> None:
+    """
+    Write the report sheets to an Excel workbook in openpyxl write-only mode, which streams the rows
+    to the file instead of keeping all cells in memory. Rows are converted to Python values in blocks
+    of EXCEL_WRITE_ROWS. Sheets longer than an Excel sheet continue on "<sheet> (2)", "<sheet> (3)", ...
+
+    Args:
+        df (pd.DataFrame): Data with serialized error columns and escaped formulas.
+        path (str): Path of the .xlsx file.
+        sheets (list): Sheet definitions, see REPORT_SHEETS.
+    """
+    workbook = Workbook(write_only=True)
+    for sheet_name, leading, prefixes, trailing in sheets:
+        sheet_df = df[report_sheet_columns(df.columns, leading, prefixes, trailing)]
+        for part, sheet_start in enumerate(range(0, max(len(sheet_df), 1), EXCEL_MAX_ROWS)):
+            worksheet = workbook.create_sheet(sheet_name if part == 0 else f"{sheet_name} ({part + 1})")
+            worksheet.append(list(sheet_df.columns))
+            sheet_end = min(sheet_start + EXCEL_MAX_ROWS, len(sheet_df))
+            for start in range(sheet_start, sheet_end, EXCEL_WRITE_ROWS):
+                block = sheet_df.iloc[start:min(start + EXCEL_WRITE_ROWS, sheet_end)]
+                # Missing values become empty cells
+                for row in block.astype(object).where(block.notna(), None).itertuples(index=False, name=None):
+                    worksheet.append(list(row))
+    workbook.save(path)
+
+def write_report(df: pd.DataFrame, path: str, sheets: list = REPORT_SHEETS) -> str:
+    """
+    Write the processed data as a report, in the format given by the file extension.
+
+    Excel writes one sheet per report sheet with write_excel_report. Parquet, Feather and CSV are fast alternatives
+    that write all columns to one file with write_data, the sheets are column selections of it.
+    Error sets are serialized for all formats, formulas are escaped for Excel and CSV.
+
+    Args:
+        df (pd.DataFrame): Processed data.
+        path (str): Path of the report, with an extension supported by utils/data_io.py.
+        sheets (list): Sheet definitions for Excel, see REPORT_SHEETS.
+
+    Returns:
+        str: The path.
+    """
+    file_format = data_format(path)
+    report_df = serialize_error_columns(df)
+    if file_format in ("csv", "excel"):
+        report_df = escape_excel_formulas(report_df)
+
+    if file_format == "excel":
+        write_excel_report(report_df, path, sheets)
+    else:
+        write_data(report_df, path)
+    return path
@@ -0,0 +1,54 @@
+import numpy as np
+
+def build_alias_table(weights) -> dict:
+    """
+    Build a Walker/Vose alias table for weighted sampling.
+
+    The table is built once in O(n). Every draw then needs one uniform integer, one uniform
+    float and two lookups, however many values there are and however many draws are made.
+
+    Args:
+        weights (array-like): Non-negative weights (counts or frequencies) of the values. NaN counts as 0.
+
+    Returns:
+        dict: A dictionary with the following keys:
+            - probability (np.ndarray): float64 probability of keeping column i instead of taking its alias.
+            - alias (np.ndarray): int64 alias of every column.
+    """
+    weights = np.nan_to_num(np.asarray(weights, dtype=np.float64))
+    n = len(weights)
+    if n == 0 or weights.sum() <= 0:
+        raise ValueError("Alias table needs at least one positive weight")
+
+    scaled = weights * n / weights.sum()
+    probability = np.ones(n, dtype=np.float64)
+    alias = np.arange(n, dtype=np.int64)
+    small = list(np.flatnonzero(scaled < 1.0))
+    large = list(np.flatnonzero(scaled >= 1.0))
+
+    while small and large:
+        less, more = small.pop(), large.pop()
+        probability[less] = scaled[less]
+        alias[less] = more
+        scaled[more] -= 1.0 - scaled[less]
+        (small if scaled[more] < 1.0 else large).append(more)
+    # Leftovers are 1 up to rounding errors
+    for column in small + large:
+        probability[column] = 1.0
+
+    return {"probability": probability, "alias": alias}
+
+def sample_alias(table: dict, size: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Draw weighted random positions from an alias table.
+
+    Args:
+        table (dict): Table built by build_alias_table.
+        size (int): Number of draws.
+        rng (np.random.Generator): Random generator.
+
+    Returns:
+        np.ndarray: int64 positions of the drawn values.
+    """
+    columns = rng.integers(0, len(table["alias"]), size)
+    return np.where(rng.random(size) < table["probability"][columns], columns, table["alias"][columns])
@@ -0,0 +1,105 @@
+import json
+import time
+import pandas as pd
+
+def start_stage_timer(timings: list, pipeline: str, rows: int) -> dict:
+    """
+    Start timing the stages of a pipeline.
+
+    The stages are timed as laps: record_stage closes the stage that ran since the previous call (or since the start),
+    so a pipeline only needs one call after each of its steps. Without a timings list nothing is measured.
+
+    Args:
+        timings (list): List that collects the stage timings, or None to disable timing.
+        pipeline (str): Name of the pipeline, e.g. "names".
+        rows (int): Number of rows processed by the pipeline.
+
+    Returns:
+        dict: Timer for record_stage, None if timing is disabled.
+    """
+    if timings is None:
+        return None
+    return {"timings": timings, "pipeline": pipeline, "rows": rows,
+            "wall_start": time.perf_counter(), "cpu_start": time.process_time()}
+
+def record_stage(timer: dict, stage: str) -> None:
+    """
+    Record the wall time and CPU time of the stage that ended now, and start the next stage.
+
+    Args:
+        timer (dict): Timer returned by start_stage_timer, None if timing is disabled.
+        stage (str): Name of the stage, e.g. "validate", "detect", "has_errors", "correct", "was_corrected", "revalidate" or "status".
+    """
+    if timer is None:
+        return
+    wall_end, cpu_end = time.perf_counter(), time.process_time()
+    timer["timings"].append({
+        "pipeline": timer["pipeline"],
+        "stage": stage,
+        "rows": timer["rows"],
+        "wall_time": wall_end - timer["wall_start"],
+        "cpu_time": cpu_end - timer["cpu_start"],
+    })
+    timer["wall_start"], timer["cpu_start"] = wall_end, cpu_end
+
+def stage_timings_summary(timings: list) -> dict:
+    """
+    Summarize stage timings per pipeline and in total.
+
+    Args:
+        timings (list): Stage timings collected with record_stage.
+
+    Returns:
+        dict: A dictionary with the following keys:
+            - stages (list): The stage timings, dictionaries with pipeline, stage, rows, wall_time and cpu_time (seconds).
+            - pipelines (dict): Pipeline -> dictionary with rows, wall_time and cpu_time of all its stages.
+            - total (dict): wall_time and cpu_time of all stages.
+    """
+    pipelines = {}
+    for timing in timings:
+        pipeline = pipelines.setdefault(timing["pipeline"], {"rows": timing["rows"], "wall_time": 0.0, "cpu_time": 0.0})
+        pipeline["wall_time"] += timing["wall_time"]
+        pipeline["cpu_time"] += timing["cpu_time"]
+    return {
+        "stages": list(timings),
+        "pipelines": pipelines,
+        "total": {"wall_time": sum(timing["wall_time"] for timing in timings),
+                  "cpu_time": sum(timing["cpu_time"] for timing in timings)},
+    }
+
+def stage_timings_json(timings: list, path: str = None) -> str:
+    """
+    Serialize the stage timings summary to JSON.
+
+    Args:
+        timings (list): Stage timings collected with record_stage.
+        path (str): If given, the JSON is also written to this file.
+
+    Returns:
+        str: The JSON of stage_timings_summary.
+    """
+    summary_json = json.dumps(stage_timings_summary(timings), indent=2)
+    if path:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(summary_json)
+    return summary_json
+
+def stage_timings_table(timings: list) -> pd.DataFrame:
+    """
+    Build a table of the stage timings, to see where the time goes.
+
+    Args:
+        timings (list): Stage timings collected with record_stage.
+
+    Returns:
+        pd.DataFrame: One row per pipeline and stage, in the order they ran, with rows, wall and CPU time,
+        throughput and the share of the total wall time.
+    """
+    table = pd.DataFrame(timings, columns=["pipeline", "stage", "rows", "wall_time", "cpu_time"])
+    table.columns = ["Pipeline", "Stage", "Rows", "Wall Time (s)", "CPU Time (s)"]
+    wall_time = table["Wall Time (s)"]
+    table["Rows per Second"] = (table["Rows"] / wall_time.where(wall_time > 0)).round(0)
+    table["Wall Time (%)"] = (wall_time / wall_time.sum() * 100).round(2) if wall_time.sum() > 0 else 0.0
+    table["Wall Time (s)"] = wall_time.round(3)
+    table["CPU Time (s)"] = table["CPU Time (s)"].round(3)
+    return table.set_index(["Pipeline", "Stage"])
@@ -0,0 +1,139 @@
+import numpy as np
+import unidecode
+
+
+def fold_text(text: str) -> str:
+    """
+    Fold a string to an ASCII, upper case key (e.g. "Škofja Loka" -> "SKOFJA LOKA").
+
+    Args:
+        text (str): String to fold.
+
+    Returns:
+        str: The folded string.
+    """
+    return unidecode.unidecode(text).upper()
+
+def levenshtein_distance(a: str, b: str) -> int:
+    """
+    Compute the Levenshtein (edit) distance between two strings.
+
+    Args:
+        a (str): First string.
+        b (str): Second string.
+
+    Returns:
+        int: Minimum number of insertions, deletions and substitutions needed to turn a into b.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    previous_row = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current_row = [i]
+        for j, char_b in enumerate(b, start=1):
+            current_row.append(min(
+                previous_row[j] + 1,                        # deletion
+                current_row[j - 1] + 1,                     # insertion
+                previous_row[j - 1] + (char_a != char_b)    # substitution
+            ))
+        previous_row = current_row
+    return previous_row[-1]
+
+def encode_strings(strings) -> tuple:
+    """
+    Encode strings as a padded matrix of unicode code points for levenshtein_distances.
+
+    Args:
+        strings (list of str): Strings to encode.
+
+    Returns:
+        tuple (np.ndarray, np.ndarray)
+            - codes : (len(strings), max_length) uint32 matrix of code points, padded with 0.
+            - lengths : Length of every string.
+    """
+    lengths = np.fromiter((len(s) for s in strings), dtype=np.int64, count=len(strings))
+    codes = np.zeros((len(strings), max(int(lengths.max(initial=0)), 1)), dtype=np.uint32)
+    for row, s in enumerate(strings):
+        codes[row, :len(s)] = np.frombuffer(s.encode("utf-32-le"), dtype=np.uint32)
+    return codes, lengths
+
+def levenshtein_distances(query: str, codes: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    Compute the Levenshtein distance between one string and many candidates at once.
+
+    The dynamic programming table is filled one query character at a time for all
+    candidates together; the insertion step along a row is resolved with a cumulative
+    minimum, so the cost is a handful of numpy operations per query character.
+
+    Args:
+        query (str): String to compare.
+        codes (np.ndarray): Candidates encoded with encode_strings.
+        lengths (np.ndarray): Candidate lengths returned by encode_strings.
+
+    Returns:
+        np.ndarray: Edit distance from query to every candidate.
+    """
+    n_candidates, width = codes.shape
+    positions = np.arange(width + 1, dtype=np.int32)
+    previous_row = np.tile(positions, (n_candidates, 1))
+    row = np.empty_like(previous_row)
+    for i, char in enumerate(query, start=1):
+        np.add(previous_row[:, 1:], 1, out=row[:, 1:])                                     # deletion
+        np.minimum(row[:, 1:], previous_row[:, :-1] + (codes != ord(char)), out=row[:, 1:])  # substitution
+        row[:, 0] = i
+        row -= positions
+        np.minimum.accumulate(row, axis=1, out=previous_row)                                 # insertion
+        previous_row += positions
+    return previous_row[np.arange(n_candidates), lengths]
+
+def build_bk_tree(words) -> dict:
+    """
+    Build a BK-tree over words for nearest-neighbour search under the Levenshtein distance.
+
+    Every node is a dictionary {"word": str, "children": {distance: node}}.
+
+    Args:
+        words (iterable of str): Words to index, duplicates are ignored.
+
+    Returns:
+        dict or None: The root node, or None if words is empty.
+    """
+    root = None
+    for word in words:
+        if root is None:
+            root = {"word": word, "children": {}}
+            continue
+        node = root
+        while True:
+            distance = levenshtein_distance(word, node["word"])
+            if distance == 0:
+                break
+            if distance not in node["children"]:
+                node["children"][distance] = {"word": word, "children": {}}
+                break
+            node = node["children"][distance]
+    return root
+
+def search_bk_tree(tree: dict, query: str, max_distance: int) -> list:
+    """
+    Find all words in a BK-tree within max_distance of query.
+
+    Args:
+        tree (dict): Root node returned by build_bk_tree.
+        query (str): String to look up.
+        max_distance (int): Maximum Levenshtein distance.
+
+    Returns:
+        list: (word, distance) tuples sorted by distance.
+    """
+    matches = []
+    nodes = [tree] if tree is not None else []
+    while nodes:
+        node = nodes.pop()
+        distance = levenshtein_distance(query, node["word"])
+        if distance <= max_distance:
+            matches.append((node["word"], distance))
+        # Triangle inequality: only children at distance - max_distance .. distance + max_distance can match
+        nodes.extend(child for child_distance, child in node["children"].items()
+                     if distance - max_distance <= child_distance <= distance + max_distance)
+    return sorted(matches, key=lambda match: match[1])
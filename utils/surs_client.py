@@ -0,0 +1,208 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+SURS_BASE_URL = "https://pxweb.stat.si/SiStatData/api/v1/sl/Data"
+SURS_CACHE_DIR = "src/cache/surs"
+SURS_QUERY = {
+    "query": [
+        {"code": "MERITVE", "selection": {"filter": "item", "values": ["1"]}},
+        {"code": "LETO", "selection": {"filter": "item", "values": ["2024"]}}
+    ],
+    "response": {"format": "json-stat"}
+}
+# Female and male first names, then the four surname tables
+SURS_NAME_TABLES = ["05X1010S", "05X1005S"]
+SURS_SURNAME_TABLES = ["05X1015S", "05X1016S", "05X1017S", "05X1018S"]
+
+def create_surs_session(retries: int = 3, backoff_factor: float = 0.5, pool_size: int = 6) -> requests.Session:
+    """
+    Create a pooled requests session that retries failed SURS requests with exponential backoff.
+
+    Args:
+        retries (int): Retries per request on connection errors and 429/5xx responses.
+        backoff_factor (float): Backoff factor between retries, see urllib3 Retry.
+        pool_size (int): Connections kept open per host.
+
+    Returns:
+        requests.Session: The session.
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}),  # the SURS queries are read-only POSTs
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def surs_cache_path(url: str, cache_dir: str) -> str:
+    """
+    Return the cache file of a SURS table, named after the hash of its URL and query.
+
+    Args:
+        url (str): Table URL.
+        cache_dir (str): Cache directory.
+
+    Returns:
+        str: Path of the JSON cache file.
+    """
+    key = hashlib.sha1((url + json.dumps(SURS_QUERY, sort_keys=True)).encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, f"{key}.json")
+
+def parse_surs_table(data: dict, key: str) -> pd.DataFrame:
+    """
+    Convert a json-stat SURS response to a DataFrame.
+
+    Args:
+        data (dict): json-stat response.
+        key (str): Dimension with the labels, "IME" for names and "PRIIMEK" for surnames.
+
+    Returns:
+        pd.DataFrame: DataFrame with "value" and "count" columns.
+    """
+    labels = data['dataset']['dimension'][key]['category']['label']
+    return pd.DataFrame({"value": list(labels.values()), "count": data['dataset']['value']})
+
+def fetch_surs_table(session: requests.Session, url: str, key: str, cache_dir: str = SURS_CACHE_DIR,
+                     timeout: float = 30):
+    """
+    Fetch one SURS table, revalidating the cached copy with ETag/Last-Modified.
+
+    A 304 response or a failed request falls back to the cached copy, if there is one.
+
+    Args:
+        session (requests.Session): Session created by create_surs_session.
+        url (str): Table URL.
+        key (str): Dimension with the labels, "IME" for names and "PRIIMEK" for surnames.
+        cache_dir (str, optional): Cache directory, None disables the cache.
+        timeout (float): Request timeout in seconds.
+
+    Returns:
+        pd.DataFrame or None: DataFrame with "value" and "count" columns, None if the request failed and there is no cached copy.
+    """
+    cached = None
+    path = surs_cache_path(url, cache_dir) if cache_dir else None
+    if path and os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            cached = json.load(f)
+
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        response = session.post(url, json=SURS_QUERY, headers=headers, timeout=timeout)
+    except requests.RequestException as e:
+        print(f"Failed to fetch data from {url}: {e}")
+        response = None
+
+    if response is not None and response.status_code == 200:
+        data = response.json()
+        if path:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"etag": response.headers.get("ETag"), "last_modified": response.headers.get("Last-Modified"),
+                           "data": data}, f)
+        return parse_surs_table(data, key)
+
+    if response is not None and response.status_code != 304:
+        print(f"Failed to fetch data from {url}. Status code: {response.status_code}")
+    if cached:
+        return parse_surs_table(cached["data"], key)
+    return None
+
+def fetch_surs_tables(session: requests.Session = None, base_url: str = SURS_BASE_URL,
+                      cache_dir: str = SURS_CACHE_DIR, max_workers: int = 6) -> tuple:
+    """
+    Fetch the SURS name and surname tables concurrently.
+
+    Args:
+        session (requests.Session, optional): Session created by create_surs_session. A new one is created if None.
+        base_url (str): Base URL of the SURS tables.
+        cache_dir (str, optional): Cache directory, None disables the cache.
+        max_workers (int): Concurrent requests.
+
+    Returns:
+        tuple (pd.DataFrame, pd.DataFrame):
+            - all_names : DataFrame with the "value" and "count" of first names (female, then male), None if a name table is not available.
+            - all_surnames : DataFrame with the "value" and "count" of last names, None if a surname table is not available.
+    """
+    session = session or create_surs_session(pool_size=max_workers)
+    tables = [(table, "IME") for table in SURS_NAME_TABLES] + [(table, "PRIIMEK") for table in SURS_SURNAME_TABLES]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        frames = list(executor.map(lambda table: fetch_surs_table(session, f"{base_url}/{table[0]}.px", table[1], cache_dir), tables))
+
+    names, surnames = frames[:len(SURS_NAME_TABLES)], frames[len(SURS_NAME_TABLES):]
+    all_names = pd.concat(names, ignore_index=True) if all(frame is not None for frame in names) else None
+    all_surnames = pd.concat(surnames, ignore_index=True) if all(frame is not None for frame in surnames) else None
+    return all_names, all_surnames
+
+def calculate_frequencies(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add the relative frequency of every value, computed from its count.
+
+    Args:
+        df (pd.DataFrame): Names or surnames with a "count" column.
+
+    Returns:
+        pd.DataFrame: The same DataFrame with a "frequency" column, 0 where the count is missing.
+    """
+    df["frequency"] = df["count"].fillna(0) / df["count"].sum()
+    return df
+
+def fetch_surs_data(session: requests.Session = None, base_url: str = SURS_BASE_URL, cache_dir: str = SURS_CACHE_DIR) -> tuple:
+    """
+    Fetch the SURS name and surname tables with their frequencies.
+
+    Args:
+        session (requests.Session, optional): Session created by create_surs_session.
+        base_url (str): Base URL of the SURS tables.
+        cache_dir (str, optional): Cache directory, None disables the cache.
+
+    Returns:
+        tuple (pd.DataFrame, pd.DataFrame):
+            - all_names : DataFrame containing first names and their frequencies, None if SURS is not available.
+            - all_surnames : DataFrame containing last names and their frequencies, None if SURS is not available.
+    """
+    all_names, all_surnames = fetch_surs_tables(session, base_url, cache_dir)
+    return tuple(None if df is None else calculate_frequencies(df) for df in (all_names, all_surnames))
+
+if __name__ == "__main__":
+
+    import sys, time
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+    from utils.surs_stub_server import start_surs_stub_server
+
+    # Benchmark sequential, uncached requests against the pooled, concurrent and cached client on a local stand-in
+    server, base_url = start_surs_stub_server(latency=0.2)
+    try:
+        start = time.perf_counter()
+        for table in SURS_NAME_TABLES + SURS_SURNAME_TABLES:
+            requests.post(f"{base_url}/{table}.px", json=SURS_QUERY).json()
+        sequential = time.perf_counter() - start
+
+        import tempfile
+        with tempfile.TemporaryDirectory() as cache_dir:
+            session = create_surs_session()
+            start = time.perf_counter()
+            fetch_surs_data(session, base_url, cache_dir)
+            concurrent = time.perf_counter() - start
+            start = time.perf_counter()
+            fetch_surs_data(session, base_url, cache_dir)
+            revalidated = time.perf_counter() - start
+    finally:
+        server.shutdown()
+
+    print(f"sequential: {sequential:.2f}s, concurrent: {concurrent:.2f}s, revalidated from cache: {revalidated:.2f}s")
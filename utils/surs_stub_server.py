@@ -0,0 +1,94 @@
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Small stand-in versions of the SURS name and surname tables: table -> (dimension, {label: count})
+SURS_STUB_TABLES = {
+    "05X1010S": ("IME", {"Marija": 10000, "Ana": 8000, "Špela": 3000}),
+    "05X1005S": ("IME", {"Franc": 9000, "Janez": 8500, "Luka": None}),
+    "05X1015S": ("PRIIMEK", {"Novak": 11000, "Horvat": 9000}),
+    "05X1016S": ("PRIIMEK", {"Kovačič": 5000}),
+    "05X1017S": ("PRIIMEK", {"Krajnc": 4000, "Zupančič": 3800}),
+    "05X1018S": ("PRIIMEK", {"Potočnik": 3500}),
+}
+
+def surs_stub_response(key: str, counts: dict) -> bytes:
+    """
+    Build a json-stat response body in the shape returned by the SURS API.
+
+    Args:
+        key (str): Dimension with the labels, "IME" or "PRIIMEK".
+        counts (dict): Label -> count.
+
+    Returns:
+        bytes: UTF-8 encoded JSON body.
+    """
+    labels = {str(i): label for i, label in enumerate(counts)}
+    data = {"dataset": {"dimension": {key: {"category": {"label": labels}}}, "value": list(counts.values())}}
+    return json.dumps(data).encode("utf-8")
+
+class SURSStubHandler(BaseHTTPRequestHandler):
+    """ Answer SURS table queries from server.tables, with ETag revalidation, optional latency and failures. """
+
+    def do_POST(self):
+        server = self.server
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        table = self.path.rstrip("/").rsplit("/", 1)[-1].removesuffix(".px")
+        with server.lock:
+            server.requests.append(table)
+            fail = server.failures > 0
+            server.failures -= fail
+        time.sleep(server.latency)
+
+        if fail:
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if table not in server.tables:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = surs_stub_response(*server.tables[table])
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def start_surs_stub_server(tables: dict = None, latency: float = 0.0, failures: int = 0) -> tuple:
+    """
+    Start a local stand-in for the SURS API in a background thread.
+
+    Args:
+        tables (dict, optional): Table -> (dimension, {label: count}). Defaults to SURS_STUB_TABLES.
+        latency (float): Seconds every request waits before answering.
+        failures (int): Number of requests answered with 503 before the server starts answering normally.
+
+    Returns:
+        tuple: (server, base_url). server.requests lists the requested tables, call server.shutdown() to stop it.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SURSStubHandler)
+    server.daemon_threads = True
+    server.tables = tables or SURS_STUB_TABLES
+    server.latency = latency
+    server.failures = failures
+    server.requests = []
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/SiStatData/api/v1/sl/Data"
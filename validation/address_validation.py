@@ -1,6 +1,11 @@
+import numpy as np
 import pandas as pd
 import unicodedata
 import regex as re
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from utils.data_io import read_data, write_data
+from utils.gurs_loader import load_gurs_register
 
 def normalize_text(text):
     if pd.isna(text):
@@ -11,7 +16,29 @@ def normalize_text(text):
     text = text.strip()                         # Trim leading/trailing
     return text
 
-def load_gurs_data(path_to_gurs_RN_csv: str) -> pd.DataFrame:
+# Characters matched by \s of the regex module used in normalize_text, for the pandas (re) string kernels
+WHITESPACE_PATTERN = r"[\t\n\x0b\x0c\r \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]+"
+
+def normalize_text_series(texts: pd.Series) -> pd.Series:
+    """
+    Vectorized version of normalize_text for a whole Series.
+    NFKC normalization is skipped for pure ASCII values, where it does not change anything.
+
+    Args:
+        texts (pd.Series): Series of values to normalize.
+
+    Returns:
+        pd.Series: Series of normalized strings, missing values become empty strings.
+    """
+    texts = texts.astype(object).where(texts.notna(), "").astype(str)
+    non_ascii = texts.str.contains(r"[^\x00-\x7f]", regex=True)
+    if non_ascii.any():
+        texts = texts.copy()
+        texts[non_ascii] = texts[non_ascii].str.normalize("NFKC")   # Normalize unicode (e.g., č, š)
+    texts = texts.str.replace(WHITESPACE_PATTERN, " ", regex=True)  # Replace multiple whitespace with single space
+    return texts.str.strip().astype(object)                         # Trim leading/trailing
+
+def load_gurs_dataframe(path_to_gurs_RN_csv: str) -> pd.DataFrame:
     """
     Load GURS RN data from a CSV file and prepare it for validation.
     This function loads the GURS RN data, cleans the POSTNI_OKOLIS_NAZIV column,
@@ -21,17 +48,17 @@ def load_gurs_data(path_to_gurs_RN_csv: str) -> pd.DataFrame:
         path_to_gurs_RN_csv (str): Path to the GURS RN CSV file.
 
     Returns:
-        pd.DataFrame: DataFrame containing the cleaned GURS RN data.
+        pd.DataFrame: DataFrame containing the cleaned GURS RN data, one row per GURS_FULL_ADDRESS.
     """
     # path_to_gurs_RN_csv = "src/raw_data/RN_SLO_NASLOVI_register_naslovov_20240929.csv"
     
     # Load and prepare GURS data
-    gurs_df = pd.read_csv(path_to_gurs_RN_csv, usecols = ['ULICA_NAZIV','HS_STEVILKA','HS_DODATEK','POSTNI_OKOLIS_SIFRA','POSTNI_OKOLIS_NAZIV'])
+    gurs_df = load_gurs_register(path_to_gurs_RN_csv, columns = ['ULICA_NAZIV','HS_STEVILKA','HS_DODATEK','POSTNI_OKOLIS_SIFRA','POSTNI_OKOLIS_NAZIV'])
     print("GURS data loaded.")
     
     # Remove dvojezična imena from POSTNI_OKOLIS_NAZIV
     for col in ['ULICA_NAZIV','HS_STEVILKA','HS_DODATEK','POSTNI_OKOLIS_SIFRA','POSTNI_OKOLIS_NAZIV']:
-        gurs_df[col] = gurs_df[col].apply(normalize_text)
+        gurs_df[col] = normalize_text_series(gurs_df[col])
     gurs_df['POSTNI_OKOLIS_NAZIV'] = gurs_df['POSTNI_OKOLIS_NAZIV'].str.split('-').str[0].str.strip()
     print("POSTNI_OKOLIS_NAZIV cleaned.")
     
@@ -44,14 +71,39 @@ def load_gurs_data(path_to_gurs_RN_csv: str) -> pd.DataFrame:
     )
     print("GURS_FULL_ADDRESS created.")
     
-    gurs_df["GURS_FULL_ADDRESS"] = gurs_df["GURS_FULL_ADDRESS"].apply(normalize_text)
+    gurs_df["GURS_FULL_ADDRESS"] = normalize_text_series(gurs_df["GURS_FULL_ADDRESS"])
     gurs_df = gurs_df.drop_duplicates(subset=["GURS_FULL_ADDRESS"])
     # gurs_df.to_excel("src/processed_data/gurs_full_address.xlsx", index=False)
-    gurs_address_set = set(gurs_df["GURS_FULL_ADDRESS"].dropna().apply(normalize_text).str.strip())
+    
+    return gurs_df
+
+def build_gurs_address_set(gurs_df: pd.DataFrame) -> set:
+    """
+    Build the set of valid GURS full addresses from the prepared GURS data.
+
+    Args:
+        gurs_df (pd.DataFrame): DataFrame returned by load_gurs_dataframe.
+
+    Returns:
+        set: Set of normalized GURS full addresses.
+    """
+    gurs_address_set = set(normalize_text_series(gurs_df["GURS_FULL_ADDRESS"].dropna()))
     print("GURS_FULL_ADDRESS set created.")
     
     return gurs_address_set
 
+def load_gurs_data(path_to_gurs_RN_csv: str) -> set:
+    """
+    Load GURS RN data from a CSV file and build the set of valid full addresses.
+
+    Args:
+        path_to_gurs_RN_csv (str): Path to the GURS RN CSV file.
+
+    Returns:
+        set: Set of normalized GURS full addresses.
+    """
+    return build_gurs_address_set(load_gurs_dataframe(path_to_gurs_RN_csv))
+
 def validate_full_address(full_address: str, gurs_address_set: set) -> bool:
     """
     Validate the full address against the GURS address set.
@@ -72,12 +124,240 @@ def validate_full_address(full_address: str, gurs_address_set: set) -> bool:
         return False
     return full_address.strip() in gurs_address_set
 
+def hash_addresses(addresses) -> np.ndarray:
+    """
+    Hash normalized addresses to uint64 values with pandas' vectorized string hashing.
+
+    Args:
+        addresses (array-like of str): Normalized addresses.
+
+    Returns:
+        np.ndarray: uint64 hash of every address.
+    """
+    return pd.util.hash_array(np.asarray(addresses, dtype=object))
+
+def build_gurs_address_hashes(gurs_address_set: set) -> dict:
+    """
+    Pre-hash the GURS address set for vectorized validation.
+
+    Args:
+        gurs_address_set (set): Set of normalized GURS addresses, as returned by load_gurs_data.
+
+    Returns:
+        dict: A dictionary with the following keys:
+            - hashes (np.ndarray): Sorted, unique uint64 hashes of the GURS addresses.
+            - addresses (set): The GURS address set, used to confirm hash hits.
+    """
+    return {"hashes": np.unique(hash_addresses(list(gurs_address_set))), "addresses": gurs_address_set}
+
+def validate_full_address_series(full_addresses: pd.Series, gurs_address_hashes: dict) -> pd.Series:
+    """
+    Vectorized version of validate_full_address for a whole Series of full addresses.
+    The column is normalized and hashed in one pass and looked up with np.isin; only
+    the hits are confirmed with an exact match against the GURS address set.
+
+    Args:
+        full_addresses (pd.Series): Series of full addresses to validate.
+        gurs_address_hashes (dict): Hashes built by build_gurs_address_hashes.
+
+    Returns:
+        pd.Series: Boolean Series, True where the full address is valid.
+    """
+    normalized = normalize_text_series(full_addresses)
+    valid = np.isin(hash_addresses(normalized), gurs_address_hashes["hashes"])
+    
+    # Confirm hash hits with an exact match
+    hits = np.flatnonzero(valid)
+    valid[hits] = [address in gurs_address_hashes["addresses"] for address in normalized.iloc[hits]]
+    
+    return pd.Series(valid, index=full_addresses.index, dtype=bool)
+
+def build_gurs_component_index(gurs_df: pd.DataFrame) -> dict:
+    """
+    Build per-component GURS lookup structures from the prepared GURS data.
+    The index holds the valid combinations on every level of the address hierarchy,
+    both as lookup tables for merge joins and as dictionaries of sets for O(1) lookups:
+    postal code -> city names, postal code -> street names and
+    (postal code, street) -> house numbers with suffixes.
+
+    Args:
+        gurs_df (pd.DataFrame): DataFrame returned by load_gurs_dataframe.
+
+    Returns:
+        dict: A dictionary with the following keys:
+            - postal_cities (pd.DataFrame): Unique POSTAL_CODE, POSTAL_CITY pairs.
+            - postal_streets (pd.DataFrame): Unique POSTAL_CODE, STREET pairs.
+            - house_numbers (pd.DataFrame): Unique POSTAL_CODE, STREET, HOUSE_NUMBER triples.
+            - cities (dict): Postal code -> set of city names.
+            - streets (dict): Postal code -> set of street names.
+            - street_house_numbers (dict): (postal code, street) -> set of house numbers.
+    """
+    components_df = pd.DataFrame({
+        "POSTAL_CODE": gurs_df["POSTNI_OKOLIS_SIFRA"].fillna("").astype(str).str.strip(),
+        "POSTAL_CITY": gurs_df["POSTNI_OKOLIS_NAZIV"].fillna("").astype(str).str.strip(),
+        "STREET": gurs_df["ULICA_NAZIV"].fillna("").astype(str).str.strip(),
+        "HOUSE_NUMBER": (
+            gurs_df["HS_STEVILKA"].fillna("").astype(str).str.strip() +
+            gurs_df["HS_DODATEK"].fillna("").astype(str).str.strip().str.upper()
+        ),
+    })
+    
+    postal_cities = components_df[["POSTAL_CODE", "POSTAL_CITY"]].drop_duplicates(ignore_index=True)
+    postal_streets = components_df[["POSTAL_CODE", "STREET"]].drop_duplicates(ignore_index=True)
+    house_numbers = components_df[["POSTAL_CODE", "STREET", "HOUSE_NUMBER"]].drop_duplicates(ignore_index=True)
+    print("GURS component index created.")
+    
+    return {
+        "postal_cities": postal_cities,
+        "postal_streets": postal_streets,
+        "house_numbers": house_numbers,
+        "cities": postal_cities.groupby("POSTAL_CODE")["POSTAL_CITY"].agg(set).to_dict(),
+        "streets": postal_streets.groupby("POSTAL_CODE")["STREET"].agg(set).to_dict(),
+        "street_house_numbers": house_numbers.groupby(["POSTAL_CODE", "STREET"])["HOUSE_NUMBER"].agg(set).to_dict(),
+    }
+
+def validate_address_components(street: str, house_number: str, postal_code: str, city: str, component_index: dict) -> list:
+    """
+    Validate every address component against the GURS component index.
+    The postal code is checked first; if it is unknown the other components cannot be
+    checked. The city and street are checked against the postal code and the house number
+    against the (postal code, street) pair, so a house number is only reported when the
+    street is valid.
+
+    Args:
+        street (str): Street name.
+        house_number (str): House number.
+        postal_code (str): Postal code.
+        city (str): Postal city.
+        component_index (dict): Index built by build_gurs_component_index.
+
+    Returns:
+        list: Names of the invalid components (POSTAL_CODE, POSTAL_CITY, STREET, HOUSE_NUMBER), empty if the address is valid.
+    """
+    street, house_number, postal_code, city = (normalize_text(value) for value in (street, house_number, postal_code, city))
+    
+    if postal_code not in component_index["cities"]:
+        return ["POSTAL_CODE"]
+    
+    invalid_components = []
+    if city not in component_index["cities"][postal_code]:
+        invalid_components.append("POSTAL_CITY")
+    if street not in component_index["streets"].get(postal_code, set()):
+        invalid_components.append("STREET")
+    elif house_number.upper() not in component_index["street_house_numbers"].get((postal_code, street), set()):
+        invalid_components.append("HOUSE_NUMBER")
+    
+    return invalid_components
+
+def validate_address_components_series(streets: pd.Series, house_numbers: pd.Series, postal_codes: pd.Series, cities: pd.Series, component_index: dict) -> pd.Series:
+    """
+    Vectorized version of validate_address_components for whole columns.
+    Every component is checked with a left merge join against the lookup tables
+    of the GURS component index instead of a row-wise apply.
+
+    Args:
+        streets (pd.Series): Series of street names.
+        house_numbers (pd.Series): Series of house numbers, aligned with streets.
+        postal_codes (pd.Series): Series of postal codes, aligned with streets.
+        cities (pd.Series): Series of postal cities, aligned with streets.
+        component_index (dict): Index built by build_gurs_component_index.
+
+    Returns:
+        pd.Series: Series of lists with the names of the invalid components, aligned with streets.
+    """
+    address_df = pd.DataFrame({
+        "POSTAL_CODE": normalize_text_series(postal_codes).to_numpy(dtype=object),
+        "POSTAL_CITY": normalize_text_series(cities).to_numpy(dtype=object),
+        "STREET": normalize_text_series(streets).to_numpy(dtype=object),
+        "HOUSE_NUMBER": normalize_text_series(house_numbers).str.upper().to_numpy(dtype=object),
+    })
+    
+    def found(table):
+        # Lookup tables have unique keys, so the left merge keeps the row order and count
+        matches = address_df[list(table.columns)].merge(table, how="left", on=list(table.columns), indicator=True)
+        return (matches["_merge"] == "both").to_numpy()
+    
+    postal_code_valid = address_df["POSTAL_CODE"].isin(component_index["postal_cities"]["POSTAL_CODE"]).to_numpy()
+    city_valid = found(component_index["postal_cities"])
+    street_valid = found(component_index["postal_streets"])
+    house_number_valid = found(component_index["house_numbers"])
+    
+    invalid_components = [
+        ["POSTAL_CODE"] if not postal_code_ok else
+        [component for component, ok in (("POSTAL_CITY", city_ok), ("STREET", street_ok)) if not ok] +
+        (["HOUSE_NUMBER"] if street_ok and not house_number_ok else [])
+        for postal_code_ok, city_ok, street_ok, house_number_ok
+        in zip(postal_code_valid, city_valid, street_valid, house_number_valid)
+    ]
+    
+    return pd.Series(invalid_components, index=streets.index, dtype=object)
+
+def build_postal_city_mapping(gurs_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build the postal code -> city mapping from the prepared GURS data.
+    City names are already cleaned of the bilingual part by load_gurs_dataframe.
+
+    Args:
+        gurs_df (pd.DataFrame): DataFrame returned by load_gurs_dataframe.
+
+    Returns:
+        pd.DataFrame: One row per postal code with the following columns:
+            - POSTAL_CODE (str): Postal code.
+            - GURS_POSTAL_CITY (str): The most common city name of the postal code.
+            - GURS_POSTAL_CITIES (tuple): All city names of the postal code.
+    """
+    postal_cities = pd.DataFrame({
+        "POSTAL_CODE": gurs_df["POSTNI_OKOLIS_SIFRA"].fillna("").astype(str).str.strip(),
+        "POSTAL_CITY": gurs_df["POSTNI_OKOLIS_NAZIV"].fillna("").astype(str).str.strip(),
+    })
+    counts = (postal_cities.value_counts(["POSTAL_CODE", "POSTAL_CITY"], sort=True)
+              .reset_index(name="COUNT")
+              .sort_values(["POSTAL_CODE", "COUNT"], ascending=[True, False], kind="stable"))
+    
+    return (counts.groupby("POSTAL_CODE", sort=True)["POSTAL_CITY"]
+            .agg(GURS_POSTAL_CITY="first", GURS_POSTAL_CITIES=tuple)
+            .reset_index())
+
+def validate_postal_city_series(postal_codes: pd.Series, cities: pd.Series, postal_city_mapping: pd.DataFrame) -> pd.DataFrame:
+    """
+    Check postal codes and cities against GURS with a single merge join.
+
+    Args:
+        postal_codes (pd.Series): Series of postal codes.
+        cities (pd.Series): Series of postal cities, aligned with postal_codes.
+        postal_city_mapping (pd.DataFrame): Mapping returned by build_postal_city_mapping.
+
+    Returns:
+        pd.DataFrame: A DataFrame with the same index as postal_codes and the following columns:
+            - postal_code_exists (bool): True if the postal code exists in GURS.
+            - city_matches (bool): True if the city is one of the GURS cities of the postal code.
+            - gurs_city (str or None): The GURS city of the postal code, usable as a fill for missing cities (4401).
+    """
+    address_df = pd.DataFrame({
+        "POSTAL_CODE": normalize_text_series(postal_codes).to_numpy(dtype=object),
+        "POSTAL_CITY": normalize_text_series(cities).to_numpy(dtype=object),
+    })
+    # The mapping has one row per postal code, so the left merge keeps the row order and count
+    matches = address_df.merge(postal_city_mapping, how="left", on="POSTAL_CODE", indicator=True)
+    
+    postal_code_exists = (matches["_merge"] == "both").to_numpy()
+    city_matches = [
+        exists and city in gurs_cities
+        for exists, city, gurs_cities in zip(postal_code_exists, matches["POSTAL_CITY"], matches["GURS_POSTAL_CITIES"])
+    ]
+    
+    return pd.DataFrame({
+        "postal_code_exists": postal_code_exists,
+        "city_matches": city_matches,
+        "gurs_city": matches["GURS_POSTAL_CITY"].astype(object).where(postal_code_exists, None).to_numpy(),
+    }, index=postal_codes.index)
+
 if __name__ == "__main__":
     customer_data = "src/processed_data/customer_data_with_errors.xlsx"
-    df = pd.read_excel(customer_data)
+    df = read_data(customer_data)
 
     for col in ["STREET", "HOUSE_NUMBER", "POSTAL_CODE", "POSTAL_CITY"]:
-        df[col] = df[col].apply(normalize_text)
+        df[col] = normalize_text_series(df[col])
 
     df["FULL_ADDRESS"] = (
         df["STREET"] + " " +
@@ -85,7 +365,7 @@ if __name__ == "__main__":
         df["POSTAL_CODE"] + " " +
         df["POSTAL_CITY"]
     )
-    df["FULL_ADDRESS"] = df["FULL_ADDRESS"].apply(normalize_text)
+    df["FULL_ADDRESS"] = normalize_text_series(df["FULL_ADDRESS"])
     
     # Load GURS data ONCE
     gurs_address_set = load_gurs_data("src/raw_data/RN_SLO_NASLOVI_register_naslovov_20240929.csv")
@@ -101,4 +381,4 @@ if __name__ == "__main__":
 
     print(df.head(10))
     print("Address validation complete.")
-    df.to_excel("src/processed_data/01_validated_address.xlsx", index=False)
+    write_data(df, "src/processed_data/01_validated_address.xlsx")
@@ -1,5 +1,8 @@
 import pandas as pd
 import regex as re
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from utils.data_io import read_data, write_data
 
 def validate_email(email) -> bool:
     """
@@ -23,7 +26,7 @@ def validate_email(email) -> bool:
 if __name__ == "__main__":
     # Load customer data
     customer_data = "src/processed_data/customer_data_with_errors.xlsx"
-    df = pd.read_excel(customer_data)
+    df = read_data(customer_data)
 
     # Validate emails
     df["EMAIL_VALID"] = df["EMAIL"].apply(validate_email)
@@ -35,5 +38,5 @@ if __name__ == "__main__":
     df = df[columns_to_keep]
     
     # Save updated file
-    df.to_excel("src/processed_data/01_validated_email.xlsx", index=False)
+    write_data(df, "src/processed_data/01_validated_email.xlsx")
     print("Email validation completed successfully.")
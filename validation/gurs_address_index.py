@@ -0,0 +1,204 @@
+import os
+import numpy as np
+import pandas as pd
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from validation.address_validation import normalize_text
+
+GURS_ADDRESS_INDEX_DIR = "src/cache/gurs_address_index"
+
+def address_prefix(key: bytes) -> int:
+    """
+    Return the first 8 bytes of an encoded address as a big-endian integer.
+    Prefixes sort in the same order as the encoded addresses.
+
+    Args:
+        key (bytes): UTF-8 encoded address.
+
+    Returns:
+        int: The prefix, zero-padded for addresses shorter than 8 bytes.
+    """
+    return int.from_bytes(key[:8].ljust(8, b"\0"), "big")
+
+def build_gurs_address_index(addresses) -> dict:
+    """
+    Build a compact, read-only index of GURS full addresses.
+
+    The addresses are sorted by their UTF-8 bytes and stored as one concatenated
+    byte buffer plus an offsets array, instead of a set of Python strings. A uint64
+    array with the first 8 bytes of every address narrows a lookup to a few entries
+    with np.searchsorted, the rest is a binary search over the buffer.
+
+    Args:
+        addresses (iterable of str): Normalized GURS full addresses, e.g. the set returned by load_gurs_data.
+
+    Returns:
+        dict: A dictionary with the following keys:
+            - buffer (np.ndarray): uint8 array with all addresses concatenated.
+            - offsets (np.ndarray): int64 array of length n + 1, address i is buffer[offsets[i]:offsets[i + 1]].
+            - prefixes (np.ndarray): uint64 array with the first 8 bytes of every address.
+    """
+    encoded = sorted({str(address).encode("utf-8") for address in addresses if not pd.isna(address)})
+    lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    buffer = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    prefixes = np.fromiter(map(address_prefix, encoded), dtype=np.uint64, count=len(encoded))
+    return {"buffer": buffer, "offsets": offsets, "prefixes": prefixes}
+
+def save_gurs_address_index(index: dict, directory: str = GURS_ADDRESS_INDEX_DIR):
+    """
+    Save the GURS address index to disk as raw numpy files.
+
+    Args:
+        index (dict): Index built by build_gurs_address_index.
+        directory (str): Directory to write buffer.npy, offsets.npy and prefixes.npy to.
+    """
+    os.makedirs(directory, exist_ok=True)
+    for name in ("buffer", "offsets", "prefixes"):
+        np.save(os.path.join(directory, f"{name}.npy"), index[name])
+
+def load_gurs_address_index(directory: str = GURS_ADDRESS_INDEX_DIR) -> dict:
+    """
+    Load the GURS address index from disk as memory-mapped arrays, without reading it into memory.
+
+    Args:
+        directory (str): Directory written by save_gurs_address_index.
+
+    Returns:
+        dict: Index with memory-mapped "buffer", "offsets" and "prefixes" arrays.
+    """
+    # Plain ndarray views of the memory maps are still backed by the files but are cheaper to slice
+    return {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r").view(np.ndarray)
+            for name in ("buffer", "offsets", "prefixes")}
+
+def gurs_address_index_size(index: dict) -> int:
+    """
+    Return the number of addresses in the index.
+
+    Args:
+        index (dict): Index built by build_gurs_address_index.
+
+    Returns:
+        int: Number of addresses.
+    """
+    return len(index["offsets"]) - 1
+
+def search_address(key: bytes, index: dict, low: int, high: int) -> bool:
+    """
+    Binary search for an encoded address between positions low and high of the index.
+
+    Args:
+        key (bytes): UTF-8 encoded, normalized address.
+        index (dict): Index built by build_gurs_address_index.
+        low (int): First position to search.
+        high (int): Position after the last one to search.
+
+    Returns:
+        bool: True if the address is in the index.
+    """
+    buffer, offsets = index["buffer"], index["offsets"]
+    end = high
+    while low < high:
+        middle = (low + high) // 2
+        if buffer[offsets[middle]:offsets[middle + 1]].tobytes() < key:
+            low = middle + 1
+        else:
+            high = middle
+    return low < end and buffer[offsets[low]:offsets[low + 1]].tobytes() == key
+
+def validate_full_address_in_index(full_address: str, index: dict) -> bool:
+    """
+    Validate the full address against the compact GURS address index.
+    Drop-in replacement for validate_full_address with the index instead of the set.
+
+    Args:
+        full_address (str): Full address to validate.
+        index (dict): Index built by build_gurs_address_index or loaded by load_gurs_address_index.
+
+    Returns:
+        bool: True if the full address is valid, False otherwise.
+    """
+    if pd.isna(full_address):
+        return False
+    key = normalize_text(full_address).encode("utf-8")
+    prefix = np.uint64(address_prefix(key))
+    low = int(np.searchsorted(index["prefixes"], prefix, side="left"))
+    high = int(np.searchsorted(index["prefixes"], prefix, side="right"))
+    return search_address(key, index, low, high)
+
+def validate_full_addresses_in_index(full_addresses: pd.Series, index: dict) -> pd.Series:
+    """
+    Validate a whole Series of full addresses against the compact GURS address index.
+    The prefix search runs once for the whole column.
+
+    Args:
+        full_addresses (pd.Series): Series of full addresses.
+        index (dict): Index built by build_gurs_address_index or loaded by load_gurs_address_index.
+
+    Returns:
+        pd.Series: Boolean Series, True where the full address is valid.
+    """
+    keys = [normalize_text(address).encode("utf-8") for address in full_addresses]
+    prefixes = np.fromiter(map(address_prefix, keys), dtype=np.uint64, count=len(keys))
+    lows = np.searchsorted(index["prefixes"], prefixes, side="left")
+    highs = np.searchsorted(index["prefixes"], prefixes, side="right")
+    valid = [
+        not pd.isna(address) and search_address(key, index, int(low), int(high))
+        for address, key, low, high in zip(full_addresses, keys, lows, highs)
+    ]
+    return pd.Series(valid, index=full_addresses.index, dtype=bool)
+
+if __name__ == "__main__":
+
+    import time
+    import tracemalloc
+    from validation.address_validation import load_gurs_data, validate_full_address
+
+    # Benchmark the compact index against the set of strings
+    gurs_path = "src/raw_data/RN_SLO_NASLOVI_register_naslovov_20240929.csv"
+    if os.path.exists(gurs_path):
+        gurs_address_set = load_gurs_data(gurs_path)
+    else:
+        rng = np.random.default_rng(42)
+        gurs_address_set = {f"Ulica {street} {number}, {1000 + street % 8000} Kraj {street % 500}"
+                            for street, number in zip(rng.integers(0, 50000, 600000), rng.integers(1, 200, 600000))}
+    addresses = list(gurs_address_set)
+    print(f"Addresses: {len(addresses)}")
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    address_set = set(addresses)
+    set_build = time.perf_counter() - start
+    set_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    set_memory += sum(map(sys.getsizeof, addresses))
+
+    start = time.perf_counter()
+    index = build_gurs_address_index(addresses)
+    index_build = time.perf_counter() - start
+    index_memory = index["buffer"].nbytes + index["offsets"].nbytes + index["prefixes"].nbytes
+
+    save_gurs_address_index(index)
+    start = time.perf_counter()
+    index = load_gurs_address_index()
+    index_load = time.perf_counter() - start
+
+    queries = addresses[:50000] + [address + "X" for address in addresses[:50000]]
+
+    start = time.perf_counter()
+    set_hits = sum(validate_full_address(address, address_set) for address in queries)
+    set_lookup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index_hits = sum(validate_full_address_in_index(address, index) for address in queries)
+    index_lookup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch_hits = validate_full_addresses_in_index(pd.Series(queries), index).sum()
+    batch_lookup = time.perf_counter() - start
+
+    assert set_hits == index_hits == batch_hits
+    print(f"set:   {set_memory / 1e6:8.1f} MB, build {set_build:6.2f}s, {len(queries) / set_lookup:12.0f} lookups/s")
+    print(f"index: {index_memory / 1e6:8.1f} MB, build {index_build:6.2f}s (memmap load {index_load * 1e3:.1f} ms), "
+          f"{len(queries) / index_lookup:12.0f} lookups/s ({len(queries) / batch_lookup:.0f} lookups/s in batch)")
@@ -1,5 +1,8 @@
 import pandas as pd
-import requests
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from utils.data_io import read_data, write_data
+from utils.surs_client import fetch_surs_data
 
 def fetch_SURS_data():
     """
@@ -13,62 +16,7 @@ def fetch_SURS_data():
         - all_names : DataFrame containing first names and their frequencies.
         - all_surnames : DataFrame containing last names and their frequencies.
     """
-    
-    query = {
-    "query": [
-        {"code": "MERITVE", "selection": {"filter": "item", "values": ["1"]}},
-        {"code": "LETO", "selection": {"filter": "item", "values": ["2024"]}}
-    ],
-    "response": {"format": "json-stat"}
-    }
-    
-    def fetch_data(url, key):
-        response = requests.post(url, json=query)
-        if response.status_code == 200:
-            data = response.json()
-            # Extract dimensions and values
-            category = data['dataset']['dimension'][key]['category']
-            labels = category['label']  # Extract names or surnames
-            values = data['dataset']['value']  # Extract counts
-            # Create a DataFrame
-            df = pd.DataFrame({
-                "value": list(labels.values()),
-                "count": values
-            })
-            return df[["value", "count"]]
-        else:
-            print(f"Failed to fetch data from {url}. Status code: {response.status_code}")
-            return pd.DataFrame()
-
-    # Combine all dataframes into one and calculate frequencies
-    def calculate_frequencies(df):
-        # Calculate total count
-        total_count = df["count"].sum()
-        # Calculate frequencies
-        df["frequency"] = df.apply(
-            lambda row: row["count"] / total_count if not pd.isna(row["count"]) else 0,
-            axis=1)
-        return df
-
-    # Fetch and combine male and female names
-    name_urls = {
-        "female": "https://pxweb.stat.si/SiStatData/api/v1/sl/Data/05X1010S.px",
-        "male": "https://pxweb.stat.si/SiStatData/api/v1/sl/Data/05X1005S.px"}
-    female_names = fetch_data(name_urls["female"], key="IME")
-    male_names = fetch_data(name_urls["male"], key="IME")
-    all_names = pd.concat([female_names, male_names], ignore_index=True)
-    
-    surname_urls = [
-        "https://pxweb.stat.si:443/SiStatData/api/v1/sl/Data/05X1015S.px",
-        "https://pxweb.stat.si:443/SiStatData/api/v1/sl/Data/05X1016S.px",
-        "https://pxweb.stat.si:443/SiStatData/api/v1/sl/Data/05X1017S.px",
-        "https://pxweb.stat.si:443/SiStatData/api/v1/sl/Data/05X1018S.px"]
-    surname_dataframes = [fetch_data(url, key="PRIIMEK") for url in surname_urls]
-    all_surnames = pd.concat(surname_dataframes, ignore_index=True)
-
-    # Calculate frequencies for names and surnames
-    all_names = calculate_frequencies(all_names)
-    all_surnames = calculate_frequencies(all_surnames)
+    all_names, all_surnames = fetch_surs_data()
     
     print("SURS data extracted")
     return all_names, all_surnames
@@ -123,7 +71,7 @@ if __name__ == "__main__":
     customer_data = "src/processed_data/customer_data_with_errors.xlsx"
     # customer_data = "src/processed_data/04_pipeline_names_4.xlsx"
     
-    df = pd.read_excel(customer_data)
+    df = read_data(customer_data)
 
     # Apply validation and expand results into two new columns
     df["FIRST_NAME_VALID"] = df.apply(
@@ -141,6 +89,6 @@ if __name__ == "__main__":
     #     ),
     #     axis=1)
     
-    df.to_excel("src/processed_data/01_validated_names_test2.xlsx", index=False)
+    write_data(df, "src/processed_data/01_validated_names_test2.xlsx")
 
     # df.to_excel("src/processed_data/01_validated_names_test.xlsx", index=False)
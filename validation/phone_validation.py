@@ -1,5 +1,8 @@
 import re
 import pandas as pd
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from utils.data_io import read_data, write_data
 
 
 def validate_phone(phone: str) -> bool:
@@ -19,9 +22,26 @@ def validate_phone(phone: str) -> bool:
     # Match format: 00386 followed by 7 or 8 digits
     return bool(re.fullmatch(r"00386\d{8}", phone))
 
+def validate_phone_series(phones: pd.Series) -> pd.Series:
+    """
+    Vectorized version of validate_phone for a whole Series of phone numbers.
+    Non-string and empty values are considered invalid.
+    Args:
+        phones (pd.Series): Series of phone numbers to validate.
+    Returns:
+        pd.Series: Boolean Series, True where the phone number is valid.
+    """
+    phones = phones.astype(object)
+    is_string = phones.map(lambda phone: isinstance(phone, str)).astype(bool)
+    if not is_string.any():
+        # All-missing or numeric columns: .str is not available and nothing can be valid
+        return pd.Series(False, index=phones.index)
+    valid = phones.where(is_string).str.fullmatch(r"00386\d{8}")
+    return valid.eq(True) & is_string
+
 if __name__ == "__main__":
     
-    df = pd.read_excel("src/processed_data/customer_data_with_errors.xlsx")
+    df = read_data("src/processed_data/customer_data_with_errors.xlsx")
     
     # Validate phone numbers
     df["PHONE_NUMBER_VALID"] = df["PHONE_NUMBER"].apply(validate_phone)
@@ -32,5 +52,5 @@ if __name__ == "__main__":
     ]
     df = df[columns_to_keep]
 
-    df.to_excel("src/processed_data/01_validated_phone.xlsx", index=False)
+    write_data(df, "src/processed_data/01_validated_phone.xlsx")
     print("Phone number validation complete.")